@@ -8,10 +8,22 @@ management. Run with:
 
 from __future__ import annotations
 
-import random
+import json
+
+import aiohttp
 
 from loadforge import HttpClient, scenario, setup, task, teardown
 
+_MAX_ITEM_ID = 500
+# Item paths are formatted once at import instead of per request.
+_ITEM_PATHS = tuple(f"/items/{i}" for i in range(1, _MAX_ITEM_ID + 1))
+
+# The login payload is identical for every virtual user, so it is encoded
+# once here instead of being re-serialised by ``json=`` on each login.
+_LOGIN_BODY = json.dumps(
+    {"email": "test@example.com", "password": "test-password-12345"},
+).encode("utf-8")
+
 
 @scenario(
     name="Auth Flow Load Test",
@@ -26,9 +38,12 @@ class AuthFlowScenario:
         """Log in and store the auth token for this virtual user."""
         resp = await client.post(
             "/auth/login",
-            json={"email": "test@example.com", "password": "test-password-12345"},  # noqa: S106
+            data=aiohttp.BytesPayload(_LOGIN_BODY, content_type="application/json"),
             name="Login",
         )
+        # Reading the body releases the keep-alive connection back to the
+        # worker's shared pool, so the first task reuses it without a new
+        # TCP/TLS handshake.
         data = await resp.json()
         client.headers["Authorization"] = f"Bearer {data['token']}"
 
@@ -40,15 +55,16 @@ class AuthFlowScenario:
     @task(weight=2)
     async def get_item(self, client: HttpClient) -> None:
         """GET /items/:id — fetch a single item."""
-        item_id = random.randint(1, 500)
-        await client.get(f"/items/{item_id}", name="Get Item")
+        # client.rng is seeded per user from LOADFORGE_SEED when it is set.
+        item_id = client.rng.randint(1, _MAX_ITEM_ID)
+        await client.get(_ITEM_PATHS[item_id - 1], name="Get Item")
 
     @task(weight=1)
     async def create_item(self, client: HttpClient) -> None:
         """POST /items — create a new item."""
         await client.post(
             "/items",
-            json={"name": f"Item-{random.randint(1, 10000)}"},
+            json={"name": f"Item-{client.rng.randint(1, 10000)}"},
             name="Create Item",
         )
 
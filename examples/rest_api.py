@@ -11,10 +11,12 @@ Or with a ramp pattern:
 
 from __future__ import annotations
 
-import random
-
 from loadforge import HttpClient, scenario, task
 
+_MAX_ITEM_ID = 1000
+# Item paths are formatted once at import instead of per request.
+_ITEM_PATHS = tuple(f"/items/{i}" for i in range(1, _MAX_ITEM_ID + 1))
+
 
 @scenario(
     name="REST API Load Test",
@@ -32,14 +34,15 @@ class RestApiScenario:
     @task(weight=3)
     async def get_item(self, client: HttpClient) -> None:
         """GET /items/:id — second most common."""
-        item_id = random.randint(1, 1000)
-        await client.get(f"/items/{item_id}", name="Get Item")
+        # client.rng is seeded per user from LOADFORGE_SEED when it is set.
+        item_id = client.rng.randint(1, _MAX_ITEM_ID)
+        await client.get(_ITEM_PATHS[item_id - 1], name="Get Item")
 
     @task(weight=1)
     async def create_item(self, client: HttpClient) -> None:
         """POST /items — least common."""
         await client.post(
             "/items",
-            json={"name": f"Item-{random.randint(1, 10000)}"},
+            json={"name": f"Item-{client.rng.randint(1, 10000)}"},
             name="Create Item",
         )
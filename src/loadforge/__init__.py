@@ -2,19 +2,23 @@
 
 from __future__ import annotations
 
-from loadforge.dsl.decorators import scenario, setup, task, teardown
-from loadforge.dsl.http_client import HttpClient, RequestMetric
-from loadforge.engine.runner import LoadTestRunner
-from loadforge.engine.worker import run_worker
-from loadforge.metrics.models import EndpointMetrics, MetricSnapshot, TestResult
-from loadforge.patterns.base import LoadPattern
-from loadforge.patterns.composite import CompositePattern
-from loadforge.patterns.constant import ConstantPattern
-from loadforge.patterns.diurnal import DiurnalPattern
-from loadforge.patterns.ramp import RampPattern
-from loadforge.patterns.spike import SpikePattern
-from loadforge.patterns.step import StepPattern
-from loadforge.reports import ReportGenerator, export_csv, export_html, export_json
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from loadforge.dsl.decorators import scenario, setup, task, teardown
+    from loadforge.dsl.http_client import HttpClient, RequestMetric
+    from loadforge.engine.runner import LoadTestRunner
+    from loadforge.engine.worker import run_worker
+    from loadforge.metrics.models import EndpointMetrics, MetricSnapshot, TestResult
+    from loadforge.patterns.base import LoadPattern
+    from loadforge.patterns.composite import CompositePattern
+    from loadforge.patterns.constant import ConstantPattern
+    from loadforge.patterns.diurnal import DiurnalPattern
+    from loadforge.patterns.ramp import RampPattern
+    from loadforge.patterns.spike import SpikePattern
+    from loadforge.patterns.step import StepPattern
+    from loadforge.reports import ReportGenerator, export_csv, export_html, export_json
 
 __version__ = "0.1.0"
 
@@ -42,3 +46,58 @@ __all__ = [
     "task",
     "teardown",
 ]
+
+# Public name -> defining module. Submodules are imported on first access
+# (PEP 562) so e.g. ``loadforge --version`` does not load the engine,
+# patterns, or report stack.
+_LAZY_IMPORTS: dict[str, str] = {
+    "CompositePattern": "loadforge.patterns.composite",
+    "ConstantPattern": "loadforge.patterns.constant",
+    "DiurnalPattern": "loadforge.patterns.diurnal",
+    "EndpointMetrics": "loadforge.metrics.models",
+    "HttpClient": "loadforge.dsl.http_client",
+    "LoadPattern": "loadforge.patterns.base",
+    "LoadTestRunner": "loadforge.engine.runner",
+    "MetricSnapshot": "loadforge.metrics.models",
+    "RampPattern": "loadforge.patterns.ramp",
+    "ReportGenerator": "loadforge.reports",
+    "RequestMetric": "loadforge.dsl.http_client",
+    "SpikePattern": "loadforge.patterns.spike",
+    "StepPattern": "loadforge.patterns.step",
+    "TestResult": "loadforge.metrics.models",
+    "export_csv": "loadforge.reports",
+    "export_html": "loadforge.reports",
+    "export_json": "loadforge.reports",
+    "run_worker": "loadforge.engine.worker",
+    "scenario": "loadforge.dsl.decorators",
+    "setup": "loadforge.dsl.decorators",
+    "task": "loadforge.dsl.decorators",
+    "teardown": "loadforge.dsl.decorators",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import a public name from its submodule on first access.
+
+    Args:
+        name: Attribute being looked up on the ``loadforge`` package.
+
+    Returns:
+        The requested public object. It is cached in module globals so
+        later lookups bypass this hook.
+
+    Raises:
+        AttributeError: If ``name`` is not a public LoadForge export.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value: object = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported public names in ``dir(loadforge)``."""
+    return sorted({*globals(), *__all__})
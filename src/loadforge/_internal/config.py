@@ -2,42 +2,68 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Literal
 
 from loadforge._internal.errors import ConfigError
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from loadforge._internal.types import Headers, ThinkTime
 
+# Shared read-only empty headers, reused by every config instance.
+_EMPTY_HEADERS: Headers = MappingProxyType({})
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoadForgeConfig:
     """Global LoadForge configuration.
 
     Attributes:
         default_base_url: Default base URL when none specified in scenario.
-        default_headers: Default HTTP headers for all requests.
+        default_headers: Default HTTP headers for all requests (read-only).
         default_think_time: Default think time range (min, max) in seconds.
-        connection_pool_size: Maximum connections per worker.
+        connection_pool_size: Connection limits per worker as
+            ``(per_host, total)``. None (the default) leaves the pool
+            unlimited, so users never queue for a connection inside the
+            measured request time.
         request_timeout: Default request timeout in seconds.
+        event_loop: Event loop implementation for workers, ``"uvloop"``
+            (falls back to asyncio where unavailable) or ``"asyncio"``.
+        random_seed: Seed for the virtual users' random number generators.
+            None (the default) seeds each user from OS entropy.
     """
 
     default_base_url: str = ""
-    default_headers: Headers = field(default_factory=dict)
+    default_headers: Headers = field(default_factory=lambda: _EMPTY_HEADERS)
     default_think_time: ThinkTime = (0.5, 1.5)
-    connection_pool_size: int = 100
+    connection_pool_size: tuple[int, int] | None = None
     request_timeout: float = 30.0
+    event_loop: Literal["uvloop", "asyncio"] = "uvloop"
+    random_seed: int | None = None
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> LoadForgeConfig:
     """Load configuration from environment variables with defaults.
 
+    The result is cached after the first successful call, since the
+    returned config is immutable. Call ``load_config.cache_clear()`` to
+    force environment variables to be re-read.
+
     Environment variables:
         LOADFORGE_BASE_URL: Default base URL.
-        LOADFORGE_POOL_SIZE: Connection pool size (default: 100).
+        LOADFORGE_POOL_SIZE: Connection pool limits, either ``"N"`` (N
+            connections, per host and in total) or ``"N,M"`` (N per host,
+            M in total). Default: unlimited.
         LOADFORGE_TIMEOUT: Request timeout in seconds (default: 30.0).
+        LOADFORGE_LOOP: Event loop, ``uvloop`` or ``asyncio`` (default: uvloop).
+        LOADFORGE_SEED: Integer seed that makes task picks and think times
+            reproducible across runs (default: unseeded).
 
     Returns:
         Populated LoadForgeConfig instance.
@@ -45,31 +71,124 @@ def load_config() -> LoadForgeConfig:
     Raises:
         ConfigError: If an environment variable has an invalid value.
     """
-    pool_size_str = os.environ.get("LOADFORGE_POOL_SIZE", "100")
-    timeout_str = os.environ.get("LOADFORGE_TIMEOUT", "30.0")
+    return LoadForgeConfig(
+        default_base_url=os.environ.get("LOADFORGE_BASE_URL", ""),
+        # Unset or empty (as in .env.example) means no limit
+        connection_pool_size=_parse_env(
+            "LOADFORGE_POOL_SIZE",
+            _split_pool_size,
+            None,
+            expected="an integer or 'N,M' pair",
+            check=_check_pool_size,
+        ),
+        request_timeout=_parse_env(
+            "LOADFORGE_TIMEOUT",
+            float,
+            30.0,
+            expected="a number",
+            check=lambda v: "positive" if v <= 0 else None,
+        ),
+        event_loop=_parse_env(
+            "LOADFORGE_LOOP",
+            _to_event_loop,
+            "uvloop",
+            expected="'uvloop' or 'asyncio'",
+        ),
+        random_seed=_parse_env("LOADFORGE_SEED", int, None, expected="an integer"),
+    )
 
-    try:
-        pool_size = int(pool_size_str)
-    except ValueError:
-        msg = f"LOADFORGE_POOL_SIZE must be an integer, got: {pool_size_str!r}"
-        raise ConfigError(msg) from None
 
-    if pool_size < 1:
-        msg = f"LOADFORGE_POOL_SIZE must be >= 1, got: {pool_size}"
-        raise ConfigError(msg)
+def _parse_env[T, D](
+    name: str,
+    convert: Callable[[str], T],
+    default: D,
+    *,
+    expected: str,
+    check: Callable[[T], str | None] | None = None,
+) -> T | D:
+    """Read, convert, and validate a single environment variable.
+
+    Args:
+        name: Environment variable name.
+        convert: Converts the raw string; raises ``ValueError`` if malformed.
+        default: Value used when the variable is unset or empty.
+        expected: Description of the accepted format, used in the error
+            message when ``convert`` fails (e.g. ``"a number"``).
+        check: Optional validator returning ``None`` if the converted value
+            is acceptable, or the violated requirement (e.g. ``"positive"``).
+
+    Returns:
+        The converted value, or ``default``.
+
+    Raises:
+        ConfigError: If conversion or validation fails.
+    """
+    raw = os.environ.get(name)
+    if not raw:
+        return default
 
     try:
-        timeout = float(timeout_str)
+        value = convert(raw)
     except ValueError:
-        msg = f"LOADFORGE_TIMEOUT must be a number, got: {timeout_str!r}"
+        msg = f"{name} must be {expected}, got: {raw!r}"
         raise ConfigError(msg) from None
 
-    if timeout <= 0:
-        msg = f"LOADFORGE_TIMEOUT must be positive, got: {timeout}"
+    problem = check(value) if check is not None else None
+    if problem is not None:
+        msg = f"{name} must be {problem}, got: {raw!r}"
         raise ConfigError(msg)
 
-    return LoadForgeConfig(
-        default_base_url=os.environ.get("LOADFORGE_BASE_URL", ""),
-        connection_pool_size=pool_size,
-        request_timeout=timeout,
-    )
+    return value
+
+
+def _split_pool_size(value: str) -> tuple[int, int]:
+    """Split ``LOADFORGE_POOL_SIZE`` ``"N"`` or ``"N,M"`` into limits.
+
+    Args:
+        value: Raw environment variable value.
+
+    Returns:
+        Tuple of (per-host limit, total limit). ``"N"`` means N for both.
+
+    Raises:
+        ValueError: If either part is not an integer.
+    """
+    per_host_str, sep, total_str = value.partition(",")
+    per_host = int(per_host_str)
+    return per_host, int(total_str) if sep else per_host
+
+
+def _check_pool_size(pool_size: tuple[int, int]) -> str | None:
+    """Validate a ``(per_host, total)`` pool size pair.
+
+    Args:
+        pool_size: Parsed (per-host limit, total limit).
+
+    Returns:
+        None if valid, otherwise the violated requirement.
+    """
+    per_host, total = pool_size
+    if per_host < 1 or total < 1:
+        return ">= 1"
+    if per_host > total:
+        return "a per-host limit <= the total"
+    return None
+
+
+def _to_event_loop(value: str) -> Literal["uvloop", "asyncio"]:
+    """Convert a ``LOADFORGE_LOOP`` value to an event loop name.
+
+    Args:
+        value: Raw environment variable value.
+
+    Returns:
+        ``"uvloop"`` or ``"asyncio"``.
+
+    Raises:
+        ValueError: If the value is neither.
+    """
+    if value == "uvloop":
+        return "uvloop"
+    if value == "asyncio":
+        return "asyncio"
+    raise ValueError(value)
@@ -2,16 +2,110 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import sys
-from datetime import UTC, datetime
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Single-slot cache of (whole_second, "YYYY-MM-DDTHH:MM:SS") so consecutive
+# records within the same second skip ``time.gmtime``.
+_last_second: tuple[int, str] = (-1, "")
+
+
+def _format_timestamp(created: float) -> str:
+    """Format a POSIX timestamp as an ISO 8601 UTC string.
+
+    Equivalent to ``datetime.fromtimestamp(created, tz=UTC).isoformat()``
+    (always including the microsecond field), but avoids building a ``datetime``
+    per log record.
+
+    Args:
+        created: Seconds since the epoch (``LogRecord.created``).
+
+    Returns:
+        Timestamp in ``YYYY-MM-DDTHH:MM:SS.ffffff+00:00`` form.
+    """
+    global _last_second
+    second = int(created)
+    micros = round((created - second) * 1_000_000)
+    if micros >= 1_000_000:
+        second += 1
+        micros -= 1_000_000
+    cached_second, prefix = _last_second
+    if second != cached_second:
+        tm = time.gmtime(second)
+        prefix = "%04d-%02d-%02dT%02d:%02d:%02d" % (  # noqa: UP031
+            tm.tm_year,
+            tm.tm_mon,
+            tm.tm_mday,
+            tm.tm_hour,
+            tm.tm_min,
+            tm.tm_sec,
+        )
+        _last_second = (second, prefix)
+    return f"{prefix}.{micros:06d}+00:00"
+
+
+def _stdlib_dumps(entry: dict[str, str]) -> str:
+    """Serialise a log entry with the stdlib, in the same form as ``orjson``.
+
+    Compact separators and raw UTF-8 instead of ASCII escapes make the
+    output byte-identical to ``orjson.dumps``, so log consumers see the
+    same records whether or not ``orjson`` is installed.
+
+    Args:
+        entry: Log entry to serialise.
+
+    Returns:
+        The entry as a one-line JSON string.
+    """
+    return json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+
+
+def _select_json_dumps() -> Callable[[dict[str, str]], str]:
+    """Pick the fastest available JSON serialiser for log entries.
+
+    Uses ``orjson`` when it is installed and falls back to
+    ``_stdlib_dumps`` otherwise.
+
+    Returns:
+        A function that serialises a log entry dict to a JSON string.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return _stdlib_dumps
+
+    def _orjson_dumps(entry: dict[str, str]) -> str:
+        try:
+            return str(orjson.dumps(entry), "utf-8")
+        except orjson.JSONEncodeError:
+            # orjson rejects lone surrogates (e.g. from os.fsdecode paths),
+            # which the stdlib serialises; dropping the record would be worse.
+            return _stdlib_dumps(entry)
+
+    return _orjson_dumps
+
+
+_json_dumps = _select_json_dumps()
+
+_logger = logging.getLogger("loadforge")
+# Level last applied to the ``loadforge`` handlers by ``setup_logging``.
+_configured_level: int | None = None
 
 
 class _JsonFormatter(logging.Formatter):
     """Structured JSON log formatter.
 
     Emits one-line JSON objects with keys: timestamp, level, logger, message.
+    ``format`` is fully overridden, so none of the base class's ``style`` /
+    ``datefmt`` machinery runs per record; subclassing only satisfies the
+    ``Handler.setFormatter`` contract and supplies ``formatException``.
     """
 
     def format(self, record: logging.LogRecord) -> str:
@@ -23,15 +117,22 @@ class _JsonFormatter(logging.Formatter):
         Returns:
             A single-line JSON string.
         """
+        # Skip the ``msg % args`` pass when there is nothing to interpolate
+        msg = record.msg
+        message = msg if not record.args and isinstance(msg, str) else record.getMessage()
         log_entry = {
-            "timestamp": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
+            "timestamp": _format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            "message": message,
         }
-        if record.exc_info and record.exc_info[1] is not None:
-            log_entry["exception"] = self.formatException(record.exc_info)
-        return json.dumps(log_entry)
+        exc_info = record.exc_info
+        if exc_info and exc_info[1] is not None:
+            # Cache the traceback text on the record, as Formatter.format does
+            if not record.exc_text:
+                record.exc_text = self.formatException(exc_info)
+            log_entry["exception"] = record.exc_text
+        return _json_dumps(log_entry)
 
 
 def setup_logging(
@@ -52,13 +153,16 @@ def setup_logging(
     Returns:
         The configured ``loadforge`` root logger.
     """
-    logger = logging.getLogger("loadforge")
+    global _configured_level
+    logger = _logger
     logger.setLevel(level)
 
-    # Idempotent: update existing handler levels and return early
+    # Idempotent: update existing handler levels (only if changed) and return early
     if logger.handlers:
-        for handler in logger.handlers:
-            handler.setLevel(level)
+        if level != _configured_level:
+            for handler in logger.handlers:
+                handler.setLevel(level)
+            _configured_level = level
         return logger
 
     handler = logging.StreamHandler(sys.stderr)
@@ -77,13 +181,18 @@ def setup_logging(
 
     # Prevent propagation to root logger to avoid duplicate output
     logger.propagate = False
+    _configured_level = level
 
     return logger
 
 
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str) -> logging.Logger:
     """Return a child logger under the ``loadforge`` namespace.
 
+    Results are cached per name, so repeated calls skip the name
+    formatting and ``logging.getLogger`` lookup.
+
     Args:
         name: Logger name, appended to ``loadforge.`` prefix.
             Example: ``get_logger("engine.worker")`` returns
@@ -0,0 +1,41 @@
+"""Event loop selection for LoadForge worker processes."""
+
+from __future__ import annotations
+
+import sys
+
+from loadforge._internal.config import load_config
+from loadforge._internal.logging import get_logger
+
+logger = get_logger("runtime")
+
+
+def install_event_loop() -> str:
+    """Install the configured event loop policy for this process.
+
+    Reads ``LoadForgeConfig.event_loop`` (``LOADFORGE_LOOP``). With
+    ``"uvloop"`` (the default), installs uvloop's libuv-backed loop, falling
+    back silently to the default asyncio loop on Windows or when uvloop is
+    not installed. With ``"asyncio"``, leaves the default loop in place.
+
+    Must be called before ``asyncio.run()``.
+
+    Returns:
+        Name of the event loop in effect: ``"uvloop"`` or ``"asyncio"``.
+
+    Raises:
+        ConfigError: If ``LOADFORGE_LOOP`` has an invalid value.
+    """
+    if load_config().event_loop != "uvloop" or sys.platform == "win32":
+        return "asyncio"
+
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        logger.debug("uvloop not available, using default asyncio event loop")
+        return "asyncio"
+
+    logger.debug("uvloop installed as event loop policy")
+    return "uvloop"
@@ -1,9 +1,55 @@
-"""Shared type aliases for LoadForge."""
+"""Shared type aliases and small value types for LoadForge."""
 
 from __future__ import annotations
 
-# HTTP headers dictionary.
-Headers = dict[str, str]
+import random
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+# Read-only HTTP headers mapping.
+Headers = Mapping[str, str]
 
 # Think time range (min_seconds, max_seconds).
 ThinkTime = tuple[float, float]
+
+
+@dataclass(frozen=True, slots=True)
+class ThinkTimeSampler:
+    """Precomputed uniform sampler for a think time range.
+
+    Stores the range as ``(tmin, width)`` so each sample is a single
+    multiply-add on ``random()`` instead of a ``random.uniform`` call
+    plus tuple unpacking.
+
+    Attributes:
+        tmin: Lower bound of the range in seconds.
+        width: Range width (``max - min``) in seconds.
+    """
+
+    tmin: float
+    width: float
+
+    @classmethod
+    def from_range(cls, think_time: ThinkTime) -> ThinkTimeSampler:
+        """Build a sampler from a ``(min, max)`` think time tuple.
+
+        Args:
+            think_time: Think time range (min_seconds, max_seconds).
+
+        Returns:
+            A sampler drawing uniformly from the range.
+        """
+        tmin, tmax = think_time
+        return cls(tmin=tmin, width=tmax - tmin)
+
+    def sample(self, rng: Callable[[], float] = random.random) -> float:
+        """Draw a think time in seconds.
+
+        Args:
+            rng: Source of uniform floats in ``[0.0, 1.0)``. Defaults to
+                the global ``random.random``.
+
+        Returns:
+            A think time uniformly distributed over the range.
+        """
+        return self.tmin + rng() * self.width
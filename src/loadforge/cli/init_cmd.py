@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from string import Template
 
@@ -10,6 +11,11 @@ from rich.console import Console
 
 console = Console(stderr=True)
 
+# Maps every ASCII character that is not alphanumeric or "_" to "_".
+_SAFE_TABLE = {c: "_" for c in range(128) if not (chr(c).isalnum() or chr(c) == "_")}
+# Same rule for non-ASCII input: ``\W`` is "not alphanumeric and not _".
+_NON_WORD_RE = re.compile(r"\W")
+
 _SCENARIO_TEMPLATE = Template('''\
 """Load test scenario — $name.
 
@@ -37,6 +43,42 @@ class $class_name:
 ''')
 
 
+def _compile_template(template: Template) -> tuple[tuple[str, str | None], ...]:
+    """Split a ``string.Template`` into literal and placeholder parts.
+
+    Parsing once at import time means rendering is a plain join with no
+    regex scan per call.
+
+    Args:
+        template: Template using ``$name`` / ``${name}`` placeholders.
+
+    Returns:
+        Tuple of ``(text, key)`` parts. ``key`` is None for literal text,
+        otherwise ``text`` is empty and ``key`` names the substitution.
+
+    Raises:
+        ValueError: If the template contains an invalid placeholder.
+    """
+    parts: list[tuple[str, str | None]] = []
+    pos = 0
+    for match in template.pattern.finditer(template.template):
+        parts.append((template.template[pos : match.start()], None))
+        if match.group("escaped") is not None:
+            parts.append((template.delimiter, None))
+        else:
+            key = match.group("named") or match.group("braced")
+            if key is None:
+                msg = f"Invalid placeholder in template at index {match.start()}"
+                raise ValueError(msg)
+            parts.append(("", key))
+        pos = match.end()
+    parts.append((template.template[pos:], None))
+    return tuple((text, key) for text, key in parts if text or key is not None)
+
+
+_TEMPLATE_PARTS = _compile_template(_SCENARIO_TEMPLATE)
+
+
 def init_cmd(
     name: str = typer.Argument(
         "my_scenario",
@@ -45,7 +87,10 @@ def init_cmd(
 ) -> None:
     """Scaffold a new scenario file in the current directory."""
     # Sanitise the name for use as a Python identifier
-    safe_name = "".join(c if c.isalnum() or c == "_" else "_" for c in name).lower()
+    safe_name = name.translate(_SAFE_TABLE)
+    if not safe_name.isascii():
+        safe_name = _NON_WORD_RE.sub("_", safe_name)
+    safe_name = safe_name.lower()
     if not safe_name or safe_name[0].isdigit():
         safe_name = "scenario_" + safe_name
 
@@ -58,10 +103,9 @@ def init_cmd(
         console.print(f"[red]File already exists:[/red] {filename}")
         raise typer.Exit(code=1)
 
-    content = _SCENARIO_TEMPLATE.substitute(
-        name=display_name,
-        filename=filename,
-        class_name=class_name,
+    subs = {"name": display_name, "filename": filename, "class_name": class_name}
+    content = "".join(text if key is None else subs[key] for text, key in _TEMPLATE_PARTS).encode(
+        "utf-8"
     )
-    target.write_text(content)
+    target.write_bytes(content)
     console.print(f"[green]Created scenario:[/green] {filename}")
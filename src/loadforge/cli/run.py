@@ -21,11 +21,24 @@ from loadforge.patterns.spike import SpikePattern
 from loadforge.patterns.step import StepPattern
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from loadforge.metrics.models import MetricSnapshot, TestResult
     from loadforge.patterns.base import LoadPattern
 
+    # (users, duration, ramp_to, step_size, step_duration) -> pattern
+    _PatternFactory = Callable[[int, float, int | None, int | None, float | None], LoadPattern]
+
 console = Console(stderr=True)
 
+# Defaults derived from --users / --duration for patterns that need more
+# parameters than the CLI exposes.
+_DEFAULT_STEP_DURATION = 30.0
+_SPIKE_MULTIPLIER = 5
+_SPIKE_MIN_EXTRA_USERS = 50
+_MAX_SPIKE_DURATION = 60.0
+_DIURNAL_MIN_DIVISOR = 5
+
 
 # ---------------------------------------------------------------------------
 # Pattern construction helpers
@@ -85,53 +98,103 @@ def _create_pattern(
         Configured LoadPattern instance.
 
     Raises:
-        typer.BadParameter: If required flags are missing.
+        typer.BadParameter: If the pattern is unknown or required flags
+            are missing.
     """
-    if pattern_name == "constant":
-        return ConstantPattern(users=users)
-
-    if pattern_name == "ramp":
-        if ramp_to is None:
-            msg = "--ramp-to is required when using --pattern ramp"
-            raise typer.BadParameter(msg)
-        return RampPattern(
-            start_users=users,
-            end_users=ramp_to,
-            ramp_duration=duration,
-        )
+    factory = _PATTERN_FACTORIES.get(pattern_name)
+    if factory is None:
+        msg = f"Unknown pattern: {pattern_name}. Choose from: {', '.join(_PATTERN_FACTORIES)}"
+        raise typer.BadParameter(msg)
+    return factory(users, duration, ramp_to, step_size, step_duration)
 
-    if pattern_name == "step":
-        if step_size is None:
-            msg = "--step-size is required when using --pattern step"
-            raise typer.BadParameter(msg)
-        actual_step_dur = step_duration if step_duration is not None else 30.0
-        steps = max(1, int(duration / actual_step_dur))
-        return StepPattern(
-            start_users=users,
-            step_size=step_size,
-            step_duration=actual_step_dur,
-            steps=steps,
-        )
 
-    if pattern_name == "spike":
-        spike_users = max(users * 5, users + 50)
-        spike_dur = min(duration * 0.5, 60.0)
-        return SpikePattern(
-            base_users=users,
-            spike_users=spike_users,
-            spike_duration=spike_dur,
-        )
+def _constant_pattern(
+    users: int,
+    duration: float,
+    ramp_to: int | None,
+    step_size: int | None,
+    step_duration: float | None,
+) -> LoadPattern:
+    """Build a ``constant`` pattern holding ``users`` for the whole run."""
+    return ConstantPattern(users=users)
 
-    if pattern_name == "diurnal":
-        min_users = max(1, users // 5)
-        return DiurnalPattern(
-            min_users=min_users,
-            max_users=users,
-            period=duration,
-        )
 
-    msg = f"Unknown pattern: {pattern_name}. Choose from: constant, ramp, step, spike, diurnal"
-    raise typer.BadParameter(msg)
+def _ramp_pattern(
+    users: int,
+    duration: float,
+    ramp_to: int | None,
+    step_size: int | None,
+    step_duration: float | None,
+) -> LoadPattern:
+    """Build a ``ramp`` pattern from ``users`` to ``--ramp-to`` over the run."""
+    if ramp_to is None:
+        msg = "--ramp-to is required when using --pattern ramp"
+        raise typer.BadParameter(msg)
+    return RampPattern(
+        start_users=users,
+        end_users=ramp_to,
+        ramp_duration=duration,
+    )
+
+
+def _step_pattern(
+    users: int,
+    duration: float,
+    ramp_to: int | None,
+    step_size: int | None,
+    step_duration: float | None,
+) -> LoadPattern:
+    """Build a ``step`` pattern adding ``--step-size`` users per step."""
+    if step_size is None:
+        msg = "--step-size is required when using --pattern step"
+        raise typer.BadParameter(msg)
+    actual_step_dur = step_duration if step_duration is not None else _DEFAULT_STEP_DURATION
+    steps = max(1, int(duration / actual_step_dur))
+    return StepPattern(
+        start_users=users,
+        step_size=step_size,
+        step_duration=actual_step_dur,
+        steps=steps,
+    )
+
+
+def _spike_pattern(
+    users: int,
+    duration: float,
+    ramp_to: int | None,
+    step_size: int | None,
+    step_duration: float | None,
+) -> LoadPattern:
+    """Build a ``spike`` pattern bursting well above ``users`` mid-run."""
+    return SpikePattern(
+        base_users=users,
+        spike_users=max(users * _SPIKE_MULTIPLIER, users + _SPIKE_MIN_EXTRA_USERS),
+        spike_duration=min(duration * 0.5, _MAX_SPIKE_DURATION),
+    )
+
+
+def _diurnal_pattern(
+    users: int,
+    duration: float,
+    ramp_to: int | None,
+    step_size: int | None,
+    step_duration: float | None,
+) -> LoadPattern:
+    """Build a ``diurnal`` pattern cycling up to ``users`` once per run."""
+    return DiurnalPattern(
+        min_users=max(1, users // _DIURNAL_MIN_DIVISOR),
+        max_users=users,
+        period=duration,
+    )
+
+
+_PATTERN_FACTORIES: dict[str, _PatternFactory] = {
+    "constant": _constant_pattern,
+    "ramp": _ramp_pattern,
+    "step": _step_pattern,
+    "spike": _spike_pattern,
+    "diurnal": _diurnal_pattern,
+}
 
 
 # ---------------------------------------------------------------------------
@@ -171,6 +234,39 @@ def _make_live_table(snapshot: MetricSnapshot | None, elapsed: float) -> Table:
     return table
 
 
+class _LiveMetrics:
+    """Renderable for ``rich.live.Live`` that draws the latest snapshot.
+
+    ``update`` only stores the snapshot. The table is built when Live's
+    refresh thread renders (``refresh_per_second``), so snapshot bursts
+    never trigger extra renders on the thread running the test. The
+    table is kept and reused until a new snapshot arrives, since Live
+    usually refreshes more often than snapshots are produced.
+    """
+
+    def __init__(self) -> None:
+        """Start with no snapshot (renders a "Starting..." table)."""
+        self._snapshot: MetricSnapshot | None = None
+        self._table = _make_live_table(None, 0.0)
+        self._table_snapshot: MetricSnapshot | None = None
+
+    def update(self, snapshot: MetricSnapshot) -> None:
+        """Record the most recent snapshot for the next refresh.
+
+        Args:
+            snapshot: Latest metric snapshot.
+        """
+        self._snapshot = snapshot
+
+    def __rich__(self) -> Table:
+        """Return the table for the most recent snapshot."""
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot is not self._table_snapshot:
+            self._table = _make_live_table(snapshot, snapshot.elapsed_seconds)
+            self._table_snapshot = snapshot
+        return self._table
+
+
 def _print_summary(result: TestResult) -> None:
     """Print a final summary table after the test completes.
 
@@ -288,9 +384,20 @@ def run_cmd(
         None,
         "--workers",
         "-w",
-        help="Number of worker processes (default: CPU count).",
+        help=(
+            "Number of worker processes (default: CPU count). Workers run on uvloop"
+            " unless LOADFORGE_LOOP=asyncio."
+        ),
         min=1,
     ),
+    warm_up: bool = typer.Option(
+        False,
+        "--warm-up",
+        help=(
+            "Open keep-alive connections to the base URL (unrecorded HEAD requests)"
+            " before the test clock starts."
+        ),
+    ),
     output: Path = typer.Option(
         Path("./results"),
         "--output",
@@ -348,9 +455,6 @@ def run_cmd(
 
     log_level = logging.DEBUG if verbose else logging.INFO
 
-    def _on_snapshot(snapshot: MetricSnapshot, live: Live) -> None:
-        live.update(_make_live_table(snapshot, snapshot.elapsed_seconds))
-
     console.print(
         Panel(
             f"[bold]Scenario:[/bold] {scenario_file.name}\n"
@@ -367,19 +471,21 @@ def run_cmd(
 
     # Run with live display
     try:
+        live_metrics = _LiveMetrics()
         with Live(
-            _make_live_table(None, 0.0),
+            live_metrics,
             console=console,
             refresh_per_second=2,
             transient=True,
-        ) as live:
+        ):
             test_runner = LoadTestRunner(
                 scenario_path=scenario_file,
                 pattern=load_pattern,
                 duration_seconds=duration,
                 num_workers=workers,
-                on_snapshot=lambda snap: _on_snapshot(snap, live),
+                on_snapshot=live_metrics.update,
                 log_level=log_level,
+                warm_up=warm_up,
             )
             result = test_runner.run()
     except LoadForgeError as exc:
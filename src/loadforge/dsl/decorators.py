@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING
+import sys
+from typing import TYPE_CHECKING, cast
 
 from loadforge._internal.errors import ScenarioError
 from loadforge.dsl.scenario import (
@@ -30,6 +31,7 @@ def scenario(
     base_url: str,
     default_headers: dict[str, str] | None = None,
     think_time: tuple[float, float] = (0.5, 1.5),
+    stateless: bool = False,
 ) -> Callable[[type], ScenarioDefinition]:
     """Decorate a class as a LoadForge scenario.
 
@@ -42,6 +44,9 @@ def scenario(
         base_url: Base URL for all HTTP requests.
         default_headers: Default headers applied to every request.
         think_time: Random pause range (min, max) in seconds between tasks.
+        stateless: If True, all virtual users share one instance of the
+            class instead of each constructing its own. Only safe when
+            tasks and setup/teardown never store state on ``self``.
 
     Returns:
         A class decorator that transforms the class into a
@@ -57,19 +62,17 @@ def scenario(
         setup_func: AsyncScenarioMethod | None = None
         teardown_func: AsyncScenarioMethod | None = None
 
-        for attr_name in dir(cls):
-            if attr_name.startswith("__"):
-                continue
-
-            attr = getattr(cls, attr_name, None)
-            if attr is None or not callable(attr):
+        for attr_name, member in _class_members(cls).items():
+            if attr_name.startswith("__") or not callable(member):
                 continue
+            # Only marked methods are used, and each is checked to be async below.
+            attr = cast("AsyncScenarioMethod", member)
 
             if getattr(attr, _TASK_MARKER, False):
                 if not asyncio.iscoroutinefunction(attr):
                     msg = f"Task method {cls.__name__}.{attr_name} must be an async function"
                     raise ScenarioError(msg)
-                task_name: str = getattr(attr, _TASK_NAME, attr_name)
+                task_name: str = sys.intern(getattr(attr, _TASK_NAME, attr_name))
                 task_weight: int = getattr(attr, _TASK_WEIGHT, 1)
                 tasks.append(
                     TaskDefinition(
@@ -102,14 +105,17 @@ def scenario(
             raise ScenarioError(msg)
 
         definition = ScenarioDefinition(
-            name=name,
+            # Interned so registry lookups by a literal name hit the
+            # identity fast path in dict key comparison.
+            name=sys.intern(name),
             cls=cls,
             base_url=base_url,
             default_headers=default_headers or {},
-            tasks=tasks,
+            tasks=tuple(tasks),
             setup_func=setup_func,
             teardown_func=teardown_func,
             think_time=think_time,
+            stateless=stateless,
         )
 
         registry.register(definition)
@@ -118,6 +124,27 @@ def scenario(
     return decorator
 
 
+def _class_members(cls: type) -> dict[str, object]:
+    """Collect a class's attributes, including inherited ones.
+
+    Reads each class ``__dict__`` along the MRO directly instead of
+    ``dir()`` + ``getattr()``, which sorts every name (including all of
+    ``object``'s) and resolves each one through the descriptor protocol.
+    Subclass attributes override base ones; order follows definition
+    order, base classes first.
+
+    Args:
+        cls: The class to inspect.
+
+    Returns:
+        Mapping of attribute name to raw class attribute.
+    """
+    members: dict[str, object] = {}
+    for klass in reversed(cls.__mro__[:-1]):
+        members.update(vars(klass))
+    return members
+
+
 def task(
     *,
     weight: int = 1,
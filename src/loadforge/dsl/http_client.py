@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 
+import functools
+import random
 import time
+from collections.abc import MutableMapping
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 import aiohttp
+from yarl import URL
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Coroutine, Iterator, Mapping
 
+    from loadforge.metrics.buffer import MetricBuffer
 
-def _noop_callback(metric: RequestMetric) -> None:
-    """Default no-op metric callback."""
+
+# Upper bound on cached request targets per process, shared by all clients.
+# Least recently used entries are evicted, so one-off paths with IDs in them
+# don't push out the static paths that actually repeat.
+_TARGET_CACHE_SIZE = 1024
+
+# Shared starting point for clients created without default headers.
+_NO_HEADERS: Mapping[str, str] = MappingProxyType({})
 
 
 @dataclass
@@ -43,48 +55,151 @@ class RequestMetric:
     worker_id: int = 0
 
 
+class _CopyOnWriteHeaders(MutableMapping[str, str]):
+    """Per-client headers that share the scenario defaults until written.
+
+    Every virtual user starts from the same default headers, and most
+    never change them. Reads go straight to the shared mapping; the first
+    write (e.g. a setup hook adding an auth token) copies it into a dict
+    owned by this client, so the defaults are never modified.
+    """
+
+    __slots__ = ("_data", "_owned")
+
+    def __init__(self, shared: Mapping[str, str]) -> None:
+        """Wrap a shared mapping without copying it.
+
+        Args:
+            shared: Default headers; never written to.
+        """
+        self._data: Mapping[str, str] = shared
+        self._owned: dict[str, str] | None = None
+
+    @classmethod
+    def owning(cls, data: dict[str, str]) -> _CopyOnWriteHeaders:
+        """Wrap a dict this client owns, so writes never copy it.
+
+        Args:
+            data: Headers dict not referenced by anyone else.
+
+        Returns:
+            Headers that write straight to ``data``.
+        """
+        headers = cls(data)
+        headers._owned = data
+        return headers
+
+    @property
+    def data(self) -> Mapping[str, str]:
+        """Return the current headers as a plain mapping for aiohttp."""
+        return self._data
+
+    def __getitem__(self, key: str) -> str:
+        """Return the header value for ``key``."""
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over header names."""
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Return the number of headers."""
+        return len(self._data)
+
+    def __setitem__(self, key: str, value: str) -> None:
+        """Set a header, copying the shared defaults on the first write."""
+        self._own()[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        """Remove a header, copying the shared defaults on the first write."""
+        del self._own()[key]
+
+    def __repr__(self) -> str:
+        """Return the headers' repr."""
+        return repr(dict(self._data))
+
+    def _own(self) -> dict[str, str]:
+        """Return the client-owned dict, copying the defaults if needed."""
+        if self._owned is None:
+            self._owned = dict(self._data)
+            self._data = self._owned
+        return self._owned
+
+
 class HttpClient:
     """Instrumented async HTTP client wrapping ``aiohttp.ClientSession``.
 
-    Every HTTP request is auto-timed and emits a ``RequestMetric`` via the
-    configured ``metric_callback``. The callback defaults to a no-op and
-    is replaced by the engine in later phases.
+    Every HTTP request is auto-timed. The engine passes a columnar
+    ``metric_buffer`` that each request is appended to as a row of
+    scalars. A ``metric_callback``, if given, additionally receives a
+    ``RequestMetric`` per request.
 
     Attributes:
         base_url: Base URL prepended to all request paths.
-        headers: Mutable headers dict applied to every request. Setup hooks
-            can modify this to add authentication tokens.
+        headers: Mutable headers mapping applied to every request. Setup
+            hooks can modify this to add authentication tokens; the
+            defaults passed in are only copied on the first write.
+        rng: Random number generator private to this client (one per
+            virtual user). Scenarios should draw from it instead of the
+            module-level ``random`` functions, which share one global
+            instance across all users.
     """
 
     def __init__(
         self,
         base_url: str,
-        headers: dict[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
         metric_callback: Callable[[RequestMetric], None] | None = None,
+        metric_buffer: MetricBuffer | None = None,
         worker_id: int = 0,
         timeout: float = 30.0,
+        connector: aiohttp.BaseConnector | None = None,
+        seed: int | str | None = None,
     ) -> None:
         """Initialize the HTTP client.
 
         Args:
             base_url: Base URL prepended to all request paths.
-            headers: Default headers applied to every request.
+            headers: Default headers applied to every request. A read-only
+                ``MappingProxyType`` (such as
+                ``ScenarioDefinition.default_headers``) is shared until the
+                first write; any other mapping is copied once.
             metric_callback: Callback invoked with a ``RequestMetric``
-                after each request. Defaults to a no-op.
+                after each request. None skips the callback.
+            metric_buffer: Columnar buffer each request is appended to
+                without allocating a ``RequestMetric``. None skips it.
             worker_id: Worker process identifier for metric tagging.
             timeout: Default request timeout in seconds.
+            connector: Optional connection pool shared with other clients.
+                The client does not close a shared connector; its owner
+                must. When None, the client creates and owns its own pool.
+            seed: Optional seed for ``rng``. None seeds from OS entropy.
         """
         self.base_url = base_url.rstrip("/")
-        self.headers: dict[str, str] = dict(headers or {})
-        self._metric_callback = metric_callback or _noop_callback
+        if headers is None or isinstance(headers, MappingProxyType):
+            self.headers = _CopyOnWriteHeaders(headers or _NO_HEADERS)
+        else:
+            # A plain dict may still be mutated by the caller, so sharing it
+            # would leak their later changes into this client.
+            self.headers = _CopyOnWriteHeaders.owning(dict(headers))
+        self.rng = random.Random(seed)  # noqa: S311
+        self._metric_callback = metric_callback
+        self._metric_buffer = metric_buffer
         self._worker_id = worker_id
         self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._connector = connector
         self._session: aiohttp.ClientSession | None = None
 
     async def __aenter__(self) -> HttpClient:
-        """Open the underlying aiohttp session."""
+        """Open the underlying aiohttp session.
+
+        Each client keeps its own session (and cookie jar), but reuses
+        the shared connector's keep-alive connections when one is given.
+        """
         self._session = aiohttp.ClientSession(
             timeout=self._timeout,
+            connector=self._connector,
+            connector_owner=self._connector is None,
         )
         return self
 
@@ -99,13 +214,17 @@ class HttpClient:
             await self._session.close()
             self._session = None
 
-    async def get(
+    # The verb methods are plain functions returning _request's coroutine
+    # rather than ``async def`` wrappers, which would add a second coroutine
+    # object and frame to every request. Callers still ``await`` them.
+
+    def get(
         self,
         path: str,
         *,
         name: str | None = None,
         **kwargs: object,
-    ) -> aiohttp.ClientResponse:
+    ) -> Coroutine[None, None, aiohttp.ClientResponse]:
         """Send a GET request.
 
         Args:
@@ -114,17 +233,17 @@ class HttpClient:
             **kwargs: Additional keyword arguments passed to aiohttp.
 
         Returns:
-            The aiohttp response object.
+            A coroutine resolving to the aiohttp response object.
         """
-        return await self._request("GET", path, name=name, **kwargs)
+        return self._request("GET", path, name=name, **kwargs)
 
-    async def post(
+    def post(
         self,
         path: str,
         *,
         name: str | None = None,
         **kwargs: object,
-    ) -> aiohttp.ClientResponse:
+    ) -> Coroutine[None, None, aiohttp.ClientResponse]:
         """Send a POST request.
 
         Args:
@@ -133,17 +252,17 @@ class HttpClient:
             **kwargs: Additional keyword arguments passed to aiohttp.
 
         Returns:
-            The aiohttp response object.
+            A coroutine resolving to the aiohttp response object.
         """
-        return await self._request("POST", path, name=name, **kwargs)
+        return self._request("POST", path, name=name, **kwargs)
 
-    async def put(
+    def put(
         self,
         path: str,
         *,
         name: str | None = None,
         **kwargs: object,
-    ) -> aiohttp.ClientResponse:
+    ) -> Coroutine[None, None, aiohttp.ClientResponse]:
         """Send a PUT request.
 
         Args:
@@ -152,17 +271,17 @@ class HttpClient:
             **kwargs: Additional keyword arguments passed to aiohttp.
 
         Returns:
-            The aiohttp response object.
+            A coroutine resolving to the aiohttp response object.
         """
-        return await self._request("PUT", path, name=name, **kwargs)
+        return self._request("PUT", path, name=name, **kwargs)
 
-    async def patch(
+    def patch(
         self,
         path: str,
         *,
         name: str | None = None,
         **kwargs: object,
-    ) -> aiohttp.ClientResponse:
+    ) -> Coroutine[None, None, aiohttp.ClientResponse]:
         """Send a PATCH request.
 
         Args:
@@ -171,17 +290,17 @@ class HttpClient:
             **kwargs: Additional keyword arguments passed to aiohttp.
 
         Returns:
-            The aiohttp response object.
+            A coroutine resolving to the aiohttp response object.
         """
-        return await self._request("PATCH", path, name=name, **kwargs)
+        return self._request("PATCH", path, name=name, **kwargs)
 
-    async def delete(
+    def delete(
         self,
         path: str,
         *,
         name: str | None = None,
         **kwargs: object,
-    ) -> aiohttp.ClientResponse:
+    ) -> Coroutine[None, None, aiohttp.ClientResponse]:
         """Send a DELETE request.
 
         Args:
@@ -190,9 +309,9 @@ class HttpClient:
             **kwargs: Additional keyword arguments passed to aiohttp.
 
         Returns:
-            The aiohttp response object.
+            A coroutine resolving to the aiohttp response object.
         """
-        return await self._request("DELETE", path, name=name, **kwargs)
+        return self._request("DELETE", path, name=name, **kwargs)
 
     async def _request(
         self,
@@ -221,11 +340,9 @@ class HttpClient:
             msg = "HttpClient must be used as an async context manager"
             raise RuntimeError(msg)
 
-        url = f"{self.base_url}{path}"
-        metric_name = name or path
-        merged_headers = {**self.headers}
+        parsed_url, url, metric_name = _request_target(self.base_url, path, name)
 
-        start = time.monotonic()
+        start_ns = time.monotonic_ns()
         status_code = 0
         content_length = 0
         error: str | None = None
@@ -233,28 +350,54 @@ class HttpClient:
         try:
             resp = await self._session.request(
                 method,
-                url,
-                headers=merged_headers,
+                parsed_url,
+                # aiohttp merges these into its own CIMultiDict before the
+                # first await, so no defensive copy is needed per request.
+                headers=self.headers.data,
                 **kwargs,  # type: ignore[arg-type]
             )
             status_code = resp.status
-            content_length = int(resp.headers.get("Content-Length", 0))
+            content_length = resp.content_length or 0
         except Exception as exc:
             error = f"{type(exc).__name__}: {exc}"
             raise
         finally:
-            latency_ms = (time.monotonic() - start) * 1000
-            metric = RequestMetric(
-                timestamp=start,
-                name=metric_name,
-                method=method,
-                url=url,
-                status_code=status_code,
-                latency_ms=latency_ms,
-                content_length=content_length,
-                error=error,
-                worker_id=self._worker_id,
-            )
-            self._metric_callback(metric)
+            latency_ns = time.monotonic_ns() - start_ns
+            if self._metric_buffer is not None:
+                self._metric_buffer.append(metric_name, status_code, latency_ns, error)
+            if self._metric_callback is not None:
+                self._metric_callback(
+                    RequestMetric(
+                        timestamp=start_ns / 1e9,
+                        name=metric_name,
+                        method=method,
+                        url=url,
+                        status_code=status_code,
+                        latency_ms=latency_ns / 1e6,
+                        content_length=content_length,
+                        error=error,
+                        worker_id=self._worker_id,
+                    )
+                )
 
         return resp
+
+
+@functools.lru_cache(maxsize=_TARGET_CACHE_SIZE)
+def _request_target(base_url: str, path: str, name: str | None) -> tuple[URL, str, str]:
+    """Build the URL and metric name for a request target.
+
+    Cached per process, so all virtual users in a worker share one entry
+    per target. Parsing into a ``yarl.URL`` here means aiohttp reuses the
+    object instead of re-parsing the URL string on every request.
+
+    Args:
+        base_url: Client base URL, without a trailing slash.
+        path: URL path appended to base_url.
+        name: Logical name for metric grouping, or None for the path.
+
+    Returns:
+        Tuple of (parsed URL, URL string, metric name).
+    """
+    url = f"{base_url}{path}"
+    return URL(url), url, name or path
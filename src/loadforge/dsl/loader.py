@@ -3,59 +3,102 @@
 from __future__ import annotations
 
 import importlib.util
+import marshal
 import sys
+import types
 from pathlib import Path
 
 from loadforge._internal.errors import ScenarioError
-from loadforge.dsl.scenario import ScenarioDefinition
+from loadforge.dsl.scenario import ScenarioDefinition, registry
 
 
-def load_scenario(file_path: str | Path) -> ScenarioDefinition:
-    """Load a scenario from a Python file.
+def compile_scenario(file_path: str | Path) -> bytes:
+    """Compile a scenario file once for loading in many processes.
 
-    Dynamically imports the file using ``importlib`` and scans the module
-    globals for ``ScenarioDefinition`` instances (created by the ``@scenario``
-    decorator).
+    The result can be passed to ``load_scenario(..., code=...)`` in each
+    worker, which then skips reading, validating, and compiling the file
+    (and the import system's spec and bytecode-cache machinery).
 
     Args:
         file_path: Path to the Python scenario file.
 
     Returns:
-        The first ``ScenarioDefinition`` found in the module.
+        The module's code object, serialised with ``marshal``.
 
     Raises:
-        ScenarioError: If the file does not exist, cannot be imported,
-            or contains no ``@scenario``-decorated class.
+        ScenarioError: If the file does not exist, is not a ``.py`` file,
+            or has a syntax error.
     """
-    path = Path(file_path)
-
-    if not path.exists():
-        msg = f"Scenario file not found: {path}"
-        raise ScenarioError(msg)
+    path = _check_path(file_path)
+    try:
+        # dont_inherit: this module's __future__ flags must not leak into the
+        # scenario, or it would behave differently than when imported.
+        code = compile(path.read_bytes(), str(path), "exec", dont_inherit=True)
+    except SyntaxError as exc:
+        msg = f"Failed to import scenario file {path}: {exc}"
+        raise ScenarioError(msg) from exc
+    return marshal.dumps(code)
 
-    if path.suffix != ".py":
-        msg = f"Scenario file must be a .py file, got: {path}"
-        raise ScenarioError(msg)
 
-    module_name = f"loadforge_scenario_{path.stem}"
+def load_scenario(
+    file_path: str | Path,
+    *,
+    code: bytes | None = None,
+) -> ScenarioDefinition:
+    """Load a scenario from a Python file.
 
-    spec = importlib.util.spec_from_file_location(module_name, path)
-    if spec is None or spec.loader is None:
-        msg = f"Could not create module spec for: {path}"
-        raise ScenarioError(msg)
+    Dynamically imports the file using ``importlib`` and picks up the
+    ``ScenarioDefinition`` instances its ``@scenario`` decorators register,
+    falling back to scanning the module globals.
 
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
+    Args:
+        file_path: Path to the Python scenario file.
+        code: Optional output of ``compile_scenario`` for this file. When
+            given, the module is executed from it directly instead of being
+            imported from disk.
 
-    try:
-        spec.loader.exec_module(module)
-    except Exception as exc:
-        sys.modules.pop(module_name, None)
-        msg = f"Failed to import scenario file {path}: {exc}"
-        raise ScenarioError(msg) from exc
+    Returns:
+        The first ``ScenarioDefinition`` found in the module.
 
-    # Scan module globals for ScenarioDefinition instances.
-    definitions: list[ScenarioDefinition] = [
+    Raises:
+        ScenarioError: If the file does not exist, cannot be imported,
+            or contains no ``@scenario``-decorated class.
+    """
+    path = Path(file_path) if code is not None else _check_path(file_path)
+    module_name = f"loadforge_scenario_{path.stem}"
+    registered_before = len(registry)
+
+    if code is not None:
+        module = types.ModuleType(module_name)
+        module.__file__ = str(path)
+        sys.modules[module_name] = module
+        try:
+            exec(marshal.loads(code), vars(module))  # noqa: S102, S302
+        except Exception as exc:
+            sys.modules.pop(module_name, None)
+            msg = f"Failed to import scenario file {path}: {exc}"
+            raise ScenarioError(msg) from exc
+    else:
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        if spec is None or spec.loader is None:
+            msg = f"Could not create module spec for: {path}"
+            raise ScenarioError(msg)
+
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+
+        try:
+            spec.loader.exec_module(module)
+        except Exception as exc:
+            sys.modules.pop(module_name, None)
+            msg = f"Failed to import scenario file {path}: {exc}"
+            raise ScenarioError(msg) from exc
+
+    # @scenario registers each definition as the module runs, so the new
+    # registry entries are the module's scenarios in definition order.
+    # Fall back to scanning module globals for scenarios the file imports
+    # from elsewhere (registered before it ran).
+    definitions = registry.registered_since(registered_before) or [
         obj for obj in vars(module).values() if isinstance(obj, ScenarioDefinition)
     ]
 
@@ -68,3 +111,28 @@ def load_scenario(file_path: str | Path) -> ScenarioDefinition:
         raise ScenarioError(msg)
 
     return definitions[0]
+
+
+def _check_path(file_path: str | Path) -> Path:
+    """Validate that a scenario path exists and is a ``.py`` file.
+
+    Args:
+        file_path: Path to the Python scenario file.
+
+    Returns:
+        The path as a ``Path``.
+
+    Raises:
+        ScenarioError: If the file does not exist or is not a ``.py`` file.
+    """
+    path = Path(file_path)
+
+    if not path.exists():
+        msg = f"Scenario file not found: {path}"
+        raise ScenarioError(msg)
+
+    if path.suffix != ".py":
+        msg = f"Scenario file must be a .py file, got: {path}"
+        raise ScenarioError(msg)
+
+    return path
@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
+import itertools
+import random
 from dataclasses import dataclass, field
-from typing import Protocol
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Protocol
+
+from loadforge._internal.types import Headers, ThinkTimeSampler
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
 
 
 class AsyncScenarioMethod(Protocol):
@@ -22,7 +30,7 @@ class AsyncScenarioMethod(Protocol):
         ...
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TaskDefinition:
     """Definition of a single task within a scenario.
 
@@ -38,35 +46,161 @@ class TaskDefinition:
     weight: int = 1
 
 
-@dataclass
+class TaskPicker:
+    """O(1) weighted-random task selection using Vose's alias method.
+
+    The alias table is built once from the task weights. Each draw then
+    costs a single uniform random number, instead of the cumulative-weight
+    rebuild that ``random.choices(..., weights=...)`` performs per call.
+    Scenarios with a single task skip the draw entirely, and equal
+    weights skip the alias lookup.
+    """
+
+    def __init__(self, tasks: Sequence[TaskDefinition]) -> None:
+        """Build the alias table for the given tasks.
+
+        Args:
+            tasks: Task definitions to choose from, with their weights.
+        """
+        self._tasks = tuple(tasks)
+        self._single = self._tasks[0] if len(self._tasks) == 1 else None
+        weights = [t.weight for t in self._tasks]
+        self._uniform = len(set(weights)) <= 1
+        self._prob, self._alias = _build_alias_table(weights)
+
+    @property
+    def tasks(self) -> tuple[TaskDefinition, ...]:
+        """Return the tasks this picker selects from."""
+        return self._tasks
+
+    def pick(self, rng: Callable[[], float] = random.random) -> TaskDefinition:
+        """Select a task with probability proportional to its weight.
+
+        Args:
+            rng: Source of uniform floats in ``[0.0, 1.0)``. Defaults to
+                the global ``random.random``.
+
+        Returns:
+            The selected TaskDefinition.
+
+        Raises:
+            IndexError: If the picker has no tasks.
+        """
+        if self._single is not None:
+            return self._single
+        # One uniform draw supplies both the column and the coin flip.
+        u = rng() * len(self._tasks)
+        i = int(u)
+        if self._uniform or u - i < self._prob[i]:
+            return self._tasks[i]
+        return self._tasks[self._alias[i]]
+
+
+def _build_alias_table(weights: list[int]) -> tuple[list[float], list[int]]:
+    """Build Vose alias-method probability and alias tables.
+
+    Args:
+        weights: Positive relative weights.
+
+    Returns:
+        Tuple of (prob, alias) lists, each with one entry per weight.
+    """
+    n = len(weights)
+    if n == 0:
+        return [], []
+
+    total = sum(weights)
+    scaled = [w * n / total for w in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+    while small and large:
+        lo = small.pop()
+        hi = large.pop()
+        prob[lo] = scaled[lo]
+        alias[lo] = hi
+        scaled[hi] = scaled[hi] + scaled[lo] - 1.0
+        if scaled[hi] < 1.0:
+            small.append(hi)
+        else:
+            large.append(hi)
+
+    # Leftovers are 1.0 up to floating-point error; prob already defaults to 1.0.
+    return prob, alias
+
+
+@dataclass(frozen=True, slots=True)
 class ScenarioDefinition:
     """Complete definition of a load test scenario.
 
     Created by the ``@scenario`` class decorator. Contains all metadata
-    needed to instantiate and execute a scenario.
+    needed to instantiate and execute a scenario. Instances are frozen,
+    since the precomputed ``task_picker`` and ``think_time_sampler``
+    would go stale if the fields they derive from were reassigned.
 
     Attributes:
         name: Human-readable name for this scenario.
         cls: The original class that was decorated.
         base_url: Base URL for all HTTP requests in this scenario.
-        default_headers: Default headers applied to every request.
-        tasks: List of task definitions discovered from @task-decorated methods.
+        default_headers: Default headers applied to every request. Stored
+            as a read-only copy, since every virtual user's ``HttpClient``
+            shares it until the user sets a header of its own.
+        tasks: Task definitions discovered from @task-decorated methods.
         setup_func: Optional coroutine called once per virtual user before
             tasks begin.
         teardown_func: Optional coroutine called once per virtual user on
             shutdown.
         think_time: Random pause range (min, max) in seconds between task
             executions.
+        stateless: Whether all virtual users share one class instance.
+        think_time_sampler: Sampler precomputed from ``think_time``, used
+            by the engine on every task iteration.
+        task_picker: Weighted task selector precomputed from ``tasks``.
     """
 
     name: str
     cls: type
     base_url: str
-    default_headers: dict[str, str] = field(default_factory=dict)
-    tasks: list[TaskDefinition] = field(default_factory=list)
+    default_headers: Headers = field(default_factory=dict)
+    tasks: tuple[TaskDefinition, ...] = ()
     setup_func: AsyncScenarioMethod | None = None
     teardown_func: AsyncScenarioMethod | None = None
     think_time: tuple[float, float] = (0.5, 1.5)
+    stateless: bool = False
+    think_time_sampler: ThinkTimeSampler = field(init=False, repr=False, compare=False)
+    task_picker: TaskPicker = field(init=False, repr=False, compare=False)
+    _shared_instance: object | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the think time sampler and task picker."""
+        # Frozen dataclass: derived fields are set through object.__setattr__.
+        object.__setattr__(self, "default_headers", MappingProxyType(dict(self.default_headers)))
+        object.__setattr__(
+            self, "think_time_sampler", ThinkTimeSampler.from_range(self.think_time)
+        )
+        object.__setattr__(self, "task_picker", TaskPicker(self.tasks))
+        object.__setattr__(self, "_shared_instance", None)
+
+    def new_instance(self) -> object:
+        """Return the scenario instance a new virtual user runs against.
+
+        Stateless scenarios hand every user the same instance, built on
+        the first call rather than at decoration time, so importing a
+        scenario file never runs its constructor. Otherwise each user
+        gets a fresh instance of ``cls``.
+
+        Returns:
+            An instance of ``cls``.
+        """
+        if not self.stateless:
+            return self.cls()
+        instance = self._shared_instance
+        if instance is None:
+            instance = self.cls()
+            object.__setattr__(self, "_shared_instance", instance)
+        return instance
 
 
 class ScenarioRegistry:
@@ -116,6 +250,21 @@ class ScenarioRegistry:
         """
         return list(self._scenarios.values())
 
+    def registered_since(self, count: int) -> list[ScenarioDefinition]:
+        """Return the scenarios registered after the first ``count``.
+
+        Lets a loader find the scenarios a module defined by noting
+        ``len(registry)`` before executing it.
+
+        Args:
+            count: Number of registered scenarios to skip.
+
+        Returns:
+            Scenarios registered after the first ``count``, in
+            registration order.
+        """
+        return list(itertools.islice(self._scenarios.values(), count, None))
+
     def clear(self) -> None:
         """Remove all registered scenarios. Primarily for testing."""
         self._scenarios.clear()
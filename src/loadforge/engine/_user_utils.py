@@ -7,32 +7,219 @@ Provides common functions used by both ``TestSession`` (Phase 3) and
 from __future__ import annotations
 
 import asyncio
-import random
-from typing import TYPE_CHECKING
 
-from loadforge._internal.logging import get_logger
+import aiohttp
 
-if TYPE_CHECKING:
-    from loadforge.dsl.scenario import TaskDefinition
+from loadforge._internal.config import load_config
+from loadforge._internal.logging import get_logger
 
 logger = get_logger("engine.user_utils")
 
+# Seconds an idle pooled connection is kept open for reuse.
+_KEEPALIVE_TIMEOUT = 75.0
+
+# Upper bound on the time spent warming up the pool before a test starts.
+_WARM_UP_TIMEOUT = 5.0
+
+# Waits shorter than this just yield to the loop instead of arming a timer.
+_MIN_TIMER_WAIT = 0.002
+
+
+def user_seed(worker_id: int, user_id: int) -> str | None:
+    """Derive a virtual user's random seed from ``LOADFORGE_SEED``.
+
+    Each (worker, user) pair gets its own seed, so users draw independent
+    streams that are still identical across runs with the same base seed.
+
+    Args:
+        worker_id: Worker process identifier.
+        user_id: Virtual user identifier within the worker.
+
+    Returns:
+        A seed for ``random.Random``, or None when no base seed is set.
+    """
+    base = load_config().random_seed
+    if base is None:
+        return None
+    return f"{base}:{worker_id}:{user_id}"
+
+
+def create_shared_connector() -> aiohttp.TCPConnector:
+    """Create the connection pool shared by all virtual users in a worker.
+
+    Sharing one pool lets users reuse each other's keep-alive connections
+    instead of each paying its own TCP (and TLS) handshakes. The pool is
+    unlimited unless ``LoadForgeConfig.connection_pool_size`` is set, so
+    users never wait on each other for a connection inside the timed
+    request.
+
+    Must be called from within a running event loop. The caller owns the
+    connector and must ``await connector.close()`` once all users exit.
+
+    Returns:
+        A new ``aiohttp.TCPConnector``.
+    """
+    pool_size = load_config().connection_pool_size
+    per_host, total = pool_size if pool_size is not None else (0, 0)
+    return aiohttp.TCPConnector(
+        limit=total,
+        limit_per_host=per_host,
+        keepalive_timeout=_KEEPALIVE_TIMEOUT,
+    )
+
+
+async def warm_up_connector(
+    connector: aiohttp.TCPConnector,
+    base_url: str,
+    connections: int,
+) -> None:
+    """Open keep-alive connections to the target before the test starts.
+
+    Sends ``connections`` concurrent HEAD requests to ``base_url`` so the
+    pool already holds open (and TLS-negotiated) connections when the
+    first virtual users start, instead of paying handshakes inside the
+    measured window. The requests are not recorded as metrics.
 
-def pick_weighted_task(tasks: list[TaskDefinition]) -> TaskDefinition:
-    """Select a task using weighted-random distribution.
+    Failures are logged and ignored: warm-up is best-effort and the test
+    runs normally against a cold pool.
 
     Args:
-        tasks: List of task definitions to choose from.
+        connector: Connection pool shared by the worker's users.
+        base_url: Target base URL.
+        connections: Number of connections to open. Capped at the
+            connector's per-host limit.
+    """
+    if connector.limit_per_host:
+        connections = min(connections, connector.limit_per_host)
+    if connections <= 0 or not base_url:
+        return
+
+    async def _head(session: aiohttp.ClientSession) -> None:
+        async with session.head(base_url, allow_redirects=False) as resp:
+            await resp.read()
+
+    async with aiohttp.ClientSession(
+        connector=connector,
+        connector_owner=False,
+        timeout=aiohttp.ClientTimeout(total=_WARM_UP_TIMEOUT),
+    ) as session:
+        results = await asyncio.gather(
+            *(_head(session) for _ in range(connections)),
+            return_exceptions=True,
+        )
+
+    failures = [r for r in results if isinstance(r, BaseException)]
+    if failures:
+        logger.debug(
+            "Connection warm-up: %d of %d requests failed: %s",
+            len(failures),
+            connections,
+            failures[0],
+        )
+    else:
+        logger.debug("Warmed up %d connections to %s", connections, base_url)
+
+
+async def sleep_until(deadline: float, stop_event: asyncio.Event) -> bool:
+    """Sleep until the event loop clock reaches ``deadline`` or a stop.
+
+    The deadline is a single ``loop.call_at`` timer on the loop's own
+    clock, so tick loops can advance an absolute deadline instead of
+    re-reading ``time.monotonic()`` to compute each sleep, and a stop
+    request ends the wait at once instead of at the next tick. Deadlines
+    less than ``_MIN_TIMER_WAIT`` away only yield to the loop once, so
+    late-running ticks skip the timer setup and extra wakeup.
+
+    Args:
+        deadline: Absolute time in ``loop.time()`` units.
+        stop_event: Event that ends the wait early when set.
 
     Returns:
-        The selected TaskDefinition.
+        True if ``stop_event`` is set, False if the deadline passed.
+    """
+    if deadline - asyncio.get_running_loop().time() < _MIN_TIMER_WAIT:
+        await asyncio.sleep(0)
+        return stop_event.is_set()
+    try:
+        async with asyncio.timeout_at(deadline):
+            await stop_event.wait()
+    except TimeoutError:
+        return False
+    return True
+
+
+def next_tick(tick: int, start: float, interval: float, now: float) -> int:
+    """Return the index of the next tick whose deadline is after ``now``.
+
+    Tick ``k`` is due at ``start + k * interval``. Counting ticks avoids
+    flooring a float elapsed time, which with a millisecond-cached clock
+    (uvloop) and intervals like 0.1 often lands one tick short and reruns
+    the same tick until the clock moves on. Ticks missed while the loop
+    was busy are skipped rather than run back to back.
+
+    Args:
+        tick: Index of the tick that just ran.
+        start: Loop time of tick 0.
+        interval: Seconds between ticks.
+        now: Current loop time.
+
+    Returns:
+        The next tick index, always greater than ``tick``.
+    """
+    tick += 1
+    if start + tick * interval <= now:
+        tick = int((now - start) / interval)
+        while start + tick * interval <= now:
+            tick += 1
+    return tick
+
+
+def track_user_task(
+    user_tasks: dict[int, asyncio.Task[None]],
+    user_id: int,
+    task: asyncio.Task[None],
+) -> None:
+    """Add a virtual user task to ``user_tasks`` until it finishes.
+
+    The task removes itself when it completes, so ``user_tasks`` only
+    holds live users and callers never sweep it for finished tasks.
+    Insertion order is creation order, so ``popitem()`` yields the most
+    recently started user for LIFO scale-down.
+
+    Args:
+        user_tasks: Live tasks keyed by user ID.
+        user_id: ID of the user the task runs.
+        task: The user's task.
+    """
+
+    def _forget(_task: asyncio.Task[None]) -> None:
+        user_tasks.pop(user_id, None)
+
+    user_tasks[user_id] = task
+    task.add_done_callback(_forget)
+
+
+async def cancel_newest_users(user_tasks: dict[int, asyncio.Task[None]], count: int) -> None:
+    """Cancel the ``count`` most recently started users (LIFO).
+
+    All tasks are cancelled first and then awaited together, so removing
+    many users costs at most one 2-second wait rather than one per user.
+
+    Args:
+        user_tasks: Live tasks keyed by user ID. Cancelled users are
+            removed immediately.
+        count: Number of users to remove. Capped at the number of users.
     """
-    weights = [t.weight for t in tasks]
-    return random.choices(tasks, weights=weights, k=1)[0]  # noqa: S311
+    removed = [user_tasks.popitem()[1] for _ in range(min(count, len(user_tasks)))]
+    if not removed:
+        return
+    for task in removed:
+        task.cancel()
+    await asyncio.wait(removed, timeout=2.0)
 
 
 async def shutdown_all_users(
-    user_tasks: list[tuple[int, asyncio.Task[None]]],
+    user_tasks: dict[int, asyncio.Task[None]],
     stop_event: asyncio.Event,
 ) -> None:
     """Gracefully shut down all virtual users.
@@ -41,13 +228,13 @@ async def shutdown_all_users(
     then cancels any remaining tasks and waits for cancellation.
 
     Args:
-        user_tasks: List of (user_id, task) tuples to shut down.
+        user_tasks: Live tasks keyed by user ID.
         stop_event: Event to signal shutdown to running users.
     """
     stop_event.set()
 
     if user_tasks:
-        tasks = [t for _, t in user_tasks]
+        tasks = list(user_tasks.values())
         _done, pending = await asyncio.wait(tasks, timeout=5.0)
 
         for task in pending:
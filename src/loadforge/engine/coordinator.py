@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import ctypes
 import multiprocessing
 import multiprocessing.process
-from typing import TYPE_CHECKING
+import os
+import time
+from array import array
+from typing import TYPE_CHECKING, Literal
 
 from loadforge._internal.logging import get_logger
 from loadforge.engine.protocol import WorkerCommand, WorkerResult
@@ -12,18 +16,43 @@ from loadforge.engine.worker import run_worker_process
 
 if TYPE_CHECKING:
     from multiprocessing import Queue as MpQueue
+    from multiprocessing.context import ForkServerContext, SpawnContext
 
-    from loadforge.dsl.http_client import RequestMetric
+    from loadforge.metrics.buffer import MetricBatch
 
 logger = get_logger("engine.coordinator")
 
+# Modules the fork server imports once, so each forked worker starts with
+# the engine, aiohttp, and NumPy already loaded instead of importing them.
+_FORKSERVER_PRELOAD = ["loadforge.engine.worker"]
+
+# Upper bound on the wait for workers to load the scenario and warm up.
+_READY_TIMEOUT = 60.0
+
+# Seconds between checks that workers are still alive while waiting.
+_READY_POLL_INTERVAL = 0.1
+
+
+def _default_start_method() -> Literal["forkserver", "spawn"]:
+    """Return ``"forkserver"`` where supported, otherwise ``"spawn"``.
+
+    Returns:
+        The multiprocessing start method used for workers by default.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return "forkserver"
+    return "spawn"
+
 
 class Coordinator:
     """Manages the lifecycle of N worker processes.
 
     Spawns worker processes, distributes concurrency targets across
     them, and handles graceful shutdown. Each worker gets its own
-    set of queues for commands, metrics, and results.
+    set of queues for commands, metrics, and results. Concurrency
+    targets are written to a shared array that workers read every
+    tick, so scaling needs no pickling or queue traffic; the command
+    queues only carry the final stop.
 
     Attributes:
         num_workers: Number of worker processes.
@@ -39,6 +68,9 @@ class Coordinator:
         tick_interval: float = 1.0,
         rate_limit: float | None = None,
         log_level: int = 20,
+        scenario_code: bytes | None = None,
+        warm_up_connections: int = 0,
+        start_method: Literal["forkserver", "spawn"] | None = None,
     ) -> None:
         """Initialize the coordinator.
 
@@ -49,6 +81,13 @@ class Coordinator:
             tick_interval: Seconds between ticks.
             rate_limit: Optional global max RPS (divided across workers).
             log_level: Logging level for workers.
+            scenario_code: Optional ``compile_scenario`` output for the
+                scenario file, so workers skip re-importing it.
+            warm_up_connections: Keep-alive connections each worker opens
+                before reporting ready. 0 (the default) skips warm-up.
+            start_method: Multiprocessing start method for workers.
+                Defaults to ``"forkserver"`` where available (Linux,
+                macOS) and ``"spawn"`` elsewhere.
         """
         self.scenario_path = scenario_path
         self.num_workers = num_workers
@@ -56,18 +95,31 @@ class Coordinator:
         self._tick_interval = tick_interval
         self._rate_limit = rate_limit
         self._log_level = log_level
+        self._scenario_code = scenario_code
+        self._warm_up_connections = warm_up_connections
 
-        self._ctx = multiprocessing.get_context("spawn")
+        self._ctx: ForkServerContext | SpawnContext
+        if (start_method or _default_start_method()) == "forkserver":
+            self._ctx = multiprocessing.get_context("forkserver")
+            # Only takes effect if the fork server is not running yet.
+            self._ctx.set_forkserver_preload(_FORKSERVER_PRELOAD)
+        else:
+            self._ctx = multiprocessing.get_context("spawn")
 
         # Per-worker queues
         self._command_queues: list[MpQueue[WorkerCommand]] = []
-        self._metric_queues: list[MpQueue[list[RequestMetric]]] = []
+        self._metric_queues: list[MpQueue[MetricBatch]] = []
         self._result_queues: list[MpQueue[WorkerResult]] = []
         self._processes: list[multiprocessing.process.BaseProcess] = []
-        self._current_targets: list[int] = [0] * num_workers
+        self._current_targets = array("i", [0]) * num_workers
+        # One slot per worker. Only this process writes, and each worker
+        # only reads its own slot, so no lock is needed.
+        self._target_slots = self._ctx.RawArray(ctypes.c_int, num_workers)
+        # Released once by each worker when it is ready to run users.
+        self._ready = self._ctx.Semaphore(0)
 
     @property
-    def metric_queues(self) -> list[MpQueue[list[RequestMetric]]]:
+    def metric_queues(self) -> list[MpQueue[MetricBatch]]:
         """Return the per-worker metric queues for the aggregator."""
         return self._metric_queues
 
@@ -79,16 +131,22 @@ class Coordinator:
     def start(self) -> None:
         """Spawn all worker processes.
 
-        Each worker re-imports the scenario file and begins listening
+        Each worker loads the scenario (from the precompiled code when
+        given, otherwise by importing the file) and begins listening
         for commands on its command queue.
         """
         per_worker_rate = (
             self._rate_limit / self.num_workers if self._rate_limit is not None else None
         )
+        cores = _worker_cores(self.num_workers)
+        # Forkserver children inherit the fork server's environment, which
+        # is frozen at the first start() in this process, so hand workers
+        # the current one explicitly, as spawn would.
+        environ = dict(os.environ)
 
         for i in range(self.num_workers):
             cmd_q: MpQueue[WorkerCommand] = self._ctx.Queue()
-            metric_q: MpQueue[list[RequestMetric]] = self._ctx.Queue()
+            metric_q: MpQueue[MetricBatch] = self._ctx.Queue()
             result_q: MpQueue[WorkerResult] = self._ctx.Queue()
 
             self._command_queues.append(cmd_q)
@@ -107,6 +165,12 @@ class Coordinator:
                     self._tick_interval,
                     per_worker_rate,
                     self._log_level,
+                    self._scenario_code,
+                    self._warm_up_connections,
+                    self._target_slots,
+                    cores[i],
+                    environ,
+                    self._ready,
                 ),
                 name=f"loadforge-worker-{i}",
                 daemon=False,
@@ -119,25 +183,47 @@ class Coordinator:
 
         logger.info("Started %d worker processes", self.num_workers)
 
+    def wait_until_ready(self, timeout: float = _READY_TIMEOUT) -> bool:
+        """Block until every worker has loaded the scenario and warmed up.
+
+        Callers start their test clock after this returns, so worker
+        startup is not counted as part of the run.
+
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            True if all workers reported ready, False if the timeout
+            expired or every worker exited first.
+        """
+        deadline = time.monotonic() + timeout
+        pending = len(self._processes)
+        while pending:
+            if self._ready.acquire(timeout=_READY_POLL_INTERVAL):
+                pending -= 1
+            elif time.monotonic() >= deadline or not self.is_alive:
+                logger.warning("%d of %d workers did not report ready", pending, self.num_workers)
+                return False
+        return True
+
     def scale_to(self, target_concurrency: int) -> None:
         """Distribute a global concurrency target across all workers.
 
-        Divides ``target_concurrency`` evenly across workers. The first
-        worker receives any remainder.
+        Divides ``target_concurrency`` evenly across workers. The
+        remainder is spread one user at a time over the first workers,
+        so no two workers differ by more than one user. Each worker
+        picks up its new target from the shared array on its next tick.
 
         Args:
             target_concurrency: Total desired virtual users across all workers.
         """
-        base = target_concurrency // self.num_workers
-        remainder = target_concurrency % self.num_workers
+        base, remainder = divmod(target_concurrency, self.num_workers)
 
         for i in range(self.num_workers):
-            per_worker = base + (remainder if i == 0 else 0)
+            per_worker = base + (1 if i < remainder else 0)
             if per_worker != self._current_targets[i]:
                 self._current_targets[i] = per_worker
-                self._command_queues[i].put(
-                    WorkerCommand(kind="scale", target_concurrency=per_worker)
-                )
+                self._target_slots[i] = per_worker
 
     def stop(self, timeout: float = 10.0) -> list[WorkerResult]:
         """Send stop commands and wait for all workers to exit.
@@ -186,3 +272,22 @@ class Coordinator:
 
         logger.info("All %d workers stopped", self.num_workers)
         return results
+
+
+def _worker_cores(num_workers: int) -> list[int | None]:
+    """Assign each worker its own CPU core, round-robin.
+
+    Only the cores this process may run on are used.
+
+    Args:
+        num_workers: Number of worker processes.
+
+    Returns:
+        The core for each worker, in worker-id order, or None for every
+        worker on platforms without ``os.sched_setaffinity`` (macOS,
+        Windows).
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return [None] * num_workers
+    cores = sorted(os.sched_getaffinity(0))
+    return [cores[i % len(cores)] for i in range(num_workers)]
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Literal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WorkerCommand:
     """Command sent from coordinator to a worker process.
 
@@ -20,7 +20,7 @@ class WorkerCommand:
     target_concurrency: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WorkerResult:
     """Result sent from a worker process back to the coordinator on exit.
 
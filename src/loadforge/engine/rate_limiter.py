@@ -17,6 +17,19 @@ class TokenBucketRateLimiter:
     When tokens are exhausted, ``acquire()`` awaits until a token becomes
     available.
 
+    The bucket is tracked as integer nanoseconds of debt rather than a
+    float token count: each token adds ``ns_per_token`` of debt, elapsed
+    time pays it off, and the bucket is empty once the debt exceeds
+    ``capacity`` tokens' worth. An acquire is one integer subtract, add,
+    and compare on ``time.monotonic_ns()``.
+
+    There is no lock. Each ``acquire()`` pays off and takes on debt in
+    one synchronous step, which no other coroutine on the event loop can
+    interleave with. If that leaves the bucket over capacity, the caller
+    has reserved the next token and sleeps once until it is replenished.
+    Waiters are served in arrival order, and none of them re-contend for
+    a lock after waking.
+
     Attributes:
         rate: Tokens added per second.
         capacity: Maximum token count (burst capacity).
@@ -42,9 +55,11 @@ class TokenBucketRateLimiter:
 
         self._rate = rate
         self._capacity = capacity if capacity is not None else rate
-        self._tokens = self._capacity
-        self._last_refill = time.monotonic()
-        self._lock = asyncio.Lock()
+        self._ns_per_token = max(1, round(1e9 / rate))
+        self._capacity_ns = round(self._capacity * self._ns_per_token)
+        # Nanoseconds until the bucket is full again; 0 means full.
+        self._debt_ns = 0
+        self._last_ns = time.monotonic_ns()
 
     @property
     def rate(self) -> float:
@@ -60,12 +75,12 @@ class TokenBucketRateLimiter:
     def available_tokens(self) -> float:
         """Return the current number of available tokens (approximate).
 
-        Performs a time-based refill calculation without acquiring the lock.
-        The result is approximate since another coroutine may modify tokens
-        concurrently.
+        Performs a time-based refill calculation without modifying the
+        bucket. Tokens already reserved by waiting coroutines are not
+        available, so the result is never negative.
         """
-        elapsed = time.monotonic() - self._last_refill
-        return min(self._capacity, self._tokens + elapsed * self._rate)
+        debt_ns = max(0, self._debt_ns - (time.monotonic_ns() - self._last_ns))
+        return max(0.0, (self._capacity_ns - debt_ns) / self._ns_per_token)
 
     async def acquire(self) -> None:
         """Acquire a single token, waiting if necessary.
@@ -73,25 +88,25 @@ class TokenBucketRateLimiter:
         Blocks the calling coroutine until a token is available. Uses
         ``asyncio.sleep()`` for the wait, allowing other coroutines to run.
         """
-        async with self._lock:
-            self._refill()
-            while self._tokens < 1.0:
-                wait_time = (1.0 - self._tokens) / self._rate
-                # Release lock during sleep so other coroutines can proceed
-                self._lock.release()
-                try:
-                    await asyncio.sleep(wait_time)
-                finally:
-                    await self._lock.acquire()
-                self._refill()
-            self._tokens -= 1.0
+        # No await between the refill and the deduction, so this is atomic
+        # with respect to other coroutines on the loop.
+        self._refill()
+        self._debt_ns += self._ns_per_token
+        wait_ns = self._debt_ns - self._capacity_ns
+        if wait_ns <= 0:
+            return
+        try:
+            await asyncio.sleep(wait_ns / 1e9)
+        except asyncio.CancelledError:
+            # Hand the reserved token back so later callers don't wait for it.
+            self._debt_ns -= self._ns_per_token
+            raise
 
     def _refill(self) -> None:
-        """Refill tokens based on elapsed time since last refill."""
-        now = time.monotonic()
-        elapsed = now - self._last_refill
-        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
-        self._last_refill = now
+        """Pay off debt for the time elapsed since the last refill."""
+        now_ns = time.monotonic_ns()
+        self._debt_ns = max(0, self._debt_ns - (now_ns - self._last_ns))
+        self._last_ns = now_ns
 
     def update_rate(self, new_rate: float) -> None:
         """Update the replenishment rate.
@@ -109,4 +124,9 @@ class TokenBucketRateLimiter:
             msg = f"rate must be positive, got {new_rate}"
             raise ValueError(msg)
         self._refill()
+        # Keep the token balance (debt measured in tokens) across the change.
+        new_ns_per_token = max(1, round(1e9 / new_rate))
+        self._debt_ns = round(self._debt_ns * new_ns_per_token / self._ns_per_token)
         self._rate = new_rate
+        self._ns_per_token = new_ns_per_token
+        self._capacity_ns = round(self._capacity * new_ns_per_token)
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import os
 import signal
+import threading
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from loadforge._internal.errors import EngineError
 from loadforge._internal.logging import get_logger, setup_logging
-from loadforge.dsl.loader import load_scenario
+from loadforge.dsl.loader import compile_scenario, load_scenario
 from loadforge.dsl.scenario import registry
 from loadforge.engine.coordinator import Coordinator
 from loadforge.engine.scheduler import Scheduler
@@ -50,6 +51,7 @@ class LoadTestRunner:
         rate_limit: float | None = None,
         on_snapshot: Callable[[MetricSnapshot], None] | None = None,
         log_level: int = 20,
+        warm_up: bool = False,
     ) -> None:
         """Initialize the runner.
 
@@ -62,6 +64,9 @@ class LoadTestRunner:
             rate_limit: Optional max requests per second (global).
             on_snapshot: Optional callback invoked with each MetricSnapshot.
             log_level: Logging level.
+            warm_up: Have each worker open keep-alive connections to the
+                base URL (unrecorded HEAD requests, up to its share of the
+                peak user count) before the test clock starts.
 
         Raises:
             EngineError: If the scenario file does not exist.
@@ -73,25 +78,26 @@ class LoadTestRunner:
         self._rate_limit = rate_limit
         self._on_snapshot = on_snapshot
         self._log_level = log_level
+        self._warm_up = warm_up
 
         # Determine worker count
         cpu_count = os.cpu_count() or 1
         self.num_workers = min(num_workers or cpu_count, cpu_count)
         # Don't spawn more workers than there will be users
-        max_users = _get_max_concurrency(pattern, duration_seconds, tick_interval)
-        if max_users > 0:
-            self.num_workers = min(self.num_workers, max_users)
+        self._peak_users = pattern.peak_concurrency(duration_seconds, tick_interval)
+        if self._peak_users > 0:
+            self.num_workers = min(self.num_workers, self._peak_users)
         self.num_workers = max(self.num_workers, 1)
 
         if not Path(self.scenario_path).exists():
             msg = f"Scenario file not found: {self.scenario_path}"
             raise EngineError(msg)
 
-        self._stop_requested = False
+        self._stop_event = threading.Event()
 
     def _should_stop(self) -> bool:
         """Check if a stop has been requested (e.g., via signal handler)."""
-        return self._stop_requested
+        return self._stop_event.is_set()
 
     def run(self) -> TestResult:
         """Execute the load test and return results.
@@ -111,8 +117,9 @@ class LoadTestRunner:
         # the same scenario file multiple times (e.g., in tests)
         registry.clear()
 
-        # Load scenario for metadata
-        scenario = load_scenario(self.scenario_path)
+        # Compile once; the parent and every worker exec the same code.
+        scenario_code = compile_scenario(self.scenario_path)
+        scenario = load_scenario(self.scenario_path, code=scenario_code)
 
         logger.info(
             "Starting load test: scenario=%s, workers=%d, duration=%.1fs, pattern=%s",
@@ -130,6 +137,9 @@ class LoadTestRunner:
             tick_interval=self._tick_interval,
             rate_limit=self._rate_limit,
             log_level=self._log_level,
+            scenario_code=scenario_code,
+            # Each worker warms its pool for its share of the peak.
+            warm_up_connections=(-(-self._peak_users // self.num_workers) if self._warm_up else 0),
         )
         aggregator = MetricAggregator(
             metric_queues=coordinator.metric_queues,
@@ -141,39 +151,35 @@ class LoadTestRunner:
         # Install signal handlers
         original_sigint = signal.getsignal(signal.SIGINT)
         original_sigterm = signal.getsignal(signal.SIGTERM)
-        self._stop_requested = False
+        self._stop_event.clear()
 
         def _signal_handler(signum: int, _frame: object) -> None:
             logger.info("Signal %d received, initiating graceful shutdown", signum)
-            self._stop_requested = True
+            # Event.set() takes a lock that the interrupted Event.wait() in
+            # this same thread may hold, so set it from another thread.
+            threading.Thread(target=self._stop_event.set, name="loadforge-stop").start()
 
         signal.signal(signal.SIGINT, _signal_handler)
         signal.signal(signal.SIGTERM, _signal_handler)
 
-        start_time = time.monotonic()
-
         try:
             coordinator.start()
+            # Start the clock once workers have loaded the scenario (and
+            # warmed up), so their startup is not part of the run.
+            coordinator.wait_until_ready()
+            start_time = time.monotonic()
             aggregator.start()
 
+            # Workers only need a message when their target changes; the
+            # aggregator ticks on its own thread, so HOLD ticks are skipped.
             scheduler = Scheduler(self._pattern, self._duration_seconds, self._tick_interval)
+            commands = scheduler.scale_points()
 
-            for command in scheduler.iter_commands():
-                if self._should_stop():
-                    break
-
-                # Wait until the right time for this tick, checking for
-                # stop signal every 100ms
-                target_time = start_time + command.elapsed_seconds
-                now = time.monotonic()
-                while target_time > now:
-                    sleep_time = min(target_time - now, 0.1)
-                    time.sleep(sleep_time)
-                    if self._should_stop():
-                        break
-                    now = time.monotonic()
-
-                if self._should_stop():
+            for command in commands:
+                # Sleep until this tick is due; a stop signal ends the wait
+                # immediately instead of at the next poll.
+                delay = start_time + command.elapsed_seconds - time.monotonic()
+                if self._stop_event.wait(timeout=max(delay, 0.0)):
                     break
 
                 coordinator.scale_to(command.target_concurrency)
@@ -224,25 +230,3 @@ class LoadTestRunner:
             snapshots=snapshots,
             final_summary=final_summary,
         )
-
-
-def _get_max_concurrency(
-    pattern: LoadPattern,
-    duration_seconds: float,
-    tick_interval: float,
-) -> int:
-    """Compute the maximum concurrency from a pattern.
-
-    Args:
-        pattern: Load pattern to inspect.
-        duration_seconds: Test duration.
-        tick_interval: Tick interval.
-
-    Returns:
-        Maximum concurrency value, or 0 if pattern yields nothing.
-    """
-    max_users = 0
-    for _elapsed, concurrency in pattern.iter_concurrency(duration_seconds, tick_interval):
-        if concurrency > max_users:
-            max_users = concurrency
-    return max_users
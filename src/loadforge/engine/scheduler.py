@@ -20,7 +20,7 @@ class ScaleDirection(Enum):
     HOLD = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScaleCommand:
     """A command to adjust the number of active virtual users.
 
@@ -80,22 +80,62 @@ class Scheduler:
             self._duration_seconds, self._tick_interval
         ):
             delta = target - prev_concurrency
-            if delta > 0:
-                direction = ScaleDirection.UP
-            elif delta < 0:
-                direction = ScaleDirection.DOWN
-            else:
-                direction = ScaleDirection.HOLD
-
             yield ScaleCommand(
                 elapsed_seconds=elapsed,
                 target_concurrency=target,
-                direction=direction,
+                direction=_direction(delta),
                 delta=abs(delta),
             )
             prev_concurrency = target
 
+    def scale_points(self) -> list[ScaleCommand]:
+        """Return the commands at which the target concurrency changes.
+
+        ``HOLD`` ticks are dropped, except that the first and last ticks
+        are always kept so a consumer that sleeps between commands still
+        starts at time zero and runs for the full duration. Callers that
+        need every tick (for example to flush metrics) should use
+        ``iter_commands`` instead.
+
+        Reads the pattern directly, so no ``ScaleCommand`` is built for
+        the dropped ticks.
+
+        Returns:
+            The materialized, time-ordered list of commands.
+        """
+        commands: list[ScaleCommand] = []
+        prev_concurrency = 0
+        last: tuple[float, int] | None = None
+        for elapsed, target in self._pattern.iter_concurrency(
+            self._duration_seconds, self._tick_interval
+        ):
+            delta = target - prev_concurrency
+            if delta or not commands:
+                commands.append(ScaleCommand(elapsed, target, _direction(delta), abs(delta)))
+            prev_concurrency = target
+            last = (elapsed, target)
+
+        if last is not None and commands[-1].elapsed_seconds != last[0]:
+            commands.append(ScaleCommand(last[0], last[1], ScaleDirection.HOLD, 0))
+        return commands
+
     @property
     def total_ticks(self) -> int:
         """Return the expected number of ticks for this schedule."""
         return int(self._duration_seconds / self._tick_interval) + 1
+
+
+def _direction(delta: int) -> ScaleDirection:
+    """Classify a concurrency change.
+
+    Args:
+        delta: New target minus the previous target.
+
+    Returns:
+        UP, DOWN, or HOLD.
+    """
+    if delta > 0:
+        return ScaleDirection.UP
+    if delta < 0:
+        return ScaleDirection.DOWN
+    return ScaleDirection.HOLD
@@ -3,8 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
-import random
 import signal
 import sys
 import time
@@ -14,13 +12,23 @@ from typing import TYPE_CHECKING
 from loadforge._internal.errors import EngineError
 from loadforge._internal.logging import get_logger
 from loadforge.dsl.http_client import HttpClient
-from loadforge.engine._user_utils import pick_weighted_task, shutdown_all_users
+from loadforge.engine._user_utils import (
+    cancel_newest_users,
+    create_shared_connector,
+    shutdown_all_users,
+    sleep_until,
+    track_user_task,
+    user_seed,
+    warm_up_connector,
+)
 from loadforge.engine.rate_limiter import TokenBucketRateLimiter
 from loadforge.engine.scheduler import Scheduler
 from loadforge.metrics.collector import MetricCollector
 from loadforge.metrics.models import MetricSnapshot, TestResult
 
 if TYPE_CHECKING:
+    import aiohttp
+
     from loadforge.dsl.scenario import ScenarioDefinition
     from loadforge.patterns.base import LoadPattern
 
@@ -61,6 +69,7 @@ class TestSession:
         tick_interval: float = 1.0,
         rate_limit: float | None = None,
         worker_id: int = 0,
+        warm_up: bool = False,
     ) -> None:
         """Initialize a test session.
 
@@ -72,6 +81,9 @@ class TestSession:
             rate_limit: Optional max requests per second (token bucket).
                 None means no rate limit (concurrency-based only).
             worker_id: Worker identifier for metric tagging.
+            warm_up: Open keep-alive connections to the base URL (unrecorded
+                HEAD requests, up to the peak user count) before the clock
+                starts.
         """
         self._scenario = scenario
         self._pattern = pattern
@@ -79,11 +91,13 @@ class TestSession:
         self._tick_interval = tick_interval
         self._rate_limit = rate_limit
         self._worker_id = worker_id
+        self._warm_up = warm_up
 
         self._state = SessionState.CREATED
         self._collector = MetricCollector(worker_id=worker_id)
         self._rate_limiter: TokenBucketRateLimiter | None = None
-        self._user_tasks: list[tuple[int, asyncio.Task[None]]] = []
+        self._connector: aiohttp.TCPConnector | None = None
+        self._user_tasks: dict[int, asyncio.Task[None]] = {}
         self._next_user_id = 0
         self._stop_event = asyncio.Event()
 
@@ -115,30 +129,34 @@ class TestSession:
             self._pattern.describe(),
         )
 
-        self._install_signal_handlers()
-
         if self._rate_limit is not None:
             self._rate_limiter = TokenBucketRateLimiter(rate=self._rate_limit)
 
         scheduler = Scheduler(self._pattern, self._duration_seconds, self._tick_interval)
-
-        start_time = time.monotonic()
         snapshots: list[MetricSnapshot] = []
 
-        self._state = SessionState.RUNNING
+        loop = asyncio.get_running_loop()
+        connector = create_shared_connector()
+        self._connector = connector
+        self._install_signal_handlers(loop)
 
         try:
-            for command in scheduler.iter_commands():
-                if self._stop_event.is_set():
-                    break
+            if self._warm_up:
+                await warm_up_connector(
+                    connector,
+                    self._scenario.base_url,
+                    self._pattern.peak_concurrency(self._duration_seconds, self._tick_interval),
+                )
 
-                # Wait until the right time for this tick
-                target_time = start_time + command.elapsed_seconds
-                now = time.monotonic()
-                if target_time > now:
-                    await asyncio.sleep(target_time - now)
+            # The clock starts after warm-up, so it is not part of the run.
+            start_time = time.monotonic()
+            # Tick deadlines are on the event loop's clock (see sleep_until).
+            loop_start = loop.time()
+            self._state = SessionState.RUNNING
 
-                if self._stop_event.is_set():
+            for command in scheduler.iter_commands():
+                # Wait until the right time for this tick
+                if await sleep_until(loop_start + command.elapsed_seconds, self._stop_event):
                     break
 
                 # Adjust concurrency
@@ -170,7 +188,8 @@ class TestSession:
             if self._state != SessionState.FAILED:
                 self._state = SessionState.STOPPING
             await shutdown_all_users(self._user_tasks, self._stop_event)
-            self._remove_signal_handlers()
+            await connector.close()
+            self._remove_signal_handlers(loop)
 
         end_time = time.monotonic()
         total_duration = end_time - start_time
@@ -224,12 +243,14 @@ class TestSession:
         Args:
             user_id: Unique identifier for this virtual user.
         """
-        instance = self._scenario.cls()
+        instance = self._scenario.new_instance()
         async with HttpClient(
             base_url=self._scenario.base_url,
-            headers=dict(self._scenario.default_headers),
-            metric_callback=self._collector.record,
+            headers=self._scenario.default_headers,
+            metric_buffer=self._collector.buffer,
             worker_id=self._worker_id,
+            connector=self._connector,
+            seed=user_seed(self._worker_id, user_id),
         ) as client:
             try:
                 # Setup phase
@@ -238,7 +259,7 @@ class TestSession:
 
                 # Task loop
                 while not self._stop_event.is_set():
-                    task_def = pick_weighted_task(self._scenario.tasks)
+                    task_def = self._scenario.task_picker.pick(client.rng.random)
                     try:
                         if self._rate_limiter is not None:
                             await self._rate_limiter.acquire()
@@ -254,8 +275,9 @@ class TestSession:
                         )
 
                     # Think time
-                    min_t, max_t = self._scenario.think_time
-                    await asyncio.sleep(random.uniform(min_t, max_t))  # noqa: S311
+                    await asyncio.sleep(
+                        self._scenario.think_time_sampler.sample(client.rng.random)
+                    )
 
             except asyncio.CancelledError:
                 pass
@@ -288,28 +310,21 @@ class TestSession:
                     self._run_virtual_user(user_id),
                     name=f"virtual-user-{user_id}",
                 )
-                self._user_tasks.append((user_id, task))
+                track_user_task(self._user_tasks, user_id, task)
 
         elif target < current:
             # Scale down: cancel most recently created (LIFO)
-            to_remove = current - target
-            for _ in range(to_remove):
-                if self._user_tasks:
-                    _uid, task = self._user_tasks.pop()
-                    task.cancel()
-                    with contextlib.suppress(asyncio.CancelledError, TimeoutError):
-                        await asyncio.wait_for(asyncio.shield(task), timeout=2.0)
-
-        # Clean up completed tasks
-        self._user_tasks = [(uid, t) for uid, t in self._user_tasks if not t.done()]
-
-    def _install_signal_handlers(self) -> None:
+            await cancel_newest_users(self._user_tasks, current - target)
+
+    def _install_signal_handlers(self, loop: asyncio.AbstractEventLoop) -> None:
         """Install SIGINT and SIGTERM handlers for graceful shutdown.
 
         Handlers transition the session to STOPPING state, which causes
         the main loop to exit after the current tick.
+
+        Args:
+            loop: The running event loop.
         """
-        loop = asyncio.get_running_loop()
 
         def _signal_handler() -> None:
             logger.info("Signal received, initiating graceful shutdown")
@@ -324,10 +339,13 @@ class TestSession:
             signal.signal(signal.SIGINT, lambda _s, _f: _signal_handler())
             signal.signal(signal.SIGTERM, lambda _s, _f: _signal_handler())
 
-    def _remove_signal_handlers(self) -> None:
-        """Remove custom signal handlers, restoring defaults."""
+    def _remove_signal_handlers(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Remove custom signal handlers, restoring defaults.
+
+        Args:
+            loop: The event loop the handlers were installed on.
+        """
         if sys.platform != "win32":
-            loop = asyncio.get_running_loop()
             for sig in (signal.SIGINT, signal.SIGTERM):
                 loop.remove_signal_handler(sig)
         else:
@@ -3,50 +3,44 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
+import os
 import queue
-import random
-import sys
-import time
 from typing import TYPE_CHECKING
 
+from loadforge._internal.config import load_config
 from loadforge._internal.logging import get_logger, setup_logging
+from loadforge._internal.runtime import install_event_loop
 from loadforge.dsl.http_client import HttpClient
-from loadforge.engine._user_utils import pick_weighted_task, shutdown_all_users
+from loadforge.engine._user_utils import (
+    cancel_newest_users,
+    create_shared_connector,
+    next_tick,
+    shutdown_all_users,
+    sleep_until,
+    track_user_task,
+    user_seed,
+    warm_up_connector,
+)
 from loadforge.engine.protocol import WorkerCommand, WorkerResult
 from loadforge.engine.rate_limiter import TokenBucketRateLimiter
 from loadforge.engine.session import TestSession
 from loadforge.metrics.collector import MetricCollector
 
 if TYPE_CHECKING:
+    import ctypes
     from multiprocessing import Queue as MpQueue
+    from multiprocessing.synchronize import Semaphore
+
+    import aiohttp
 
-    from loadforge.dsl.http_client import RequestMetric
     from loadforge.dsl.scenario import ScenarioDefinition
+    from loadforge.metrics.buffer import MetricBatch
     from loadforge.metrics.models import TestResult
     from loadforge.patterns.base import LoadPattern
 
 logger = get_logger("engine.worker")
 
 
-def _install_uvloop() -> None:
-    """Install uvloop as the default event loop policy if available.
-
-    Falls back silently to the default asyncio event loop on Windows
-    or if uvloop is not installed.
-    """
-    if sys.platform == "win32":
-        return
-
-    try:
-        import uvloop
-
-        uvloop.install()
-        logger.debug("uvloop installed as event loop policy")
-    except ImportError:
-        logger.debug("uvloop not available, using default asyncio event loop")
-
-
 def run_worker(
     scenario: ScenarioDefinition,
     pattern: LoadPattern,
@@ -60,8 +54,8 @@ def run_worker(
     """Execute a load test in the current process.
 
     This is the main entry point for Phase 3 single-worker execution.
-    Installs uvloop, sets up logging, creates a TestSession, and runs
-    it to completion.
+    Installs the configured event loop (uvloop by default), sets up
+    logging, creates a TestSession, and runs it to completion.
 
     Args:
         scenario: The scenario definition to execute.
@@ -78,7 +72,7 @@ def run_worker(
     Raises:
         EngineError: If the test fails to execute.
     """
-    _install_uvloop()
+    install_event_loop()
     setup_logging(level=log_level)
 
     return asyncio.run(
@@ -134,13 +128,19 @@ async def _run_session(
 def run_worker_process(
     scenario_path: str,
     command_queue: MpQueue[WorkerCommand],
-    metric_queue: MpQueue[list[RequestMetric]],
+    metric_queue: MpQueue[MetricBatch],
     result_queue: MpQueue[WorkerResult],
     worker_id: int,
     duration_seconds: float,
     tick_interval: float = 1.0,
     rate_limit: float | None = None,
     log_level: int = 20,
+    scenario_code: bytes | None = None,
+    warm_up_connections: int = 0,
+    target_slots: ctypes.Array[ctypes.c_int] | None = None,
+    cpu_core: int | None = None,
+    environ: dict[str, str] | None = None,
+    ready: Semaphore | None = None,
 ) -> None:
     """Entry point for a worker subprocess.
 
@@ -151,16 +151,30 @@ def run_worker_process(
     Args:
         scenario_path: Absolute path to the scenario .py file.
         command_queue: Queue receiving WorkerCommand from coordinator.
-        metric_queue: Queue for sending RequestMetric batches to aggregator.
+        metric_queue: Queue for sending MetricBatch objects to aggregator.
         result_queue: Queue for sending WorkerResult on exit.
         worker_id: Worker process identifier.
         duration_seconds: Maximum test duration in seconds.
         tick_interval: Seconds between ticks.
         rate_limit: Optional max requests per second for this worker.
         log_level: Logging level.
+        scenario_code: Optional ``compile_scenario`` output for the
+            scenario file, executed instead of re-importing it.
+        warm_up_connections: Keep-alive connections to open before the
+            worker reports ready. 0 (the default) skips warm-up.
+        target_slots: Optional shared array of per-worker concurrency
+            targets, read at index ``worker_id`` every tick.
+        cpu_core: Optional CPU core to pin this process to (Linux only).
+        environ: Optional parent environment to run with. Replaces the
+            inherited one, which under forkserver can be out of date.
+        ready: Optional semaphore released once the scenario is loaded and
+            the pool warmed up, just before the worker's clock starts.
     """
-    _install_uvloop()
+    if environ is not None:
+        _apply_environ(environ)
     setup_logging(level=log_level)
+    if cpu_core is not None:
+        _pin_to_core(worker_id, cpu_core)
 
     from loadforge.dsl.loader import load_scenario
 
@@ -170,7 +184,8 @@ def run_worker_process(
     error_message: str | None = None
 
     try:
-        scenario = load_scenario(scenario_path)
+        install_event_loop()
+        scenario = load_scenario(scenario_path, code=scenario_code)
         result = asyncio.run(
             _run_worker_loop(
                 scenario=scenario,
@@ -180,6 +195,9 @@ def run_worker_process(
                 duration_seconds=duration_seconds,
                 tick_interval=tick_interval,
                 rate_limit=rate_limit,
+                warm_up_connections=warm_up_connections,
+                target_slots=target_slots,
+                ready=ready,
             )
         )
         total_requests, error_count = result
@@ -201,29 +219,70 @@ def run_worker_process(
         )
 
 
+def _apply_environ(environ: dict[str, str]) -> None:
+    """Replace this process's environment with the parent's.
+
+    Also drops any cached ``load_config()`` result, so ``LOADFORGE_*``
+    settings are read from the new environment.
+
+    Args:
+        environ: Environment variables to run with.
+    """
+    os.environ.clear()
+    os.environ.update(environ)
+    load_config.cache_clear()
+
+
+def _pin_to_core(worker_id: int, core: int) -> None:
+    """Pin the current process to one CPU core.
+
+    Done first thing in the worker, before the event loop and connection
+    pool exist, so the scheduler never migrates the worker and its
+    memory is first touched from that core. Failures are logged and the
+    worker runs unpinned.
+
+    Args:
+        worker_id: Worker process identifier, for logging.
+        core: CPU core to run on.
+    """
+    try:
+        os.sched_setaffinity(0, {core})
+    except (AttributeError, OSError) as exc:
+        logger.debug("Worker %d: could not pin to core %d: %s", worker_id, core, exc)
+
+
 async def _run_worker_loop(
     scenario: ScenarioDefinition,
     command_queue: MpQueue[WorkerCommand],
-    metric_queue: MpQueue[list[RequestMetric]],
+    metric_queue: MpQueue[MetricBatch],
     worker_id: int,
     duration_seconds: float,
     tick_interval: float,
     rate_limit: float | None,
+    warm_up_connections: int = 0,
+    target_slots: ctypes.Array[ctypes.c_int] | None = None,
+    ready: Semaphore | None = None,
 ) -> tuple[int, int]:
     """Async event loop for a managed worker process.
 
-    Polls the command queue each tick for scale/stop commands, manages
+    Reads this worker's target from ``target_slots`` and polls the
+    command queue each tick for scale/stop commands, manages
     virtual users as asyncio tasks, and flushes metrics to the metric
     queue.
 
     Args:
         scenario: Loaded scenario definition.
         command_queue: Queue receiving WorkerCommand from coordinator.
-        metric_queue: Queue for sending RequestMetric batches to aggregator.
+        metric_queue: Queue for sending MetricBatch objects to aggregator.
         worker_id: Worker process identifier.
         duration_seconds: Maximum test duration in seconds.
         tick_interval: Seconds between ticks.
         rate_limit: Optional max requests per second.
+        warm_up_connections: Keep-alive connections to open before the
+            worker reports ready. 0 (the default) skips warm-up.
+        target_slots: Optional shared array of per-worker concurrency
+            targets written by the coordinator.
+        ready: Optional semaphore released just before the clock starts.
 
     Returns:
         Tuple of (total_requests, error_count).
@@ -233,21 +292,30 @@ async def _run_worker_loop(
     if rate_limit is not None:
         rate_limiter = TokenBucketRateLimiter(rate=rate_limit)
 
-    user_tasks: list[tuple[int, asyncio.Task[None]]] = []
+    connector = create_shared_connector()
+    await warm_up_connector(connector, scenario.base_url, warm_up_connections)
+    if ready is not None:
+        ready.release()
+    user_tasks: dict[int, asyncio.Task[None]] = {}
     next_user_id = 0
+    applied_target = 0
     stop_event = asyncio.Event()
-    start_time = time.monotonic()
+    # All timing uses the event loop's clock, which tick deadlines need.
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    tick = 0
     total_requests = 0
     total_errors = 0
 
     try:
         while not stop_event.is_set():
-            elapsed = time.monotonic() - start_time
+            elapsed = loop.time() - start_time
             if elapsed >= duration_seconds:
                 break
 
-            # Poll command queue
-            while True:
+            # Poll command queue. empty() is a lock-free poll of the pipe,
+            # so idle ticks skip get_nowait()'s lock and queue.Empty raise.
+            while not command_queue.empty():
                 try:
                     cmd = command_queue.get_nowait()
                 except (queue.Empty, EOFError):
@@ -257,7 +325,7 @@ async def _run_worker_loop(
                     stop_event.set()
                     break
                 if cmd.kind == "scale":
-                    user_tasks, next_user_id = await _scale_users(
+                    next_user_id = await _scale_users(
                         target=cmd.target_concurrency,
                         user_tasks=user_tasks,
                         next_user_id=next_user_id,
@@ -266,11 +334,28 @@ async def _run_worker_loop(
                         rate_limiter=rate_limiter,
                         worker_id=worker_id,
                         stop_event=stop_event,
+                        connector=connector,
                     )
 
             if stop_event.is_set():
                 break
 
+            if target_slots is not None:
+                target = int(target_slots[worker_id])
+                if target != applied_target:
+                    applied_target = target
+                    next_user_id = await _scale_users(
+                        target=target,
+                        user_tasks=user_tasks,
+                        next_user_id=next_user_id,
+                        scenario=scenario,
+                        collector=collector,
+                        rate_limiter=rate_limiter,
+                        worker_id=worker_id,
+                        stop_event=stop_event,
+                        connector=connector,
+                    )
+
             # Flush metrics and send batch
             snapshot = collector.flush(
                 elapsed_seconds=elapsed,
@@ -288,16 +373,16 @@ async def _run_worker_loop(
                 metric_queue.put(drained)
 
             # Sleep until next tick
-            next_tick_time = start_time + (elapsed // tick_interval + 1) * tick_interval
-            sleep_time = next_tick_time - time.monotonic()
-            if sleep_time > 0 and not stop_event.is_set():
-                await asyncio.sleep(sleep_time)
+            tick = next_tick(tick, start_time, tick_interval, loop.time())
+            if await sleep_until(start_time + tick * tick_interval, stop_event):
+                break
 
     finally:
         await shutdown_all_users(user_tasks, stop_event)
+        await connector.close()
 
         # Final flush
-        final_elapsed = time.monotonic() - start_time
+        final_elapsed = loop.time() - start_time
         final_snapshot = collector.flush(
             elapsed_seconds=final_elapsed,
             active_users=0,
@@ -318,6 +403,7 @@ async def _run_virtual_user(
     rate_limiter: TokenBucketRateLimiter | None,
     worker_id: int,
     stop_event: asyncio.Event,
+    connector: aiohttp.BaseConnector,
 ) -> None:
     """Run a single virtual user lifecycle in a managed worker.
 
@@ -328,13 +414,16 @@ async def _run_virtual_user(
         rate_limiter: Optional rate limiter.
         worker_id: Worker process identifier.
         stop_event: Event signaling shutdown.
+        connector: Connection pool shared by the worker's users.
     """
-    instance = scenario.cls()
+    instance = scenario.new_instance()
     async with HttpClient(
         base_url=scenario.base_url,
-        headers=dict(scenario.default_headers),
-        metric_callback=collector.record,
+        headers=scenario.default_headers,
+        metric_buffer=collector.buffer,
         worker_id=worker_id,
+        connector=connector,
+        seed=user_seed(worker_id, user_id),
     ) as client:
         try:
             # Setup phase
@@ -343,7 +432,7 @@ async def _run_virtual_user(
 
             # Task loop
             while not stop_event.is_set():
-                task_def = pick_weighted_task(scenario.tasks)
+                task_def = scenario.task_picker.pick(client.rng.random)
                 try:
                     if rate_limiter is not None:
                         await rate_limiter.acquire()
@@ -359,8 +448,7 @@ async def _run_virtual_user(
                     )
 
                 # Think time
-                min_t, max_t = scenario.think_time
-                await asyncio.sleep(random.uniform(min_t, max_t))  # noqa: S311
+                await asyncio.sleep(scenario.think_time_sampler.sample(client.rng.random))
 
         except asyncio.CancelledError:
             pass
@@ -378,31 +466,33 @@ async def _run_virtual_user(
 
 async def _scale_users(
     target: int,
-    user_tasks: list[tuple[int, asyncio.Task[None]]],
+    user_tasks: dict[int, asyncio.Task[None]],
     next_user_id: int,
     scenario: ScenarioDefinition,
     collector: MetricCollector,
     rate_limiter: TokenBucketRateLimiter | None,
     worker_id: int,
     stop_event: asyncio.Event,
-) -> tuple[list[tuple[int, asyncio.Task[None]]], int]:
+    connector: aiohttp.BaseConnector,
+) -> int:
     """Adjust the number of active virtual users to match target.
 
+    ``user_tasks`` is updated in place.
+
     Args:
         target: Desired number of active virtual users.
-        user_tasks: Current list of (user_id, task) tuples.
+        user_tasks: Live tasks keyed by user ID.
         next_user_id: Next user ID to assign.
         scenario: Scenario definition.
         collector: Metric collector.
         rate_limiter: Optional rate limiter.
         worker_id: Worker identifier.
         stop_event: Shutdown event.
+        connector: Connection pool shared by the worker's users.
 
     Returns:
-        Updated (user_tasks, next_user_id) tuple.
+        The next user ID to assign.
     """
-    # Clean up completed tasks first
-    user_tasks = [(uid, t) for uid, t in user_tasks if not t.done()]
     current = len(user_tasks)
 
     if target > current:
@@ -417,17 +507,12 @@ async def _scale_users(
                     rate_limiter=rate_limiter,
                     worker_id=worker_id,
                     stop_event=stop_event,
+                    connector=connector,
                 ),
                 name=f"worker-{worker_id}-user-{uid}",
             )
-            user_tasks.append((uid, task))
+            track_user_task(user_tasks, uid, task)
     elif target < current:
-        to_remove = current - target
-        for _ in range(to_remove):
-            if user_tasks:
-                _uid, task = user_tasks.pop()
-                task.cancel()
-                with contextlib.suppress(asyncio.CancelledError, TimeoutError):
-                    await asyncio.wait_for(asyncio.shield(task), timeout=2.0)
-
-    return user_tasks, next_user_id
+        await cancel_newest_users(user_tasks, current - target)
+
+    return next_user_id
@@ -13,27 +13,33 @@ import time
 from collections import defaultdict
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from loadforge._internal.logging import get_logger
-from loadforge.metrics.histogram import HdrHistogramWrapper
-from loadforge.metrics.models import EndpointMetrics, MetricSnapshot
+from loadforge.metrics.histogram import HdrHistogramWrapper, snapshot_from_histograms
 
 if TYPE_CHECKING:
     from collections.abc import Callable
     from multiprocessing import Queue as MpQueue
 
-    from loadforge.dsl.http_client import RequestMetric
+    import numpy.typing as npt
+
+    from loadforge.metrics.buffer import MetricBatch
+    from loadforge.metrics.models import MetricSnapshot
     from loadforge.metrics.store import MetricStore
 
 logger = get_logger("metrics.aggregator")
 
-_OVERALL_PERCENTILES = (50.0, 75.0, 90.0, 95.0, 99.0, 99.9)
-_ENDPOINT_PERCENTILES = (50.0, 75.0, 90.0, 95.0, 99.0)
+# Error counts are kept in flat arrays indexed by status instead of dicts.
+# Real HTTP statuses are three digits; larger values (only possible through
+# a hand-fed MetricBuffer) still count as errors but aren't broken out.
+_STATUS_CODE_LIMIT = 1000
 
 
 class MetricAggregator:
     """Aggregates metrics from multiple worker processes.
 
-    Runs a daemon thread that reads ``RequestMetric`` batches from
+    Runs a daemon thread that reads ``MetricBatch`` objects from
     per-worker ``multiprocessing.Queue`` objects, updates HDR histograms,
     and emits ``MetricSnapshot`` objects each tick.
 
@@ -47,7 +53,7 @@ class MetricAggregator:
 
     def __init__(
         self,
-        metric_queues: list[MpQueue[list[RequestMetric]]],
+        metric_queues: list[MpQueue[MetricBatch]],
         store: MetricStore,
         *,
         on_snapshot: Callable[[MetricSnapshot], None] | None = None,
@@ -83,7 +89,7 @@ class MetricAggregator:
         # Per-tick counters (reset each tick)
         self._tick_request_count = 0
         self._tick_error_count = 0
-        self._tick_errors_by_status: dict[int, int] = defaultdict(int)
+        self._tick_errors_by_status = np.zeros(_STATUS_CODE_LIMIT, dtype=np.int64)
         self._tick_errors_by_type: dict[str, int] = defaultdict(int)
         self._tick_endpoint_counts: dict[str, int] = defaultdict(int)
         self._tick_endpoint_errors: dict[str, int] = defaultdict(int)
@@ -91,7 +97,7 @@ class MetricAggregator:
         # Cumulative counters
         self._total_request_count = 0
         self._total_error_count = 0
-        self._total_errors_by_status: dict[int, int] = defaultdict(int)
+        self._total_errors_by_status = np.zeros(_STATUS_CODE_LIMIT, dtype=np.int64)
         self._total_errors_by_type: dict[str, int] = defaultdict(int)
         self._total_endpoint_counts: dict[str, int] = defaultdict(int)
         self._total_endpoint_errors: dict[str, int] = defaultdict(int)
@@ -142,10 +148,11 @@ class MetricAggregator:
             endpoint_hists=self._cumulative_endpoints,
             request_count=self._total_request_count,
             error_count=self._total_error_count,
-            errors_by_status=dict(self._total_errors_by_status),
+            errors_by_status=_status_counts(self._total_errors_by_status),
             errors_by_type=dict(self._total_errors_by_type),
-            endpoint_counts=dict(self._total_endpoint_counts),
-            endpoint_errors=dict(self._total_endpoint_errors),
+            # Only read while building; not kept by the snapshot.
+            endpoint_counts=self._total_endpoint_counts,
+            endpoint_errors=self._total_endpoint_errors,
             elapsed_seconds=elapsed_seconds,
             interval=max(elapsed_seconds, 0.001),
         )
@@ -175,54 +182,61 @@ class MetricAggregator:
         for q in self._metric_queues:
             while True:
                 try:
-                    batch: list[RequestMetric] = q.get_nowait()
+                    batch: MetricBatch = q.get_nowait()
                 except (queue.Empty, EOFError, ValueError, OSError):
                     # ValueError/OSError: queue was closed during shutdown
                     break
                 self._process_batch(batch)
 
-    def _process_batch(self, batch: list[RequestMetric]) -> None:
-        """Process a batch of RequestMetric objects from a worker.
+    def _process_batch(self, batch: MetricBatch) -> None:
+        """Process a columnar batch of metrics from a worker.
 
         Args:
-            batch: List of metrics to aggregate.
+            batch: Metrics to aggregate.
         """
-        for metric in batch:
-            # Record latency in histograms
-            self._tick_overall.record_latency_ms(metric.latency_ms)
-            self._cumulative_overall.record_latency_ms(metric.latency_ms)
-
-            # Per-endpoint histograms
-            name = metric.name
+        if not len(batch):
+            return
+
+        latencies = batch.latency_ms
+        is_error = batch.error_mask()
+
+        # Record latency in histograms
+        self._tick_overall.record_latencies_ms(latencies)
+        self._cumulative_overall.record_latencies_ms(latencies)
+
+        # Request and error counts
+        count = len(batch)
+        error_count = int(np.count_nonzero(is_error))
+        self._tick_request_count += count
+        self._total_request_count += count
+        self._tick_error_count += error_count
+        self._total_error_count += error_count
+
+        statuses = batch.status_code
+        in_range = statuses[(statuses >= 400) & (statuses < _STATUS_CODE_LIMIT)]
+        status_errors = np.bincount(in_range, minlength=_STATUS_CODE_LIMIT)
+        self._tick_errors_by_status += status_errors
+        self._total_errors_by_status += status_errors
+        for error_type, n in batch.errors_by_type().items():
+            self._tick_errors_by_type[error_type] += n
+            self._total_errors_by_type[error_type] += n
+
+        # Per-endpoint histograms and counts
+        for name, ep_latencies, ep_errors in batch.group_by_name():
             if name not in self._tick_endpoints:
                 self._tick_endpoints[name] = HdrHistogramWrapper()
-            self._tick_endpoints[name].record_latency_ms(metric.latency_ms)
+            self._tick_endpoints[name].record_latencies_ms(ep_latencies)
 
             if name not in self._cumulative_endpoints:
                 self._cumulative_endpoints[name] = HdrHistogramWrapper()
-            self._cumulative_endpoints[name].record_latency_ms(metric.latency_ms)
-
-            # Request counts
-            self._tick_request_count += 1
-            self._total_request_count += 1
-            self._tick_endpoint_counts[name] += 1
-            self._total_endpoint_counts[name] += 1
-
-            # Error tracking
-            is_error = metric.error is not None or metric.status_code >= 400
-            if is_error:
-                self._tick_error_count += 1
-                self._total_error_count += 1
-                self._tick_endpoint_errors[name] += 1
-                self._total_endpoint_errors[name] += 1
-
-                if metric.status_code >= 400:
-                    self._tick_errors_by_status[metric.status_code] += 1
-                    self._total_errors_by_status[metric.status_code] += 1
-                if metric.error is not None:
-                    error_type = metric.error.split(":")[0].strip()
-                    self._tick_errors_by_type[error_type] += 1
-                    self._total_errors_by_type[error_type] += 1
+            self._cumulative_endpoints[name].record_latencies_ms(ep_latencies)
+
+            ep_count = len(ep_latencies)
+            self._tick_endpoint_counts[name] += ep_count
+            self._total_endpoint_counts[name] += ep_count
+            if ep_errors:
+                self._tick_endpoint_errors[name] += ep_errors
+                self._total_endpoint_errors[name] += ep_errors
 
     def _build_tick_snapshot(self, elapsed_seconds: float) -> MetricSnapshot:
         """Build a snapshot from per-tick state.
@@ -238,10 +252,11 @@ class MetricAggregator:
             endpoint_hists=self._tick_endpoints,
             request_count=self._tick_request_count,
             error_count=self._tick_error_count,
-            errors_by_status=dict(self._tick_errors_by_status),
+            errors_by_status=_status_counts(self._tick_errors_by_status),
             errors_by_type=dict(self._tick_errors_by_type),
-            endpoint_counts=dict(self._tick_endpoint_counts),
-            endpoint_errors=dict(self._tick_endpoint_errors),
+            # Only read while building; not kept by the snapshot.
+            endpoint_counts=self._tick_endpoint_counts,
+            endpoint_errors=self._tick_endpoint_errors,
             elapsed_seconds=elapsed_seconds,
             interval=self.tick_interval,
         )
@@ -280,52 +295,18 @@ class MetricAggregator:
         with self._active_users_lock:
             active_users = self._active_users
 
-        # Overall percentiles from histogram
-        error_rate = error_count / request_count if request_count > 0 else 0.0
-
-        # Per-endpoint metrics
-        endpoints: dict[str, EndpointMetrics] = {}
-        for name, hist in endpoint_hists.items():
-            ep_count = endpoint_counts.get(name, 0)
-            ep_errors = endpoint_errors.get(name, 0)
-            ep_error_rate = ep_errors / ep_count if ep_count > 0 else 0.0
-
-            endpoints[name] = EndpointMetrics(
-                name=name,
-                request_count=ep_count,
-                error_count=ep_errors,
-                error_rate=ep_error_rate,
-                requests_per_second=ep_count / interval,
-                latency_min=hist.get_min(),
-                latency_max=hist.get_max(),
-                latency_avg=hist.get_mean(),
-                latency_p50=hist.get_percentile(50.0),
-                latency_p75=hist.get_percentile(75.0),
-                latency_p90=hist.get_percentile(90.0),
-                latency_p95=hist.get_percentile(95.0),
-                latency_p99=hist.get_percentile(99.0),
-            )
-
-        return MetricSnapshot(
-            timestamp=time.monotonic(),
-            elapsed_seconds=elapsed_seconds,
-            active_users=active_users,
-            total_requests=request_count,
-            requests_per_second=request_count / interval,
-            latency_min=overall_hist.get_min(),
-            latency_max=overall_hist.get_max(),
-            latency_avg=overall_hist.get_mean(),
-            latency_p50=overall_hist.get_percentile(50.0),
-            latency_p75=overall_hist.get_percentile(75.0),
-            latency_p90=overall_hist.get_percentile(90.0),
-            latency_p95=overall_hist.get_percentile(95.0),
-            latency_p99=overall_hist.get_percentile(99.0),
-            latency_p999=overall_hist.get_percentile(99.9),
-            total_errors=error_count,
-            error_rate=error_rate,
+        return snapshot_from_histograms(
+            overall_hist=overall_hist,
+            endpoint_hists=endpoint_hists,
+            request_count=request_count,
+            error_count=error_count,
             errors_by_status=errors_by_status,
             errors_by_type=errors_by_type,
-            endpoints=endpoints,
+            endpoint_counts=endpoint_counts,
+            endpoint_errors=endpoint_errors,
+            elapsed_seconds=elapsed_seconds,
+            active_users=active_users,
+            interval=interval,
         )
 
     def _reset_tick_state(self) -> None:
@@ -334,7 +315,19 @@ class MetricAggregator:
         self._tick_endpoints.clear()
         self._tick_request_count = 0
         self._tick_error_count = 0
-        self._tick_errors_by_status.clear()
+        self._tick_errors_by_status.fill(0)
         self._tick_errors_by_type.clear()
         self._tick_endpoint_counts.clear()
         self._tick_endpoint_errors.clear()
+
+
+def _status_counts(counts: npt.NDArray[np.int64]) -> dict[int, int]:
+    """Convert a status-indexed count array to a dict of nonzero entries.
+
+    Args:
+        counts: Error counts indexed by HTTP status code.
+
+    Returns:
+        Mapping of status code to error count.
+    """
+    return {int(status): int(counts[status]) for status in np.flatnonzero(counts)}
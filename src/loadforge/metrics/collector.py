@@ -3,14 +3,23 @@
 from __future__ import annotations
 
 import time
-from collections import defaultdict, deque
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 import numpy as np
 
 from loadforge._internal.logging import get_logger
+from loadforge.metrics.buffer import MetricBatch, MetricBuffer
+from loadforge.metrics.histogram import (
+    ENDPOINT_QUANTILES,
+    OVERALL_QUANTILES,
+    HdrHistogramWrapper,
+    snapshot_from_histograms,
+)
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
+
     from loadforge.dsl.http_client import RequestMetric
 
 from loadforge.metrics.models import EndpointMetrics, MetricSnapshot
@@ -18,13 +27,9 @@ from loadforge.metrics.models import EndpointMetrics, MetricSnapshot
 logger = get_logger("metrics.collector")
 
 
-_OVERALL_QUANTILES = (50.0, 75.0, 90.0, 95.0, 99.0, 99.9)
-_ENDPOINT_QUANTILES = (50.0, 75.0, 90.0, 95.0, 99.0)
-
-
 def _compute_percentiles(
-    latencies: list[float],
-    quantiles: tuple[float, ...] = _OVERALL_QUANTILES,
+    latencies: npt.NDArray[np.float64],
+    quantiles: tuple[float, ...] = OVERALL_QUANTILES,
 ) -> tuple[float, float, float, list[float]]:
     """Compute min, max, avg, and percentile values for latencies.
 
@@ -36,30 +41,31 @@ def _compute_percentiles(
     Returns:
         Tuple of (min, max, avg, [percentile values]).
     """
-    if not latencies:
+    if latencies.size == 0:
         return (0.0, 0.0, 0.0, [0.0] * len(quantiles))
 
-    arr = np.array(latencies, dtype=np.float64)
-    pcts = np.percentile(arr, list(quantiles))
+    pcts = np.percentile(latencies, quantiles)
 
     return (
-        float(np.min(arr)),
-        float(np.max(arr)),
-        float(np.mean(arr)),
-        [float(p) for p in pcts],
+        float(latencies.min()),
+        float(latencies.max()),
+        float(latencies.mean()),
+        pcts.tolist(),
     )
 
 
 class MetricCollector:
-    """Collects RequestMetric objects in a thread-safe deque.
+    """Collects request metrics in a columnar ``MetricBuffer``.
 
-    The ``record`` method is designed to be passed as the
-    ``HttpClient.metric_callback`` parameter. It appends metrics to an
-    internal deque. The ``flush`` method drains the deque and computes
-    a ``MetricSnapshot`` for the interval.
+    ``buffer`` is passed to ``HttpClient`` as its ``metric_buffer`` so each
+    request is appended as a row of scalars. ``record`` accepts a
+    ``RequestMetric`` for callers that use ``metric_callback`` instead.
+    The ``flush`` method drains the buffer and computes a
+    ``MetricSnapshot`` for the interval.
 
-    This is the Phase 3 single-worker implementation. Phase 4 replaces it
-    with shared-memory ring buffers.
+    Interval snapshots are computed exactly from each drained batch.
+    The cumulative summary is kept in HDR histograms, so memory stays
+    flat for the length of the test.
 
     Attributes:
         worker_id: Worker process identifier for metric tagging.
@@ -72,13 +78,26 @@ class MetricCollector:
             worker_id: Worker process identifier.
         """
         self.worker_id = worker_id
-        self._buffer: deque[RequestMetric] = deque()
-        # TODO(phase-4): Replace _all_metrics list with HdrHistogram for O(1)
-        # memory cumulative tracking. Current list grows with request count.
-        self._all_metrics: list[RequestMetric] = []
-        self._last_drained: list[RequestMetric] = []
+        self._buffer = MetricBuffer(worker_id=worker_id)
+        self._last_drained: MetricBatch = self._buffer.drain()
         self._last_flush_time: float = time.monotonic()
 
+        # Cumulative state: HDR histograms and counters keep memory flat
+        # regardless of how many requests the test makes.
+        self._cumulative_overall = HdrHistogramWrapper()
+        self._cumulative_endpoints: dict[str, HdrHistogramWrapper] = {}
+        self._total_request_count = 0
+        self._total_error_count = 0
+        self._total_errors_by_status: dict[int, int] = defaultdict(int)
+        self._total_errors_by_type: dict[str, int] = defaultdict(int)
+        self._total_endpoint_counts: dict[str, int] = defaultdict(int)
+        self._total_endpoint_errors: dict[str, int] = defaultdict(int)
+
+    @property
+    def buffer(self) -> MetricBuffer:
+        """Return the buffer that HTTP clients append metrics to."""
+        return self._buffer
+
     @property
     def pending_count(self) -> int:
         """Return the number of unprocessed metrics in the buffer."""
@@ -87,14 +106,19 @@ class MetricCollector:
     def record(self, metric: RequestMetric) -> None:
         """Append a metric to the collection buffer.
 
-        This method is designed to be used as ``HttpClient.metric_callback``.
-        It is safe to call from async code (appending to a deque is atomic
-        in CPython).
+        This method can be used as ``HttpClient.metric_callback``. Passing
+        ``buffer`` as ``HttpClient.metric_buffer`` avoids creating the
+        ``RequestMetric`` in the first place.
 
         Args:
             metric: The request metric to record.
         """
-        self._buffer.append(metric)
+        self._buffer.append(
+            metric.name,
+            metric.status_code,
+            round(metric.latency_ms * 1e6),
+            metric.error,
+        )
 
     def flush(
         self,
@@ -103,7 +127,7 @@ class MetricCollector:
     ) -> MetricSnapshot:
         """Drain the buffer and compute an aggregated snapshot.
 
-        Removes all pending metrics from the deque, computes per-endpoint
+        Removes all pending metrics from the buffer, computes per-endpoint
         and overall aggregate statistics, and returns a ``MetricSnapshot``.
 
         Args:
@@ -113,13 +137,7 @@ class MetricCollector:
         Returns:
             A MetricSnapshot summarizing all metrics flushed in this call.
         """
-        # Drain buffer
-        drained: list[RequestMetric] = []
-        while self._buffer:
-            drained.append(self._buffer.popleft())
-
-        # Track cumulative state and save for get_drained_metrics()
-        self._all_metrics.extend(drained)
+        drained = self._buffer.drain()
         self._last_drained = drained
 
         # Compute interval duration for RPS
@@ -127,22 +145,25 @@ class MetricCollector:
         interval = max(now - self._last_flush_time, 0.001)
         self._last_flush_time = now
 
-        return self._build_snapshot(
-            metrics=drained,
+        groups = drained.group_by_name()
+        snapshot = self._build_snapshot(
+            batch=drained,
+            groups=groups,
             elapsed_seconds=elapsed_seconds,
             active_users=active_users,
             interval=interval,
         )
+        self._accumulate(drained, groups, snapshot)
+        return snapshot
 
-    def get_drained_metrics(self) -> list[RequestMetric]:
+    def get_drained_metrics(self) -> MetricBatch:
         """Return the metrics drained by the most recent ``flush()`` call.
 
         This is used by multi-worker mode to forward raw metrics to the
-        aggregator. The returned list is the same object stored internally;
-        callers should not mutate it.
+        aggregator.
 
         Returns:
-            List of RequestMetric objects from the last flush.
+            Columnar MetricBatch from the last flush.
         """
         return self._last_drained
 
@@ -154,7 +175,8 @@ class MetricCollector:
         """Return a snapshot summarizing ALL metrics collected since init.
 
         Unlike ``flush()``, this does not drain the buffer. It uses the
-        cumulative internal state.
+        cumulative histograms, so percentiles are accurate to the HDR
+        histogram's three significant digits.
 
         Args:
             elapsed_seconds: Total elapsed seconds.
@@ -163,8 +185,15 @@ class MetricCollector:
         Returns:
             A cumulative MetricSnapshot.
         """
-        return self._build_snapshot(
-            metrics=self._all_metrics,
+        return snapshot_from_histograms(
+            overall_hist=self._cumulative_overall,
+            endpoint_hists=self._cumulative_endpoints,
+            request_count=self._total_request_count,
+            error_count=self._total_error_count,
+            errors_by_status=dict(self._total_errors_by_status),
+            errors_by_type=dict(self._total_errors_by_type),
+            endpoint_counts=dict(self._total_endpoint_counts),
+            endpoint_errors=dict(self._total_endpoint_errors),
             elapsed_seconds=elapsed_seconds,
             active_users=active_users,
             interval=max(elapsed_seconds, 0.001),
@@ -173,21 +202,62 @@ class MetricCollector:
     def reset(self) -> None:
         """Clear all internal state. Primarily for testing."""
         self._buffer.clear()
-        self._all_metrics.clear()
-        self._last_drained.clear()
+        self._last_drained = self._buffer.drain()
         self._last_flush_time = time.monotonic()
+        self._cumulative_overall.reset()
+        self._cumulative_endpoints.clear()
+        self._total_request_count = 0
+        self._total_error_count = 0
+        self._total_errors_by_status.clear()
+        self._total_errors_by_type.clear()
+        self._total_endpoint_counts.clear()
+        self._total_endpoint_errors.clear()
+
+    def _accumulate(
+        self,
+        batch: MetricBatch,
+        groups: list[tuple[str, npt.NDArray[np.float64], int]],
+        snapshot: MetricSnapshot,
+    ) -> None:
+        """Fold a flushed batch into the cumulative histograms and counters.
+
+        Args:
+            batch: Metrics drained by ``flush()``.
+            groups: ``batch.group_by_name()`` result.
+            snapshot: Interval snapshot already computed from ``batch``.
+        """
+        if not len(batch):
+            return
+
+        self._cumulative_overall.record_latencies_ms(batch.latency_ms)
+        for name, ep_latencies, _ep_errors in groups:
+            if name not in self._cumulative_endpoints:
+                self._cumulative_endpoints[name] = HdrHistogramWrapper()
+            self._cumulative_endpoints[name].record_latencies_ms(ep_latencies)
+
+        self._total_request_count += snapshot.total_requests
+        self._total_error_count += snapshot.total_errors
+        for status, count in snapshot.errors_by_status.items():
+            self._total_errors_by_status[status] += count
+        for error_type, count in snapshot.errors_by_type.items():
+            self._total_errors_by_type[error_type] += count
+        for name, endpoint in snapshot.endpoints.items():
+            self._total_endpoint_counts[name] += endpoint.request_count
+            self._total_endpoint_errors[name] += endpoint.error_count
 
     def _build_snapshot(
         self,
-        metrics: list[RequestMetric],
+        batch: MetricBatch,
+        groups: list[tuple[str, npt.NDArray[np.float64], int]],
         elapsed_seconds: float,
         active_users: int,
         interval: float,
     ) -> MetricSnapshot:
-        """Build a MetricSnapshot from a list of metrics.
+        """Build a MetricSnapshot from a batch of metrics.
 
         Args:
-            metrics: List of RequestMetric objects to aggregate.
+            batch: Columnar metrics to aggregate.
+            groups: ``batch.group_by_name()`` result.
             elapsed_seconds: Elapsed seconds value for the snapshot.
             active_users: Active user count for the snapshot.
             interval: Time interval for computing RPS.
@@ -195,50 +265,31 @@ class MetricCollector:
         Returns:
             Aggregated MetricSnapshot.
         """
-        if not metrics:
+        if not len(batch):
             return MetricSnapshot(
                 timestamp=time.monotonic(),
                 elapsed_seconds=elapsed_seconds,
                 active_users=active_users,
             )
 
-        # Group by endpoint
-        by_endpoint: dict[str, list[RequestMetric]] = defaultdict(list)
-        all_latencies: list[float] = []
-        errors_by_status: dict[int, int] = defaultdict(int)
-        errors_by_type: dict[str, int] = defaultdict(int)
-        total_errors = 0
-
-        for metric in metrics:
-            by_endpoint[metric.name].append(metric)
-            all_latencies.append(metric.latency_ms)
-
-            is_error = metric.error is not None or metric.status_code >= 400
-            if is_error:
-                total_errors += 1
-                if metric.status_code >= 400:
-                    errors_by_status[metric.status_code] += 1
-                if metric.error is not None:
-                    # Extract error type (e.g., "ConnectionError" from "ConnectionError: ...")
-                    error_type = metric.error.split(":")[0].strip()
-                    errors_by_type[error_type] += 1
+        latencies = batch.latency_ms
+        is_error = batch.error_mask()
+        total_errors = int(np.count_nonzero(is_error))
 
         # Overall percentiles
-        lat_min, lat_max, lat_avg, lat_pcts = _compute_percentiles(all_latencies)
+        lat_min, lat_max, lat_avg, lat_pcts = _compute_percentiles(latencies)
         lat_p50, lat_p75, lat_p90, lat_p95, lat_p99, lat_p999 = lat_pcts
 
-        total_requests = len(metrics)
+        total_requests = len(batch)
         error_rate = total_errors / total_requests if total_requests > 0 else 0.0
 
         # Per-endpoint metrics
         endpoints: dict[str, EndpointMetrics] = {}
-        for name, ep_metrics in by_endpoint.items():
-            ep_latencies = [m.latency_ms for m in ep_metrics]
-            ep_errors = sum(1 for m in ep_metrics if m.error is not None or m.status_code >= 400)
-            ep_count = len(ep_metrics)
+        for name, ep_latencies, ep_errors in groups:
+            ep_count = len(ep_latencies)
 
             ep_min, ep_max, ep_avg, ep_pcts = _compute_percentiles(
-                ep_latencies, _ENDPOINT_QUANTILES
+                ep_latencies, ENDPOINT_QUANTILES
             )
             ep_p50, ep_p75, ep_p90, ep_p95, ep_p99 = ep_pcts
 
@@ -275,7 +326,7 @@ class MetricCollector:
             latency_p999=lat_p999,
             total_errors=total_errors,
             error_rate=error_rate,
-            errors_by_status=dict(errors_by_status),
-            errors_by_type=dict(errors_by_type),
+            errors_by_status=batch.errors_by_status(),
+            errors_by_type=batch.errors_by_type(),
             endpoints=endpoints,
         )
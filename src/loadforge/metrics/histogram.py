@@ -3,13 +3,26 @@
 Provides a thin wrapper around ``hdrh.histogram.HdrHistogram`` that
 works in milliseconds. Internally converts to integer microseconds
 for the HDR histogram's integer-only API.
+
+``hdrh`` keeps its counters in a ctypes array, which the wrapper also
+views as a NumPy array. Batches are bucketed and counted with NumPy and
+added to that array directly, so recording costs a few vectorised
+passes instead of one ``record_value`` call per distinct value.
 """
 
 from __future__ import annotations
 
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
 from hdrh.histogram import HdrHistogram  # type: ignore[import-untyped]
 
 from loadforge._internal.logging import get_logger
+from loadforge.metrics.models import EndpointMetrics, MetricSnapshot
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
 
 logger = get_logger("metrics.histogram")
 
@@ -18,6 +31,11 @@ _LOWEST_TRACKABLE_US = 1
 _HIGHEST_TRACKABLE_US = 60_000_000
 _SIGNIFICANT_DIGITS = 3
 
+# Percentiles reported in every snapshot. Shared with the collector, so
+# interval and cumulative snapshots always report the same points.
+OVERALL_QUANTILES = (50.0, 75.0, 90.0, 95.0, 99.0, 99.9)
+ENDPOINT_QUANTILES = (50.0, 75.0, 90.0, 95.0, 99.0)
+
 
 class HdrHistogramWrapper:
     """Wrapper around HDR histogram for latency percentile computation.
@@ -49,6 +67,8 @@ class HdrHistogramWrapper:
         self._histogram: HdrHistogram = HdrHistogram(  # type: ignore[no-any-unimported]
             lowest_us, highest_us, significant_digits
         )
+        # Zero-copy view of hdrh's counters, indexed like ``counts_index_for``.
+        self._counts: npt.NDArray[np.uint64] = np.ctypeslib.as_array(self._histogram.counts)
 
     def record_latency_ms(self, latency_ms: float) -> bool:
         """Record a latency value in milliseconds.
@@ -66,6 +86,53 @@ class HdrHistogramWrapper:
         value_us = max(self.lowest_us, min(value_us, self.highest_us))
         return bool(self._histogram.record_value(value_us))
 
+    def record_latencies_ms(self, latencies_ms: npt.NDArray[np.float64]) -> None:
+        """Record an array of latency values in milliseconds.
+
+        Values are converted and clamped like ``record_latency_ms``. The
+        whole array is bucketed with NumPy and the per-bucket counts are
+        added to the histogram's counters in one step.
+
+        Args:
+            latencies_ms: Latencies in milliseconds.
+        """
+        if not len(latencies_ms):
+            return
+        values_us = np.clip(
+            (latencies_ms * 1000).astype(np.int64), self.lowest_us, self.highest_us
+        )
+        indices, counts = np.unique(self._counts_indices(values_us), return_counts=True)
+        self._counts[indices] += counts.astype(np.uint64)
+
+        hist = self._histogram
+        hist.total_count += len(values_us)
+        hist.min_value = min(hist.min_value, int(values_us.min()))
+        hist.max_value = max(hist.max_value, int(values_us.max()))
+
+    def _counts_indices(self, values_us: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+        """Map in-range microsecond values to counter indices.
+
+        Vectorised form of ``HdrHistogram._counts_index_for``.
+
+        Args:
+            values_us: Values already clamped to the trackable range.
+
+        Returns:
+            Index into the counters array for each value.
+        """
+        hist = self._histogram
+        # frexp's exponent is the bit length; exact for values below 2**53.
+        _, bit_length = np.frexp((values_us | hist.sub_bucket_mask).astype(np.float64))
+        bucket_index = bit_length.astype(np.int64) - (
+            hist.unit_magnitude + hist.sub_bucket_half_count_magnitude + 1
+        )
+        sub_bucket_index = values_us >> (bucket_index + hist.unit_magnitude)
+        bucket_base = (bucket_index + 1) << hist.sub_bucket_half_count_magnitude
+        indices: npt.NDArray[np.int64] = (
+            bucket_base + sub_bucket_index - hist.sub_bucket_half_count
+        )
+        return indices
+
     def get_percentile(self, percentile: float) -> float:
         """Get the value at a given percentile.
 
@@ -81,6 +148,52 @@ class HdrHistogramWrapper:
         value_us = self._histogram.get_value_at_percentile(percentile)
         return float(value_us) / 1000.0
 
+    def summary(self, percentiles: tuple[float, ...]) -> tuple[float, float, float, list[float]]:
+        """Compute min, max, mean, and several percentiles in one pass.
+
+        Gives the same values as ``get_min``, ``get_max``, ``get_mean`` and
+        ``get_percentile``. Those each walk the counters in Python. This
+        method takes one cumulative sum over them with NumPy.
+
+        Args:
+            percentiles: Percentiles to compute (0.0 to 100.0).
+
+        Returns:
+            Tuple of (min, max, mean, [percentile values]) in milliseconds,
+            all 0.0 if the histogram is empty.
+        """
+        hist = self._histogram
+        total = int(hist.total_count)
+        if total == 0:
+            return (0.0, 0.0, 0.0, [0.0] * len(percentiles))
+
+        cumulative = np.cumsum(self._counts)
+        # Same rounding as HdrHistogram.get_target_count_at_percentile.
+        targets = [max(int(min(p, 100.0) * total / 100 + 0.5), 1) for p in percentiles]
+        pcts: list[float] = []
+        for percentile, index in zip(
+            percentiles, np.searchsorted(cumulative, targets).tolist(), strict=True
+        ):
+            value_us = hist.get_value_from_index(index)
+            if percentile:
+                value_us = hist.get_highest_equivalent_value(value_us)
+            pcts.append(float(value_us) / 1000.0)
+
+        # Mean of bucket midpoints, as HdrHistogram.get_mean_value computes it.
+        indices = np.flatnonzero(self._counts)
+        bucket_index = (indices >> hist.sub_bucket_half_count_magnitude) - 1
+        sub_bucket_index = (indices & (hist.sub_bucket_half_count - 1)) + (
+            hist.sub_bucket_half_count
+        )
+        first_bucket = bucket_index < 0
+        sub_bucket_index[first_bucket] -= hist.sub_bucket_half_count
+        bucket_index[first_bucket] = 0
+        shift = bucket_index + hist.unit_magnitude
+        midpoints = (sub_bucket_index << shift) + ((1 << shift) >> 1)
+        weighted = int(np.dot(self._counts[indices].astype(np.int64), midpoints))
+
+        return (self.get_min(), self.get_max(), float(weighted) / total / 1000.0, pcts)
+
     def get_min(self) -> float:
         """Get the minimum recorded value in milliseconds.
 
@@ -130,3 +243,88 @@ class HdrHistogramWrapper:
             other: Histogram to merge from.
         """
         self._histogram.add(other._histogram)
+
+
+def snapshot_from_histograms(
+    *,
+    overall_hist: HdrHistogramWrapper,
+    endpoint_hists: dict[str, HdrHistogramWrapper],
+    request_count: int,
+    error_count: int,
+    errors_by_status: dict[int, int],
+    errors_by_type: dict[str, int],
+    endpoint_counts: dict[str, int],
+    endpoint_errors: dict[str, int],
+    elapsed_seconds: float,
+    active_users: int,
+    interval: float,
+) -> MetricSnapshot:
+    """Build a MetricSnapshot from histogram and counter state.
+
+    Args:
+        overall_hist: Overall latency histogram.
+        endpoint_hists: Per-endpoint latency histograms.
+        request_count: Total requests in the period.
+        error_count: Total errors in the period.
+        errors_by_status: Error counts by HTTP status code.
+        errors_by_type: Error counts by error type string.
+        endpoint_counts: Request counts per endpoint.
+        endpoint_errors: Error counts per endpoint.
+        elapsed_seconds: Elapsed seconds for the snapshot.
+        active_users: Active user count for the snapshot.
+        interval: Time interval for RPS computation.
+
+    Returns:
+        Aggregated MetricSnapshot.
+    """
+    error_rate = error_count / request_count if request_count > 0 else 0.0
+
+    # Per-endpoint metrics
+    endpoints: dict[str, EndpointMetrics] = {}
+    for name, hist in endpoint_hists.items():
+        ep_count = endpoint_counts.get(name, 0)
+        ep_errors = endpoint_errors.get(name, 0)
+        ep_error_rate = ep_errors / ep_count if ep_count > 0 else 0.0
+        ep_min, ep_max, ep_avg, ep_pcts = hist.summary(ENDPOINT_QUANTILES)
+        ep_p50, ep_p75, ep_p90, ep_p95, ep_p99 = ep_pcts
+
+        endpoints[name] = EndpointMetrics(
+            name=name,
+            request_count=ep_count,
+            error_count=ep_errors,
+            error_rate=ep_error_rate,
+            requests_per_second=ep_count / interval,
+            latency_min=ep_min,
+            latency_max=ep_max,
+            latency_avg=ep_avg,
+            latency_p50=ep_p50,
+            latency_p75=ep_p75,
+            latency_p90=ep_p90,
+            latency_p95=ep_p95,
+            latency_p99=ep_p99,
+        )
+
+    lat_min, lat_max, lat_avg, lat_pcts = overall_hist.summary(OVERALL_QUANTILES)
+    lat_p50, lat_p75, lat_p90, lat_p95, lat_p99, lat_p999 = lat_pcts
+
+    return MetricSnapshot(
+        timestamp=time.monotonic(),
+        elapsed_seconds=elapsed_seconds,
+        active_users=active_users,
+        total_requests=request_count,
+        requests_per_second=request_count / interval,
+        latency_min=lat_min,
+        latency_max=lat_max,
+        latency_avg=lat_avg,
+        latency_p50=lat_p50,
+        latency_p75=lat_p75,
+        latency_p90=lat_p90,
+        latency_p95=lat_p95,
+        latency_p99=lat_p99,
+        latency_p999=lat_p999,
+        total_errors=error_count,
+        error_rate=error_rate,
+        errors_by_status=errors_by_status,
+        errors_by_type=errors_by_type,
+        endpoints=endpoints,
+    )
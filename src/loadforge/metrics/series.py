@@ -0,0 +1,80 @@
+"""Columnar (struct-of-arrays) view of a snapshot time-series.
+
+``TestResult.snapshots`` keeps one ``MetricSnapshot`` object per tick,
+which is what the exporters and JSON round-trip need. Charts only plot a
+handful of scalar fields over time, so ``SnapshotColumns`` extracts those
+once into NumPy arrays. Plotly serialises arrays as packed binary
+(``bdata``) instead of one JSON number per point, which keeps reports for
+long runs small.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from loadforge.metrics.models import MetricSnapshot
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotColumns:
+    """Per-tick scalar snapshot fields stored as NumPy columns.
+
+    Every column has one entry per snapshot, in chronological order.
+
+    Attributes:
+        elapsed_seconds: Seconds since the test started.
+        active_users: Active virtual users.
+        total_requests: Requests completed in the interval.
+        requests_per_second: Overall RPS in the interval.
+        latency_avg: Mean latency in milliseconds.
+        latency_p50: 50th percentile latency (ms).
+        latency_p95: 95th percentile latency (ms).
+        latency_p99: 99th percentile latency (ms).
+        total_errors: Errors in the interval.
+    """
+
+    elapsed_seconds: npt.NDArray[np.float64]
+    active_users: npt.NDArray[np.int64]
+    total_requests: npt.NDArray[np.int64]
+    requests_per_second: npt.NDArray[np.float64]
+    latency_avg: npt.NDArray[np.float64]
+    latency_p50: npt.NDArray[np.float64]
+    latency_p95: npt.NDArray[np.float64]
+    latency_p99: npt.NDArray[np.float64]
+    total_errors: npt.NDArray[np.int64]
+
+    def __len__(self) -> int:
+        """Return the number of snapshots."""
+        return len(self.elapsed_seconds)
+
+    @classmethod
+    def from_snapshots(cls, snapshots: Sequence[MetricSnapshot]) -> SnapshotColumns:
+        """Extract the columns from a list of snapshots.
+
+        Args:
+            snapshots: Time-series of ``MetricSnapshot`` objects.
+
+        Returns:
+            A new SnapshotColumns with one row per snapshot.
+        """
+        n = len(snapshots)
+        return cls(
+            elapsed_seconds=np.fromiter((s.elapsed_seconds for s in snapshots), np.float64, n),
+            active_users=np.fromiter((s.active_users for s in snapshots), np.int64, n),
+            total_requests=np.fromiter((s.total_requests for s in snapshots), np.int64, n),
+            requests_per_second=np.fromiter(
+                (s.requests_per_second for s in snapshots), np.float64, n
+            ),
+            latency_avg=np.fromiter((s.latency_avg for s in snapshots), np.float64, n),
+            latency_p50=np.fromiter((s.latency_p50 for s in snapshots), np.float64, n),
+            latency_p95=np.fromiter((s.latency_p95 for s in snapshots), np.float64, n),
+            latency_p99=np.fromiter((s.latency_p99 for s in snapshots), np.float64, n),
+            total_errors=np.fromiter((s.total_errors for s in snapshots), np.int64, n),
+        )
@@ -45,6 +45,29 @@ class LoadPattern(ABC):
             active at that moment.
         """
 
+    def peak_concurrency(
+        self,
+        duration_seconds: float,
+        tick_interval: float = 1.0,
+    ) -> int:
+        """Return the highest concurrency this pattern reaches.
+
+        The default walks :meth:`iter_concurrency`. Patterns whose peak is
+        known up front override this to skip the walk.
+
+        Args:
+            duration_seconds: Total test duration in seconds.
+            tick_interval: Seconds between ticks.  Defaults to 1.0.
+
+        Returns:
+            The maximum target concurrency, or 0 if the pattern yields
+            no ticks.
+        """
+        return max(
+            (users for _, users in self.iter_concurrency(duration_seconds, tick_interval)),
+            default=0,
+        )
+
     @abstractmethod
     def describe(self) -> str:
         """Return a human-readable description of this pattern.
@@ -57,6 +57,24 @@ class ConstantPattern(LoadPattern):
             yield (elapsed, self._users)
             elapsed += tick_interval
 
+    def peak_concurrency(
+        self,
+        duration_seconds: float,
+        tick_interval: float = 1.0,
+    ) -> int:
+        """Return the configured user count without iterating ticks.
+
+        Args:
+            duration_seconds: Total test duration in seconds.
+            tick_interval: Seconds between ticks.
+
+        Returns:
+            The constant user count.
+        """
+        _validate_positive(duration_seconds, "duration_seconds")
+        _validate_positive(tick_interval, "tick_interval")
+        return self._users
+
     def describe(self) -> str:
         """Return a human-readable description.
 
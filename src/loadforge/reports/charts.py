@@ -10,9 +10,15 @@ from typing import TYPE_CHECKING
 
 import plotly.graph_objects as go
 
+from loadforge.metrics.series import SnapshotColumns
+
 if TYPE_CHECKING:
     from loadforge.metrics.models import EndpointMetrics, MetricSnapshot
 
+    # Time-series charts accept either the snapshot list or columns already
+    # extracted from it, so a report can extract the columns once.
+    _SnapshotSeries = list[MetricSnapshot] | SnapshotColumns
+
 
 # ---------------------------------------------------------------------------
 # Shared helpers
@@ -96,31 +102,45 @@ def _empty_figure(message: str) -> go.Figure:
     return fig
 
 
+def _columns(snapshots: _SnapshotSeries) -> SnapshotColumns:
+    """Return snapshot data as columns, extracting them if needed.
+
+    Args:
+        snapshots: Snapshot list or precomputed columns.
+
+    Returns:
+        The columnar view of the snapshots.
+    """
+    if isinstance(snapshots, SnapshotColumns):
+        return snapshots
+    return SnapshotColumns.from_snapshots(snapshots)
+
+
 # ---------------------------------------------------------------------------
 # Chart functions
 # ---------------------------------------------------------------------------
 
 
-def throughput_chart(snapshots: list[MetricSnapshot]) -> go.Figure:
+def throughput_chart(snapshots: _SnapshotSeries) -> go.Figure:
     """Build an RPS-over-time line chart.
 
     Args:
-        snapshots: Time-series of ``MetricSnapshot`` objects.
+        snapshots: Time-series of ``MetricSnapshot`` objects, or their
+            ``SnapshotColumns``.
 
     Returns:
         Interactive Plotly figure with RPS over elapsed seconds.
     """
-    if not snapshots:
+    if not len(snapshots):
         return _empty_figure("No throughput data collected")
 
-    x = [s.elapsed_seconds for s in snapshots]
-    y = [s.requests_per_second for s in snapshots]
+    columns = _columns(snapshots)
 
     fig = go.Figure()
     fig.add_trace(
         go.Scatter(
-            x=x,
-            y=y,
+            x=columns.elapsed_seconds,
+            y=columns.requests_per_second,
             mode="lines",
             name="RPS",
             line={"color": _COLORS["green"], "width": 2},
@@ -132,19 +152,21 @@ def throughput_chart(snapshots: list[MetricSnapshot]) -> go.Figure:
     return fig
 
 
-def latency_bands_chart(snapshots: list[MetricSnapshot]) -> go.Figure:
+def latency_bands_chart(snapshots: _SnapshotSeries) -> go.Figure:
     """Build a latency percentile bands area chart (p50/p95/p99).
 
     Args:
-        snapshots: Time-series of ``MetricSnapshot`` objects.
+        snapshots: Time-series of ``MetricSnapshot`` objects, or their
+            ``SnapshotColumns``.
 
     Returns:
         Stacked area chart with p50, p95, p99 latency bands over time.
     """
-    if not snapshots:
+    if not len(snapshots):
         return _empty_figure("No latency data collected")
 
-    x = [s.elapsed_seconds for s in snapshots]
+    columns = _columns(snapshots)
+    x = columns.elapsed_seconds
 
     fig = go.Figure()
 
@@ -152,7 +174,7 @@ def latency_bands_chart(snapshots: list[MetricSnapshot]) -> go.Figure:
     fig.add_trace(
         go.Scatter(
             x=x,
-            y=[s.latency_p99 for s in snapshots],
+            y=columns.latency_p99,
             mode="lines",
             name="p99",
             line={"color": _COLORS["red"], "width": 1},
@@ -164,7 +186,7 @@ def latency_bands_chart(snapshots: list[MetricSnapshot]) -> go.Figure:
     fig.add_trace(
         go.Scatter(
             x=x,
-            y=[s.latency_p95 for s in snapshots],
+            y=columns.latency_p95,
             mode="lines",
             name="p95",
             line={"color": _COLORS["orange"], "width": 1},
@@ -176,7 +198,7 @@ def latency_bands_chart(snapshots: list[MetricSnapshot]) -> go.Figure:
     fig.add_trace(
         go.Scatter(
             x=x,
-            y=[s.latency_p50 for s in snapshots],
+            y=columns.latency_p50,
             mode="lines",
             name="p50",
             line={"color": _COLORS["blue"], "width": 2},
@@ -189,25 +211,27 @@ def latency_bands_chart(snapshots: list[MetricSnapshot]) -> go.Figure:
     return fig
 
 
-def latency_histogram_chart(snapshots: list[MetricSnapshot]) -> go.Figure:
+def latency_histogram_chart(snapshots: _SnapshotSeries) -> go.Figure:
     """Build a latency distribution histogram from snapshot averages.
 
     Since raw per-request latencies are not stored, this uses per-snapshot
     average latencies weighted by request count as an approximation.
 
     Args:
-        snapshots: Time-series of ``MetricSnapshot`` objects.
+        snapshots: Time-series of ``MetricSnapshot`` objects, or their
+            ``SnapshotColumns``.
 
     Returns:
         Histogram figure showing approximate latency distribution.
     """
-    if not snapshots:
+    if not len(snapshots):
         return _empty_figure("No latency data collected")
 
     # Use per-snapshot average latencies directly — one value per snapshot
-    x_values = [s.latency_avg for s in snapshots if s.total_requests > 0]
+    columns = _columns(snapshots)
+    x_values = columns.latency_avg[columns.total_requests > 0]
 
-    if not x_values:
+    if not len(x_values):
         return _empty_figure("No latency data collected")
 
     fig = go.Figure()
@@ -343,26 +367,26 @@ def error_pie_chart(endpoints: dict[str, EndpointMetrics]) -> go.Figure:
     return fig
 
 
-def concurrency_chart(snapshots: list[MetricSnapshot]) -> go.Figure:
+def concurrency_chart(snapshots: _SnapshotSeries) -> go.Figure:
     """Build an active-users-over-time area chart.
 
     Args:
-        snapshots: Time-series of ``MetricSnapshot`` objects.
+        snapshots: Time-series of ``MetricSnapshot`` objects, or their
+            ``SnapshotColumns``.
 
     Returns:
         Area chart showing active virtual users over elapsed seconds.
     """
-    if not snapshots:
+    if not len(snapshots):
         return _empty_figure("No concurrency data collected")
 
-    x = [s.elapsed_seconds for s in snapshots]
-    y = [s.active_users for s in snapshots]
+    columns = _columns(snapshots)
 
     fig = go.Figure()
     fig.add_trace(
         go.Scatter(
-            x=x,
-            y=y,
+            x=columns.elapsed_seconds,
+            y=columns.active_users,
             mode="lines",
             name="Active Users",
             line={"color": _COLORS["purple"], "width": 2},
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 
 import jinja2
 
+from loadforge.metrics.series import SnapshotColumns
 from loadforge.reports import charts
 
 if TYPE_CHECKING:
@@ -39,21 +40,22 @@ class ReportGenerator:
         """
         result = self._result
         snapshots = result.snapshots
+        columns = SnapshotColumns.from_snapshots(snapshots)
         summary = result.final_summary
 
         # Generate all charts and serialize to JSON
         figures: dict[str, str] = {
             "chart-throughput": charts.figure_to_json(
-                charts.throughput_chart(snapshots),
+                charts.throughput_chart(columns),
             ),
             "chart-concurrency": charts.figure_to_json(
-                charts.concurrency_chart(snapshots),
+                charts.concurrency_chart(columns),
             ),
             "chart-latency-bands": charts.figure_to_json(
-                charts.latency_bands_chart(snapshots),
+                charts.latency_bands_chart(columns),
             ),
             "chart-latency-hist": charts.figure_to_json(
-                charts.latency_histogram_chart(snapshots),
+                charts.latency_histogram_chart(columns),
             ),
             "chart-latency-endpoint": charts.figure_to_json(
                 charts.latency_by_endpoint_chart(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import time
 from typing import TYPE_CHECKING
 
@@ -99,3 +100,118 @@ class TestCoordinator:
         assert len(results) == 2
         # Workers should exit cleanly even with 0 users
         assert all(r.success for r in results)
+
+    def test_scale_to_writes_shared_targets(self, scenario_file: Path):
+        coordinator = Coordinator(
+            scenario_path=str(scenario_file),
+            num_workers=2,
+            duration_seconds=3.0,
+        )
+
+        coordinator.scale_to(5)
+        assert list(coordinator._target_slots) == [3, 2]
+        coordinator.scale_to(0)
+        assert list(coordinator._target_slots) == [0, 0]
+
+    def test_scale_to_spreads_remainder(self, scenario_file: Path):
+        coordinator = Coordinator(
+            scenario_path=str(scenario_file),
+            num_workers=4,
+            duration_seconds=3.0,
+        )
+
+        coordinator.scale_to(7)
+        assert list(coordinator._target_slots) == [2, 2, 2, 1]
+
+    @pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="Linux only")
+    def test_workers_pinned_to_cores(self, scenario_file: Path):
+        coordinator = Coordinator(
+            scenario_path=str(scenario_file),
+            num_workers=2,
+            duration_seconds=3.0,
+            tick_interval=0.5,
+        )
+
+        coordinator.start()
+        try:
+            # Workers pin themselves at startup.
+            time.sleep(1.0)
+            cores = sorted(os.sched_getaffinity(0))
+            pinned = [os.sched_getaffinity(p.pid) for p in coordinator._processes if p.pid]
+            assert pinned == [{cores[i % len(cores)]} for i in range(2)]
+        finally:
+            coordinator.stop()
+
+    def test_workers_see_current_environment(
+        self, scenario_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Each start() passes the parent's current environment to workers."""
+        out = tmp_path / "seen.txt"
+        scenario_file.write_text(
+            "import os\n"
+            "import pathlib\n"
+            "pathlib.Path(os.environ['LOADFORGE_TEST_OUT']).write_text(\n"
+            "    os.environ.get('LOADFORGE_SEED', '')\n"
+            ")\n" + scenario_file.read_text().replace("from __future__ import annotations\n", "")
+        )
+        monkeypatch.setenv("LOADFORGE_TEST_OUT", str(out))
+
+        for seed in ("1", "2"):
+            monkeypatch.setenv("LOADFORGE_SEED", seed)
+            coordinator = Coordinator(
+                scenario_path=str(scenario_file),
+                num_workers=1,
+                duration_seconds=3.0,
+                tick_interval=0.5,
+            )
+            coordinator.start()
+            time.sleep(1.0)
+            coordinator.stop()
+            assert out.read_text() == seed
+
+    def test_wait_until_ready(self, scenario_file: Path):
+        coordinator = Coordinator(
+            scenario_path=str(scenario_file),
+            num_workers=2,
+            duration_seconds=3.0,
+            tick_interval=0.5,
+        )
+        coordinator.start()
+        try:
+            assert coordinator.wait_until_ready(timeout=10.0)
+        finally:
+            coordinator.stop()
+
+    def test_wait_until_ready_returns_when_workers_fail(self, tmp_path: Path):
+        broken = tmp_path / "broken_scenario.py"
+        broken.write_text("raise RuntimeError('boom')\n")
+        coordinator = Coordinator(
+            scenario_path=str(broken),
+            num_workers=1,
+            duration_seconds=3.0,
+            tick_interval=0.5,
+        )
+        coordinator.start()
+        try:
+            start = time.monotonic()
+            assert not coordinator.wait_until_ready(timeout=10.0)
+            assert time.monotonic() - start < 5.0
+        finally:
+            coordinator.stop()
+
+    def test_spawn_start_method(self, scenario_file: Path):
+        coordinator = Coordinator(
+            scenario_path=str(scenario_file),
+            num_workers=1,
+            duration_seconds=3.0,
+            tick_interval=0.5,
+            start_method="spawn",
+        )
+        assert coordinator._ctx.get_start_method() == "spawn"
+
+        coordinator.start()
+        coordinator.scale_to(1)
+        time.sleep(1.0)
+        results = coordinator.stop()
+
+        assert [r.success for r in results] == [True]
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+import signal
+import threading
 from typing import TYPE_CHECKING
 
 import pytest
@@ -81,6 +84,24 @@ class TestLoadTestRunner:
         assert result.final_summary is not None
         assert result.final_summary.total_requests > 0
 
+    def test_sigint_stops_run_early(self, scenario_file: Path):
+        runner = LoadTestRunner(
+            scenario_path=scenario_file,
+            pattern=ConstantPattern(users=2),
+            duration_seconds=60.0,
+            num_workers=1,
+            tick_interval=0.5,
+        )
+        timer = threading.Timer(2.0, os.kill, args=(os.getpid(), signal.SIGINT))
+        timer.start()
+        try:
+            result = runner.run()
+        finally:
+            timer.cancel()
+
+        assert result.duration_seconds < 20.0
+        assert result.final_summary is not None
+
     def test_invalid_scenario_raises(self, tmp_path: Path):
         with pytest.raises(Exception, match="not found"):
             LoadTestRunner(
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from loadforge._internal.errors import EngineError
 from loadforge.dsl.scenario import ScenarioDefinition, TaskDefinition
 from loadforge.engine.session import SessionState
 from loadforge.engine.session import TestSession as LoadTestSession
@@ -35,7 +36,7 @@ def _make_echo_scenario(base_url: str) -> ScenarioDefinition:
         name="Echo Test",
         cls=_EchoScenario,
         base_url=base_url,
-        tasks=[TaskDefinition(name="Echo Test", func=_get_echo, weight=1)],  # type: ignore[arg-type]
+        tasks=(TaskDefinition(name="Echo Test", func=_get_echo, weight=1),),  # type: ignore[arg-type]
         think_time=(0.01, 0.02),  # Fast think time for tests
     )
 
@@ -61,7 +62,7 @@ def _make_setup_teardown_scenario(base_url: str) -> ScenarioDefinition:
         name="Auth Test",
         cls=_AuthScenario,
         base_url=base_url,
-        tasks=[TaskDefinition(name="Echo Test", func=_get_echo, weight=1)],  # type: ignore[arg-type]
+        tasks=(TaskDefinition(name="Echo Test", func=_get_echo, weight=1),),  # type: ignore[arg-type]
         setup_func=_setup,  # type: ignore[arg-type]
         teardown_func=_teardown,  # type: ignore[arg-type]
         think_time=(0.01, 0.02),
@@ -81,7 +82,7 @@ def _make_error_scenario(base_url: str) -> ScenarioDefinition:
         name="Error Test",
         cls=_ErrorScenario,
         base_url=base_url,
-        tasks=[TaskDefinition(name="Error Request", func=_get_error, weight=1)],  # type: ignore[arg-type]
+        tasks=(TaskDefinition(name="Error Request", func=_get_error, weight=1),),  # type: ignore[arg-type]
         think_time=(0.01, 0.02),
     )
 
@@ -102,10 +103,10 @@ def _make_weighted_scenario(base_url: str) -> ScenarioDefinition:
         name="Weighted Test",
         cls=_WeightedScenario,
         base_url=base_url,
-        tasks=[
+        tasks=(
             TaskDefinition(name="Heavy Task", func=_heavy_task, weight=9),  # type: ignore[arg-type]
             TaskDefinition(name="Light Task", func=_light_task, weight=1),  # type: ignore[arg-type]
-        ],
+        ),
         think_time=(0.01, 0.02),
     )
 
@@ -263,3 +264,49 @@ class TestWorkerIntegration:
         # Heavy task should get roughly 90% of requests
         # Use a generous threshold: at least 60%
         assert heavy_count / total > 0.6
+
+    @pytest.mark.timeout(15)
+    async def test_warm_up_is_opt_in(
+        self, echo_server: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Sessions send no warm-up requests unless asked to."""
+        calls: list[int] = []
+
+        async def _record(_connector: object, _base_url: str, connections: int) -> None:
+            calls.append(connections)
+
+        monkeypatch.setattr("loadforge.engine.session.warm_up_connector", _record)
+        for warm_up in (False, True):
+            session = LoadTestSession(
+                scenario=_make_echo_scenario(echo_server),
+                pattern=ConstantPattern(users=2),
+                duration_seconds=0.5,
+                tick_interval=0.25,
+                warm_up=warm_up,
+            )
+            await session.run()
+
+        assert calls == [2]
+
+    @pytest.mark.timeout(15)
+    async def test_warm_up_failure_cleans_up(
+        self, echo_server: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An error during warm-up still closes the pool and fails the session."""
+
+        async def _fail(*_args: object) -> None:
+            raise RuntimeError("warm-up failed")
+
+        monkeypatch.setattr("loadforge.engine.session.warm_up_connector", _fail)
+        session = LoadTestSession(
+            scenario=_make_echo_scenario(echo_server),
+            pattern=ConstantPattern(users=1),
+            duration_seconds=1.0,
+            warm_up=True,
+        )
+        with pytest.raises(EngineError):
+            await session.run()
+
+        assert session.state == SessionState.FAILED
+        assert session._connector is not None
+        assert session._connector.closed
@@ -7,6 +7,7 @@ import time
 
 from loadforge.dsl.http_client import RequestMetric
 from loadforge.metrics.aggregator import MetricAggregator
+from loadforge.metrics.buffer import MetricBatch, MetricBuffer
 from loadforge.metrics.store import MetricStore
 
 
@@ -30,15 +31,22 @@ def _make_metric(
     )
 
 
+def _make_batch(metrics: list[RequestMetric]) -> MetricBatch:
+    buffer = MetricBuffer(worker_id=metrics[0].worker_id if metrics else 0)
+    for m in metrics:
+        buffer.append(m.name, m.status_code, round(m.latency_ms * 1e6), m.error)
+    return buffer.drain()
+
+
 class TestMetricAggregator:
     def test_drains_queues_and_produces_snapshots(self):
         ctx = multiprocessing.get_context("spawn")
-        q: multiprocessing.Queue[list[RequestMetric]] = ctx.Queue()
+        q: multiprocessing.Queue[MetricBatch] = ctx.Queue()
         store = MetricStore()
 
         # Put a batch of metrics
         batch = [_make_metric(latency_ms=float(i)) for i in range(1, 11)]
-        q.put(batch)
+        q.put(_make_batch(batch))
 
         aggregator = MetricAggregator([q], store, tick_interval=0.2)
         aggregator.set_active_users(5)
@@ -57,14 +65,14 @@ class TestMetricAggregator:
 
     def test_multiple_worker_queues(self):
         ctx = multiprocessing.get_context("spawn")
-        q1: multiprocessing.Queue[list[RequestMetric]] = ctx.Queue()
-        q2: multiprocessing.Queue[list[RequestMetric]] = ctx.Queue()
+        q1: multiprocessing.Queue[MetricBatch] = ctx.Queue()
+        q2: multiprocessing.Queue[MetricBatch] = ctx.Queue()
         store = MetricStore()
 
         # Worker 1 sends fast requests
-        q1.put([_make_metric(latency_ms=5.0, worker_id=0) for _ in range(5)])
+        q1.put(_make_batch([_make_metric(latency_ms=5.0, worker_id=0) for _ in range(5)]))
         # Worker 2 sends slow requests
-        q2.put([_make_metric(latency_ms=50.0, worker_id=1) for _ in range(5)])
+        q2.put(_make_batch([_make_metric(latency_ms=50.0, worker_id=1) for _ in range(5)]))
 
         aggregator = MetricAggregator([q1, q2], store, tick_interval=0.2)
         aggregator.start()
@@ -79,7 +87,7 @@ class TestMetricAggregator:
 
     def test_per_endpoint_metrics(self):
         ctx = multiprocessing.get_context("spawn")
-        q: multiprocessing.Queue[list[RequestMetric]] = ctx.Queue()
+        q: multiprocessing.Queue[MetricBatch] = ctx.Queue()
         store = MetricStore()
 
         batch = [
@@ -87,7 +95,7 @@ class TestMetricAggregator:
             _make_metric(name="List Items", latency_ms=20.0),
             _make_metric(name="Create Item", latency_ms=50.0),
         ]
-        q.put(batch)
+        q.put(_make_batch(batch))
 
         aggregator = MetricAggregator([q], store, tick_interval=0.2)
         aggregator.start()
@@ -102,7 +110,7 @@ class TestMetricAggregator:
 
     def test_error_tracking(self):
         ctx = multiprocessing.get_context("spawn")
-        q: multiprocessing.Queue[list[RequestMetric]] = ctx.Queue()
+        q: multiprocessing.Queue[MetricBatch] = ctx.Queue()
         store = MetricStore()
 
         batch = [
@@ -110,7 +118,7 @@ class TestMetricAggregator:
             _make_metric(status_code=500),
             _make_metric(status_code=200, error="ConnectionError: timeout"),
         ]
-        q.put(batch)
+        q.put(_make_batch(batch))
 
         aggregator = MetricAggregator([q], store, tick_interval=0.2)
         aggregator.start()
@@ -123,9 +131,34 @@ class TestMetricAggregator:
         assert 500 in snapshot.errors_by_status
         assert "ConnectionError" in snapshot.errors_by_type
 
+    def test_errors_by_status_per_tick_and_cumulative(self):
+        aggregator = MetricAggregator([], MetricStore())
+        aggregator._process_batch(
+            _make_batch([_make_metric(status_code=s) for s in (200, 503, 404, 503)])
+        )
+        assert aggregator._build_tick_snapshot(1.0).errors_by_status == {404: 1, 503: 2}
+
+        aggregator._reset_tick_state()
+        aggregator._process_batch(_make_batch([_make_metric(status_code=500)]))
+        assert aggregator._build_tick_snapshot(2.0).errors_by_status == {500: 1}
+        assert aggregator.get_final_snapshot(2.0).errors_by_status == {
+            404: 1,
+            500: 1,
+            503: 2,
+        }
+
+    def test_status_beyond_three_digits_not_broken_out(self):
+        aggregator = MetricAggregator([], MetricStore())
+        aggregator._process_batch(
+            _make_batch([_make_metric(status_code=s) for s in (503, 1000, 4321)])
+        )
+        snapshot = aggregator._build_tick_snapshot(1.0)
+        assert snapshot.total_errors == 3
+        assert snapshot.errors_by_status == {503: 1}
+
     def test_empty_queues_produce_zero_snapshots(self):
         ctx = multiprocessing.get_context("spawn")
-        q: multiprocessing.Queue[list[RequestMetric]] = ctx.Queue()
+        q: multiprocessing.Queue[MetricBatch] = ctx.Queue()
         store = MetricStore()
 
         aggregator = MetricAggregator([q], store, tick_interval=0.2)
@@ -141,18 +174,18 @@ class TestMetricAggregator:
 
     def test_get_final_snapshot_cumulative(self):
         ctx = multiprocessing.get_context("spawn")
-        q: multiprocessing.Queue[list[RequestMetric]] = ctx.Queue()
+        q: multiprocessing.Queue[MetricBatch] = ctx.Queue()
         store = MetricStore()
 
         # Put two batches across ticks
-        q.put([_make_metric(latency_ms=10.0) for _ in range(5)])
+        q.put(_make_batch([_make_metric(latency_ms=10.0) for _ in range(5)]))
 
         aggregator = MetricAggregator([q], store, tick_interval=0.2)
         aggregator.start()
         time.sleep(0.4)
 
         # Add more metrics in second tick
-        q.put([_make_metric(latency_ms=20.0) for _ in range(5)])
+        q.put(_make_batch([_make_metric(latency_ms=20.0) for _ in range(5)]))
         time.sleep(0.4)
         aggregator.stop()
 
@@ -162,11 +195,11 @@ class TestMetricAggregator:
 
     def test_on_snapshot_callback(self):
         ctx = multiprocessing.get_context("spawn")
-        q: multiprocessing.Queue[list[RequestMetric]] = ctx.Queue()
+        q: multiprocessing.Queue[MetricBatch] = ctx.Queue()
         store = MetricStore()
         callbacks: list[object] = []
 
-        q.put([_make_metric()])
+        q.put(_make_batch([_make_metric()]))
 
         aggregator = MetricAggregator([q], store, on_snapshot=callbacks.append, tick_interval=0.2)
         aggregator.start()
@@ -177,7 +210,7 @@ class TestMetricAggregator:
 
     def test_start_and_stop_idempotent(self):
         ctx = multiprocessing.get_context("spawn")
-        q: multiprocessing.Queue[list[RequestMetric]] = ctx.Queue()
+        q: multiprocessing.Queue[MetricBatch] = ctx.Queue()
         store = MetricStore()
 
         aggregator = MetricAggregator([q], store, tick_interval=0.2)
@@ -0,0 +1,108 @@
+"""Tests for the columnar MetricBuffer and MetricBatch."""
+
+from __future__ import annotations
+
+import pickle
+
+from loadforge.metrics.buffer import NO_ERROR, MetricBuffer
+
+
+def _append(
+    buffer: MetricBuffer,
+    name: str = "Test",
+    latency_ms: float = 10.0,
+    status_code: int = 200,
+    error: str | None = None,
+) -> None:
+    """Append a row with sensible defaults."""
+    buffer.append(name, status_code, round(latency_ms * 1e6), error)
+
+
+class TestMetricBuffer:
+    """Tests for MetricBuffer append and drain."""
+
+    def test_append_and_drain(self) -> None:
+        buffer = MetricBuffer(worker_id=3)
+        _append(buffer, latency_ms=5.0)
+        _append(buffer, latency_ms=7.0, status_code=500)
+        assert len(buffer) == 2
+
+        batch = buffer.drain()
+        assert len(buffer) == 0
+        assert len(batch) == 2
+        assert batch.worker_id == 3
+        assert batch.latency_ms.tolist() == [5.0, 7.0]
+        assert batch.status_code.tolist() == [200, 500]
+        assert batch.error_id.tolist() == [NO_ERROR, NO_ERROR]
+
+    def test_strings_are_interned(self) -> None:
+        buffer = MetricBuffer()
+        _append(buffer, name="A")
+        _append(buffer, name="B")
+        _append(buffer, name="A")
+        batch = buffer.drain()
+        assert batch.name_id[0] == batch.name_id[2]
+        assert [batch.strings[i] for i in batch.name_id] == ["A", "B", "A"]
+
+    def test_batch_carries_only_its_own_strings(self) -> None:
+        buffer = MetricBuffer()
+        _append(buffer, name="A")
+        _append(buffer, name="B", error="TimeoutError: slow")
+        first = buffer.drain()
+        assert first.strings == ("A", "B", "TimeoutError: slow")
+        _append(buffer, name="C")
+        second = buffer.drain()
+        assert second.strings == ("C",)
+        assert [second.strings[i] for i in second.name_id] == ["C"]
+
+    def test_clear_discards_rows_and_strings(self) -> None:
+        buffer = MetricBuffer()
+        _append(buffer)
+        buffer.clear()
+        batch = buffer.drain()
+        assert len(batch) == 0
+        assert batch.strings == ()
+
+    def test_batch_is_picklable(self) -> None:
+        buffer = MetricBuffer()
+        _append(buffer, error="ConnectionError: refused")
+        batch = pickle.loads(pickle.dumps(buffer.drain()))  # noqa: S301
+        assert batch.strings[batch.error_id[0]] == "ConnectionError: refused"
+
+
+class TestMetricBatch:
+    """Tests for MetricBatch reductions."""
+
+    def test_error_mask(self) -> None:
+        buffer = MetricBuffer()
+        _append(buffer, status_code=200)
+        _append(buffer, status_code=404)
+        _append(buffer, status_code=0, error="TimeoutError: slow")
+        assert buffer.drain().error_mask().tolist() == [False, True, True]
+
+    def test_errors_by_status_and_type(self) -> None:
+        buffer = MetricBuffer()
+        _append(buffer, status_code=500)
+        _append(buffer, status_code=500)
+        _append(buffer, status_code=404)
+        _append(buffer, status_code=0, error="ConnectionError: refused")
+        _append(buffer, status_code=0, error="ConnectionError: reset")
+        batch = buffer.drain()
+        assert batch.errors_by_status() == {404: 1, 500: 2}
+        assert batch.errors_by_type() == {"ConnectionError": 2}
+
+    def test_group_by_name_in_first_seen_order(self) -> None:
+        buffer = MetricBuffer()
+        _append(buffer, name="B", latency_ms=1.0)
+        _append(buffer, name="A", latency_ms=2.0, status_code=503)
+        _append(buffer, name="B", latency_ms=3.0, error="TimeoutError: slow")
+        _append(buffer, name="C", latency_ms=4.0)
+        groups = buffer.drain().group_by_name()
+        assert [(name, lat.tolist(), errors) for name, lat, errors in groups] == [
+            ("B", [1.0, 3.0], 1),
+            ("A", [2.0], 1),
+            ("C", [4.0], 0),
+        ]
+
+    def test_group_by_name_empty(self) -> None:
+        assert MetricBuffer().drain().group_by_name() == []
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import time
 
+import numpy as np
+import pytest
+
 from loadforge.dsl.http_client import RequestMetric
-from loadforge.metrics.collector import MetricCollector
+from loadforge.metrics.collector import MetricCollector, _compute_percentiles
 
 
 def _make_metric(
@@ -28,6 +31,28 @@ def _make_metric(
     )
 
 
+class TestComputePercentiles:
+    @pytest.mark.parametrize("size", [1, 2, 7, 1000])
+    def test_matches_numpy(self, size: int) -> None:
+        """min/max/avg/percentiles equal the separate NumPy reductions."""
+        latencies = np.random.default_rng(size).lognormal(3.0, 1.5, size)
+        quantiles = (50.0, 75.0, 90.0, 95.0, 99.0, 99.9)
+        lat_min, lat_max, lat_avg, pcts = _compute_percentiles(latencies, quantiles)
+
+        assert lat_min == latencies.min()
+        assert lat_max == latencies.max()
+        assert lat_avg == latencies.mean()
+        assert pcts == np.percentile(latencies, quantiles).tolist()
+
+    def test_does_not_reorder_input(self) -> None:
+        latencies = np.array([5.0, 1.0, 3.0])
+        _compute_percentiles(latencies)
+        assert latencies.tolist() == [5.0, 1.0, 3.0]
+
+    def test_empty(self) -> None:
+        assert _compute_percentiles(np.array([]), (50.0, 99.0)) == (0.0, 0.0, 0.0, [0.0, 0.0])
+
+
 class TestMetricCollectorRecord:
     """Tests for the record method."""
 
@@ -157,6 +182,25 @@ class TestMetricCollectorCumulative:
         cumulative = collector.get_cumulative_snapshot(elapsed_seconds=2.0, active_users=0)
         assert cumulative.total_requests == 5
 
+    def test_cumulative_aggregates_endpoints_and_errors(self) -> None:
+        collector = MetricCollector()
+        for lat in range(1, 51):
+            collector.record(_make_metric(name="A", latency_ms=float(lat)))
+        collector.flush(elapsed_seconds=1.0, active_users=1)
+        for lat in range(51, 101):
+            collector.record(_make_metric(name="B", latency_ms=float(lat), status_code=500))
+        collector.flush(elapsed_seconds=2.0, active_users=1)
+
+        cumulative = collector.get_cumulative_snapshot(elapsed_seconds=2.0, active_users=0)
+        assert cumulative.total_requests == 100
+        assert cumulative.total_errors == 50
+        assert cumulative.errors_by_status == {500: 50}
+        assert 49.0 <= cumulative.latency_p50 <= 51.0
+        assert 98.0 <= cumulative.latency_p99 <= 100.0
+        assert cumulative.endpoints["A"].request_count == 50
+        assert cumulative.endpoints["B"].error_count == 50
+        assert cumulative.endpoints["B"].latency_min >= 50.0
+
     def test_cumulative_does_not_drain_buffer(self) -> None:
         collector = MetricCollector()
         collector.record(_make_metric())
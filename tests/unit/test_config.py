@@ -17,7 +17,7 @@ class TestLoadForgeConfig:
         assert config.default_base_url == ""
         assert config.default_headers == {}
         assert config.default_think_time == (0.5, 1.5)
-        assert config.connection_pool_size == 100
+        assert config.connection_pool_size is None
         assert config.request_timeout == 30.0
 
     def test_frozen(self):
@@ -26,10 +26,29 @@ class TestLoadForgeConfig:
         with pytest.raises(AttributeError):
             config.default_base_url = "http://changed"  # type: ignore[misc]
 
+    def test_slots(self):
+        """LoadForgeConfig uses __slots__ instead of a per-instance __dict__."""
+        config = LoadForgeConfig()
+        assert not hasattr(config, "__dict__")
+
+    def test_default_headers_shared_and_read_only(self):
+        """Default headers are a single shared read-only mapping."""
+        first = LoadForgeConfig()
+        second = LoadForgeConfig()
+        assert first.default_headers is second.default_headers
+        with pytest.raises(TypeError):
+            first.default_headers["X-Test"] = "1"  # type: ignore[index]
+
 
 class TestLoadConfig:
     """Tests for the load_config function."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_config_cache(self):
+        load_config.cache_clear()
+        yield
+        load_config.cache_clear()
+
     def test_defaults_from_env(self, monkeypatch: pytest.MonkeyPatch):
         """load_config returns defaults when no env vars are set."""
         monkeypatch.delenv("LOADFORGE_BASE_URL", raising=False)
@@ -38,7 +57,7 @@ class TestLoadConfig:
 
         config = load_config()
         assert config.default_base_url == ""
-        assert config.connection_pool_size == 100
+        assert config.connection_pool_size is None
         assert config.request_timeout == 30.0
 
     def test_base_url_from_env(self, monkeypatch: pytest.MonkeyPatch):
@@ -51,7 +70,19 @@ class TestLoadConfig:
         """LOADFORGE_POOL_SIZE is read from the environment."""
         monkeypatch.setenv("LOADFORGE_POOL_SIZE", "50")
         config = load_config()
-        assert config.connection_pool_size == 50
+        assert config.connection_pool_size == (50, 50)
+
+    def test_pool_size_pair_from_env(self, monkeypatch: pytest.MonkeyPatch):
+        """LOADFORGE_POOL_SIZE accepts an 'N,M' per-host/total pair."""
+        monkeypatch.setenv("LOADFORGE_POOL_SIZE", "20,80")
+        config = load_config()
+        assert config.connection_pool_size == (20, 80)
+
+    def test_pool_size_per_host_above_total_raises_error(self, monkeypatch: pytest.MonkeyPatch):
+        """A per-host limit larger than the total raises ConfigError."""
+        monkeypatch.setenv("LOADFORGE_POOL_SIZE", "80,20")
+        with pytest.raises(ConfigError, match="per-host limit <= the total"):
+            load_config()
 
     def test_timeout_from_env(self, monkeypatch: pytest.MonkeyPatch):
         """LOADFORGE_TIMEOUT is read from the environment."""
@@ -88,3 +119,45 @@ class TestLoadConfig:
         monkeypatch.setenv("LOADFORGE_TIMEOUT", "-5.0")
         with pytest.raises(ConfigError, match="must be positive"):
             load_config()
+
+    def test_event_loop_defaults_to_uvloop(self, monkeypatch: pytest.MonkeyPatch):
+        """event_loop defaults to uvloop when LOADFORGE_LOOP is unset."""
+        monkeypatch.delenv("LOADFORGE_LOOP", raising=False)
+        assert load_config().event_loop == "uvloop"
+
+    def test_event_loop_from_env(self, monkeypatch: pytest.MonkeyPatch):
+        """LOADFORGE_LOOP=asyncio selects the stdlib event loop."""
+        monkeypatch.setenv("LOADFORGE_LOOP", "asyncio")
+        assert load_config().event_loop == "asyncio"
+
+    def test_invalid_event_loop_raises_error(self, monkeypatch: pytest.MonkeyPatch):
+        """Unknown LOADFORGE_LOOP values raise ConfigError."""
+        monkeypatch.setenv("LOADFORGE_LOOP", "trio")
+        with pytest.raises(ConfigError, match="LOADFORGE_LOOP"):
+            load_config()
+
+    def test_random_seed_defaults_to_none(self, monkeypatch: pytest.MonkeyPatch):
+        """random_seed is None when LOADFORGE_SEED is unset."""
+        monkeypatch.delenv("LOADFORGE_SEED", raising=False)
+        assert load_config().random_seed is None
+
+    def test_random_seed_from_env(self, monkeypatch: pytest.MonkeyPatch):
+        """LOADFORGE_SEED sets an integer random seed."""
+        monkeypatch.setenv("LOADFORGE_SEED", "42")
+        assert load_config().random_seed == 42
+
+    def test_invalid_random_seed_raises_error(self, monkeypatch: pytest.MonkeyPatch):
+        """Non-integer LOADFORGE_SEED values raise ConfigError."""
+        monkeypatch.setenv("LOADFORGE_SEED", "abc")
+        with pytest.raises(ConfigError, match="LOADFORGE_SEED"):
+            load_config()
+
+    def test_result_is_cached(self, monkeypatch: pytest.MonkeyPatch):
+        """load_config returns the same instance until the cache is cleared."""
+        monkeypatch.setenv("LOADFORGE_POOL_SIZE", "50")
+        first = load_config()
+        monkeypatch.setenv("LOADFORGE_POOL_SIZE", "75")
+        assert load_config() is first
+
+        load_config.cache_clear()
+        assert load_config().connection_pool_size == (75, 75)
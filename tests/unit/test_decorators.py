@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+
 import pytest
 
 from loadforge._internal.errors import ScenarioError
@@ -74,6 +76,21 @@ class TestScenarioDecorator:
 
         assert MyScenario.default_headers == {"Authorization": "Bearer token"}
 
+    def test_default_headers_read_only_copy(self):
+        """default_headers is a read-only snapshot of the given dict."""
+        headers = {"Authorization": "Bearer token"}
+
+        @scenario(name="Test", base_url="http://localhost", default_headers=headers)
+        class MyScenario:
+            @task(weight=1)
+            async def do_something(self, client: object) -> None:
+                pass
+
+        headers["X-Later"] = "1"
+        assert MyScenario.default_headers == {"Authorization": "Bearer token"}
+        with pytest.raises(TypeError):
+            MyScenario.default_headers["X-Test"] = "1"  # type: ignore[index]
+
     def test_default_headers_empty_when_not_specified(self):
         """Default headers is an empty dict when not specified."""
 
@@ -85,6 +102,45 @@ class TestScenarioDecorator:
 
         assert MyScenario.default_headers == {}
 
+    def test_stateless_shares_one_instance(self):
+        """stateless=True hands every user the same class instance."""
+
+        @scenario(name="Shared", base_url="http://localhost", stateless=True)
+        class Shared:
+            @task()
+            async def do_something(self, client: object) -> None:
+                pass
+
+        @scenario(name="PerUser", base_url="http://localhost")
+        class PerUser:
+            @task()
+            async def do_something(self, client: object) -> None:
+                pass
+
+        assert Shared.stateless
+        assert Shared.new_instance() is Shared.new_instance()
+        assert isinstance(Shared.new_instance(), Shared.cls)
+        assert not PerUser.stateless
+        assert PerUser.new_instance() is not PerUser.new_instance()
+
+    def test_stateless_instance_built_lazily(self):
+        """The shared instance is built on first use, not at decoration time."""
+        constructed: list[object] = []
+
+        @scenario(name="Lazy", base_url="http://localhost", stateless=True)
+        class Lazy:
+            def __init__(self) -> None:
+                constructed.append(self)
+
+            @task()
+            async def do_something(self, client: object) -> None:
+                pass
+
+        assert constructed == []
+        first = Lazy.new_instance()
+        assert Lazy.new_instance() is first
+        assert constructed == [first]
+
     def test_custom_think_time(self):
         """Custom think_time is stored."""
 
@@ -177,6 +233,7 @@ class TestTaskDecorator:
             async def task_b(self, client: object) -> None:
                 pass
 
+        assert isinstance(MyScenario.tasks, tuple)
         assert len(MyScenario.tasks) == 2
 
     def test_task_weight(self):
@@ -223,6 +280,20 @@ class TestTaskDecorator:
 
         assert MyScenario.tasks[0].name == "get_items"
 
+    def test_names_are_interned(self):
+        """Scenario and task names are interned strings."""
+        scenario_name = "".join(["Interned", "Scenario"])
+        task_name = "".join(["Interned", "Task"])
+
+        @scenario(name=scenario_name, base_url="http://localhost")
+        class MyScenario:
+            @task(name=task_name)
+            async def some_task(self, client: object) -> None:
+                pass
+
+        assert MyScenario.name is sys.intern("InternedScenario")
+        assert MyScenario.tasks[0].name is sys.intern("InternedTask")
+
     def test_task_stores_function_reference(self):
         """TaskDefinition.func is the original unbound method."""
 
@@ -235,6 +306,42 @@ class TestTaskDecorator:
         # func should be callable
         assert callable(MyScenario.tasks[0].func)
 
+    def test_tasks_in_definition_order(self):
+        """Tasks are collected in the order they are defined."""
+
+        @scenario(name="Ordered", base_url="http://localhost")
+        class MyScenario:
+            @task(weight=1)
+            async def zeta(self, client: object) -> None:
+                pass
+
+            @task(weight=1)
+            async def alpha(self, client: object) -> None:
+                pass
+
+        assert [t.name for t in MyScenario.tasks] == ["zeta", "alpha"]
+
+    def test_inherited_tasks_collected_and_overridable(self):
+        """Tasks from base classes are collected; subclasses can override them."""
+
+        class Base:
+            @task(weight=1)
+            async def shared(self, client: object) -> None:
+                pass
+
+            @task(weight=1)
+            async def replaced(self, client: object) -> None:
+                pass
+
+        @scenario(name="Inherited", base_url="http://localhost")
+        class MyScenario(Base):
+            @task(weight=3)
+            async def replaced(self, client: object) -> None:
+                pass
+
+        weights = {t.name: t.weight for t in MyScenario.tasks}
+        assert weights == {"shared": 1, "replaced": 3}
+
     def test_task_weight_zero_raises_error(self):
         """@task(weight=0) raises ScenarioError."""
         with pytest.raises(ScenarioError, match="weight must be >= 1"):
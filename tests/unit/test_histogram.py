@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import numpy as np
+
 from loadforge.metrics.histogram import HdrHistogramWrapper
 
 
@@ -127,3 +129,49 @@ class TestHdrHistogramWrapper:
         assert 490.0 <= p50 <= 510.0
         assert 740.0 <= p75 <= 760.0
         assert 890.0 <= p90 <= 910.0
+
+    def test_record_latencies_ms_matches_scalar_recording(self):
+        values = [0.0, 1.5, 1.5, 10.0, 250.0, 120_000.0]
+        bulk = HdrHistogramWrapper()
+        bulk.record_latencies_ms(np.array(values))
+        scalar = HdrHistogramWrapper()
+        for v in values:
+            scalar.record_latency_ms(v)
+
+        assert bulk.get_total_count() == scalar.get_total_count() == len(values)
+        assert bulk.get_min() == scalar.get_min()
+        assert bulk.get_max() == scalar.get_max()
+        assert bulk.get_percentile(50.0) == scalar.get_percentile(50.0)
+
+    def test_record_latencies_ms_matches_scalar_across_buckets(self):
+        rng = np.random.default_rng(0)
+        values = np.concatenate(
+            (rng.uniform(0.0, 5.0, 500), rng.lognormal(3.0, 2.0, 500), [0.0005, 90_000.0])
+        )
+        bulk = HdrHistogramWrapper()
+        bulk.record_latencies_ms(values)
+        bulk.record_latencies_ms(np.array([]))
+        scalar = HdrHistogramWrapper()
+        for v in values:
+            scalar.record_latency_ms(v)
+
+        assert bulk._histogram.counts[:] == scalar._histogram.counts[:]
+        assert bulk.get_total_count() == scalar.get_total_count() == len(values)
+        assert bulk.get_min() == scalar.get_min()
+        assert bulk.get_max() == scalar.get_max()
+        assert bulk.get_mean() == scalar.get_mean()
+
+    def test_summary_matches_individual_getters(self):
+        hist = HdrHistogramWrapper()
+        hist.record_latencies_ms(np.random.default_rng(1).lognormal(3.0, 2.0, 2000))
+        percentiles = (0.0, 50.0, 90.0, 99.9, 100.0)
+
+        lat_min, lat_max, lat_avg, pcts = hist.summary(percentiles)
+
+        assert lat_min == hist.get_min()
+        assert lat_max == hist.get_max()
+        assert lat_avg == hist.get_mean()
+        assert pcts == [hist.get_percentile(p) for p in percentiles]
+
+    def test_summary_empty(self):
+        assert HdrHistogramWrapper().summary((50.0, 99.0)) == (0.0, 0.0, 0.0, [0.0, 0.0])
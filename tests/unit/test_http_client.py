@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+
 import aiohttp
 import pytest
 
-from loadforge.dsl.http_client import HttpClient, RequestMetric
+from loadforge.dsl.http_client import (
+    _TARGET_CACHE_SIZE,
+    HttpClient,
+    RequestMetric,
+    _request_target,
+)
+from loadforge.metrics.buffer import MetricBuffer
 
 
 class TestRequestMetric:
@@ -64,6 +72,13 @@ class TestRequestMetric:
 class TestHttpClient:
     """Tests for the HttpClient class."""
 
+    def test_rng_is_per_client(self):
+        """Each client gets its own random number generator."""
+        first = HttpClient(base_url="http://localhost")
+        second = HttpClient(base_url="http://localhost")
+        assert first.rng is not second.rng
+        assert 0.0 <= first.rng.random() < 1.0
+
     async def test_get_request(self, echo_server: str):
         """HttpClient.get sends a GET request and emits a metric."""
         metrics: list[RequestMetric] = []
@@ -167,6 +182,60 @@ class TestHttpClient:
 
         assert data["headers"]["Authorization"] == "Bearer token123"
 
+    def test_default_headers_shared_until_written(self):
+        """Clients share read-only default headers and copy them on first write."""
+        defaults = MappingProxyType({"X-Custom": "test-value"})
+        first = HttpClient(base_url="http://localhost", headers=defaults)
+        second = HttpClient(base_url="http://localhost", headers=defaults)
+        assert first.headers.data is defaults
+        assert second.headers.data is defaults
+
+        first.headers["Authorization"] = "Bearer token123"
+        assert dict(first.headers) == {
+            "X-Custom": "test-value",
+            "Authorization": "Bearer token123",
+        }
+        assert defaults == {"X-Custom": "test-value"}
+        assert second.headers.data is defaults
+
+        del second.headers["X-Custom"]
+        assert dict(second.headers) == {}
+        assert defaults == {"X-Custom": "test-value"}
+
+    def test_plain_dict_headers_copied(self):
+        """A plain headers dict is copied, so later caller changes don't leak in."""
+        defaults = {"X-Custom": "test-value"}
+        client = HttpClient(base_url="http://localhost", headers=defaults)
+        assert client.headers.data is not defaults
+
+        defaults["X-Custom"] = "changed"
+        client.headers["Authorization"] = "Bearer token123"
+        assert dict(client.headers) == {
+            "X-Custom": "test-value",
+            "Authorization": "Bearer token123",
+        }
+        assert defaults == {"X-Custom": "changed"}
+
+    async def test_request_target_shared_across_clients(self, echo_server: str):
+        """Clients in one process share cached request targets."""
+        metrics: list[RequestMetric] = []
+
+        async with (
+            HttpClient(base_url=echo_server, metric_callback=metrics.append) as first,
+            HttpClient(base_url=echo_server, metric_callback=metrics.append) as second,
+        ):
+            await first.get("/echo/cached", name="Cached")
+            hits = _request_target.cache_info().hits
+            await second.get("/echo/cached", name="Cached")
+            assert _request_target.cache_info().hits == hits + 1
+
+        assert [m.name for m in metrics] == ["Cached", "Cached"]
+        assert metrics[1].url == f"{echo_server}/echo/cached"
+
+    def test_request_target_cache_bounded(self):
+        """The shared target cache has a fixed size limit."""
+        assert _request_target.cache_info().maxsize == _TARGET_CACHE_SIZE
+
     async def test_metric_url_is_full(self, echo_server: str):
         """RequestMetric.url is the full URL (base + path)."""
         metrics: list[RequestMetric] = []
@@ -179,6 +248,19 @@ class TestHttpClient:
 
         assert metrics[0].url == f"{echo_server}/echo/full-url"
 
+    async def test_content_length_in_metric(self, echo_server: str):
+        """RequestMetric.content_length matches the response body size."""
+        metrics: list[RequestMetric] = []
+
+        async with HttpClient(
+            base_url=echo_server,
+            metric_callback=metrics.append,
+        ) as client:
+            resp = await client.get("/echo/length")
+            body = await resp.read()
+
+        assert metrics[0].content_length == len(body) > 0
+
     async def test_worker_id_in_metric(self, echo_server: str):
         """RequestMetric.worker_id matches the client's worker_id."""
         metrics: list[RequestMetric] = []
@@ -198,6 +280,33 @@ class TestHttpClient:
             resp = await client.get("/echo/noop")
             assert resp.status == 200
 
+    async def test_metric_buffer_receives_rows(self, echo_server: str):
+        """Requests are appended to metric_buffer without a callback."""
+        buffer = MetricBuffer(worker_id=2)
+        async with HttpClient(base_url=echo_server, metric_buffer=buffer) as client:
+            await client.get("/echo/buffered", name="Buffered")
+            await client.post("/echo/buffered", name="Buffered")
+
+        batch = buffer.drain()
+        assert len(batch) == 2
+        assert [batch.strings[i] for i in batch.name_id] == ["Buffered", "Buffered"]
+        assert batch.strings == ("Buffered",)
+        assert batch.status_code.tolist() == [200, 200]
+        assert (batch.latency_ms > 0).all()
+
+    async def test_shared_connector_not_closed(self, echo_server: str):
+        """Clients reuse a shared connector and leave it open on exit."""
+        connector = aiohttp.TCPConnector(limit=4)
+        try:
+            for _ in range(2):
+                async with HttpClient(base_url=echo_server, connector=connector) as client:
+                    resp = await client.get("/echo/shared")
+                    assert resp.status == 200
+                    await resp.read()
+            assert not connector.closed
+        finally:
+            await connector.close()
+
     async def test_error_metric_on_connection_failure(self):
         """RequestMetric captures errors on connection failures."""
         metrics: list[RequestMetric] = []
@@ -0,0 +1,43 @@
+"""Tests for structured JSON log serialisation."""
+
+from __future__ import annotations
+
+import json
+import sys
+
+import pytest
+
+from loadforge._internal.logging import _select_json_dumps, _stdlib_dumps
+
+_ENTRIES = [
+    {"level": "INFO", "message": "plain"},
+    {"level": "WARNING", "message": 'quote " and backslash \\'},
+    {"level": "ERROR", "message": "line\nbreak\ttab\x00\x1f\x7f"},
+    {"level": "INFO", "message": "café ✓ 日本 \u2028\u2029 🚀"},
+]
+
+
+class TestJsonDumps:
+    """Both serialisers must emit the same bytes for every record."""
+
+    def test_stdlib_fallback_without_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        assert _select_json_dumps() is _stdlib_dumps
+
+    def test_stdlib_output_is_compact_utf8(self) -> None:
+        assert _stdlib_dumps({"level": "INFO", "message": "café"}) == (
+            '{"level":"INFO","message":"café"}'
+        )
+
+    @pytest.mark.parametrize("entry", _ENTRIES)
+    def test_orjson_matches_stdlib(self, entry: dict[str, str]) -> None:
+        pytest.importorskip("orjson")
+        dumps = _select_json_dumps()
+        assert dumps is not _stdlib_dumps
+        assert dumps(entry) == _stdlib_dumps(entry)
+        assert json.loads(dumps(entry)) == entry
+
+    def test_orjson_falls_back_on_lone_surrogate(self) -> None:
+        pytest.importorskip("orjson")
+        entry = {"level": "ERROR", "message": "caf\ud800"}
+        assert _select_json_dumps()(entry) == _stdlib_dumps(entry)
@@ -56,6 +56,12 @@ class TestConstantPattern:
         assert "100" in desc
         assert desc  # non-empty
 
+    def test_peak_concurrency_without_iterating(self) -> None:
+        """peak_concurrency() returns the user count without walking ticks."""
+        pattern = ConstantPattern(users=7)
+        pattern.iter_concurrency = None  # type: ignore[assignment, method-assign]
+        assert pattern.peak_concurrency(duration_seconds=3600.0, tick_interval=0.1) == 7
+
     def test_is_load_pattern(self) -> None:
         """ConstantPattern is a LoadPattern."""
         pattern = ConstantPattern(users=1)
@@ -577,3 +583,9 @@ class TestPatternInterface:
         elapsed_values = [t for t, _ in ticks]
         for i in range(1, len(elapsed_values)):
             assert elapsed_values[i] >= elapsed_values[i - 1]
+
+    def test_peak_concurrency_matches_ticks(self, pattern: LoadPattern) -> None:
+        """peak_concurrency() equals the largest concurrency yielded."""
+        ticks = list(pattern.iter_concurrency(duration_seconds=10.0, tick_interval=0.5))
+        expected = max(users for _, users in ticks)
+        assert pattern.peak_concurrency(duration_seconds=10.0, tick_interval=0.5) == expected
@@ -99,6 +99,26 @@ class TestTokenBucketAcquire:
         await asyncio.gather(*tasks)
         assert count == 10
 
+    async def test_concurrent_acquires_respect_rate(self) -> None:
+        """Waiters reserve tokens in order and together wait for the refill."""
+        limiter = TokenBucketRateLimiter(rate=20.0, capacity=1.0)
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+        # One token is available up front; the other 4 need 4/20 = 0.2s.
+        assert time.monotonic() - start >= 0.15
+
+    async def test_cancelled_acquire_returns_token(self) -> None:
+        """Cancelling a waiting acquire hands its reserved token back."""
+        limiter = TokenBucketRateLimiter(rate=1.0, capacity=1.0)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        # Only the first acquire's token is still owed.
+        assert limiter._debt_ns <= limiter._capacity_ns
+
 
 class TestTokenBucketUpdateRate:
     """Tests for the update_rate method."""
@@ -117,3 +137,14 @@ class TestTokenBucketUpdateRate:
         limiter = TokenBucketRateLimiter(rate=10.0)
         with pytest.raises(ValueError, match="positive"):
             limiter.update_rate(-5.0)
+
+    def test_update_rate_applies_to_later_refills(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        now_ns = [1_000_000_000]
+        monkeypatch.setattr(time, "monotonic_ns", lambda: now_ns[0])
+        limiter = TokenBucketRateLimiter(rate=10.0, capacity=100.0)
+        limiter._debt_ns = limiter._capacity_ns  # empty bucket
+
+        now_ns[0] += 500_000_000  # 0.5 s at 10 tokens/s
+        limiter.update_rate(100.0)
+        now_ns[0] += 100_000_000  # 0.1 s at 100 tokens/s
+        assert limiter.available_tokens == pytest.approx(15.0)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 from typing import TYPE_CHECKING
 
 import pytest
@@ -11,11 +12,12 @@ if TYPE_CHECKING:
 
 from loadforge._internal.errors import ScenarioError
 from loadforge.dsl.decorators import scenario, task
-from loadforge.dsl.loader import load_scenario
+from loadforge.dsl.loader import compile_scenario, load_scenario
 from loadforge.dsl.scenario import (
     ScenarioDefinition,
     ScenarioRegistry,
     TaskDefinition,
+    TaskPicker,
     registry,
 )
 
@@ -75,6 +77,28 @@ class TestScenarioRegistry:
         all_scenarios = reg.get_all()
         assert len(all_scenarios) == 2
 
+    def test_registered_since(self):
+        """registered_since returns entries added after a given count."""
+        reg = ScenarioRegistry()
+
+        @scenario(name="Before", base_url="http://localhost")
+        class BeforeScenario:
+            @task(weight=1)
+            async def do_work(self, client: object) -> None:
+                pass
+
+        @scenario(name="After", base_url="http://localhost")
+        class AfterScenario:
+            @task(weight=1)
+            async def do_work(self, client: object) -> None:
+                pass
+
+        reg.register(BeforeScenario)
+        count = len(reg)
+        reg.register(AfterScenario)
+        assert reg.registered_since(count) == [AfterScenario]
+        assert reg.registered_since(len(reg)) == []
+
     def test_duplicate_name_raises_error(self):
         """Registering two scenarios with the same name raises ScenarioError."""
         reg = ScenarioRegistry()
@@ -166,11 +190,107 @@ class TestDataclasses:
 
         sd = ScenarioDefinition(name="test", cls=Dummy, base_url="http://localhost")
         assert sd.default_headers == {}
-        assert sd.tasks == []
+        assert sd.tasks == ()
         assert sd.setup_func is None
         assert sd.teardown_func is None
         assert sd.think_time == (0.5, 1.5)
 
+    def test_definitions_are_frozen(self):
+        """Task and scenario definitions cannot be reassigned after creation."""
+
+        async def dummy(self: object, client: object) -> None:
+            pass
+
+        class Dummy:
+            pass
+
+        td = TaskDefinition(name="test", func=dummy)
+        sd = ScenarioDefinition(name="test", cls=Dummy, base_url="http://localhost", tasks=(td,))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            td.weight = 2  # type: ignore[misc]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sd.base_url = "http://other"  # type: ignore[misc]
+        assert not hasattr(sd, "__dict__")
+        assert sd.task_picker.tasks == (td,)
+
+    def test_scenario_definition_precomputes_think_time_sampler(self):
+        """ScenarioDefinition builds a sampler matching its think_time range."""
+
+        class Dummy:
+            pass
+
+        sd = ScenarioDefinition(
+            name="test", cls=Dummy, base_url="http://localhost", think_time=(1.0, 3.0)
+        )
+        assert sd.think_time_sampler.tmin == 1.0
+        assert sd.think_time_sampler.width == 2.0
+        assert sd.think_time_sampler.sample(lambda: 0.0) == 1.0
+        assert sd.think_time_sampler.sample(lambda: 0.5) == 2.0
+        assert 1.0 <= sd.think_time_sampler.sample() < 3.0
+
+
+# =========================================================================
+# Task Picker
+# =========================================================================
+
+
+async def _noop_task(self: object, client: object) -> None:
+    pass
+
+
+class TestTaskPicker:
+    """Tests for alias-method weighted task selection."""
+
+    def test_pick_single_task_skips_rng(self):
+        """A single-task picker never draws a random number."""
+        only = TaskDefinition(name="only", func=_noop_task, weight=3)
+        picker = TaskPicker([only])
+
+        def _fail() -> float:
+            raise AssertionError("rng should not be called")
+
+        assert picker.pick(_fail) is only
+
+    def test_pick_matches_weights(self):
+        """Sweeping the uniform draw yields each task in proportion to its weight."""
+        tasks = [
+            TaskDefinition(name="a", func=_noop_task, weight=5),
+            TaskDefinition(name="b", func=_noop_task, weight=3),
+            TaskDefinition(name="c", func=_noop_task, weight=1),
+        ]
+        picker = TaskPicker(tasks)
+        steps = 9000
+        counts = {"a": 0, "b": 0, "c": 0}
+        for i in range(steps):
+            u = (i + 0.5) / steps
+            counts[picker.pick(lambda u=u: u).name] += 1
+        assert counts == {"a": 5000, "b": 3000, "c": 1000}
+
+    def test_pick_equal_weights(self):
+        """Equal weights select every task equally."""
+        tasks = [TaskDefinition(name=str(i), func=_noop_task) for i in range(4)]
+        picker = TaskPicker(tasks)
+        picked = [picker.pick(lambda u=u: u).name for u in (0.1, 0.3, 0.6, 0.9)]
+        assert picked == ["0", "1", "2", "3"]
+
+    def test_pick_equal_weights_skips_alias(self):
+        """Equal weights index the task list directly, without the alias table."""
+        tasks = [TaskDefinition(name=str(i), func=_noop_task, weight=2) for i in range(3)]
+        picker = TaskPicker(tasks)
+        picker._prob = [0.0, 0.0, 0.0]
+        assert picker.pick(lambda: 0.5).name == "1"
+
+    def test_scenario_definition_builds_picker(self):
+        """ScenarioDefinition exposes a picker over its tasks."""
+
+        class Dummy:
+            pass
+
+        tasks = (TaskDefinition(name="a", func=_noop_task),)
+        sd = ScenarioDefinition(name="t", cls=Dummy, base_url="http://x", tasks=tasks)
+        assert sd.task_picker.tasks == tasks
+        assert sd.task_picker.pick() is tasks[0]
+
 
 # =========================================================================
 # Scenario Loader
@@ -244,3 +364,72 @@ import nonexistent_module_12345  # noqa: F401
         result = load_scenario(sample_scenario_path)
         assert isinstance(result, ScenarioDefinition)
         assert result.name == "Test Scenario"
+
+    def test_load_scenario_from_compiled_code(self, sample_scenario_path: Path):
+        """load_scenario executes precompiled code from compile_scenario."""
+        code = compile_scenario(sample_scenario_path)
+        result = load_scenario(sample_scenario_path, code=code)
+        assert isinstance(result, ScenarioDefinition)
+        assert result.name == "Test Scenario"
+
+    def test_compiled_code_keeps_scenario_future_flags(self, tmp_path: Path):
+        """Compiled scenarios don't inherit the loader's __future__ imports."""
+        path = tmp_path / "annotated_scenario.py"
+        path.write_text(
+            "from loadforge import scenario, task\n"
+            "\n"
+            "\n"
+            '@scenario(name="Annotated", base_url="http://localhost")\n'
+            "class AnnotatedScenario:\n"
+            "    @task(weight=1)\n"
+            "    async def do_work(self, client: object, count: int = 0) -> None:\n"
+            "        pass\n"
+        )
+
+        imported = load_scenario(path).cls.do_work.__annotations__
+        registry.clear()
+        compiled = load_scenario(path, code=compile_scenario(path)).cls.do_work.__annotations__
+
+        assert imported["count"] is int
+        assert compiled == imported
+
+    def test_compile_scenario_syntax_error(self, tmp_path: Path):
+        """compile_scenario raises ScenarioError on syntax errors."""
+        path = tmp_path / "bad_syntax.py"
+        path.write_text("def broken(:\n")
+        with pytest.raises(ScenarioError, match="Failed to import"):
+            compile_scenario(path)
+
+    def test_compiled_code_import_error(self, tmp_path: Path):
+        """load_scenario wraps errors raised while executing compiled code."""
+        path = tmp_path / "broken_compiled.py"
+        path.write_text("import nonexistent_module_12345  # noqa: F401\n")
+        code = compile_scenario(path)
+        with pytest.raises(ScenarioError, match="Failed to import"):
+            load_scenario(path, code=code)
+
+    def test_load_scenario_returns_first_defined(self, tmp_path: Path):
+        """load_scenario returns the first scenario the file defines."""
+        code = """\
+from __future__ import annotations
+
+from loadforge import scenario, task
+
+
+@scenario(name="First Defined", base_url="http://localhost")
+class FirstScenario:
+    @task()
+    async def work(self, client: object) -> None:
+        pass
+
+
+@scenario(name="Second Defined", base_url="http://localhost")
+class SecondScenario:
+    @task()
+    async def work(self, client: object) -> None:
+        pass
+"""
+        path = tmp_path / "two_scenarios.py"
+        path.write_text(code)
+        result = load_scenario(path)
+        assert result.name == "First Defined"
@@ -6,6 +6,7 @@ from loadforge.engine.scheduler import ScaleCommand, ScaleDirection, Scheduler
 from loadforge.patterns.composite import CompositePattern
 from loadforge.patterns.constant import ConstantPattern
 from loadforge.patterns.ramp import RampPattern
+from loadforge.patterns.step import StepPattern
 
 
 class TestScaleCommand:
@@ -38,6 +39,15 @@ class TestScaleCommand:
             msg = "ScaleCommand should be frozen"
             raise AssertionError(msg)
 
+    def test_slotted_dataclass(self) -> None:
+        cmd = ScaleCommand(
+            elapsed_seconds=0.0,
+            target_concurrency=5,
+            direction=ScaleDirection.HOLD,
+            delta=0,
+        )
+        assert not hasattr(cmd, "__dict__")
+
 
 class TestScheduler:
     """Tests for the Scheduler class."""
@@ -148,3 +158,37 @@ class TestScheduler:
             assert cmd.target_concurrency >= 0
             assert cmd.delta >= 0
             assert isinstance(cmd.direction, ScaleDirection)
+
+    def test_scale_points_keep_first_and_last_of_constant(self) -> None:
+        scheduler = Scheduler(ConstantPattern(users=10), duration_seconds=5.0)
+        points = scheduler.scale_points()
+        assert [cmd.elapsed_seconds for cmd in points] == [0.0, 5.0]
+        assert [cmd.target_concurrency for cmd in points] == [10, 10]
+
+    def test_scale_points_drop_only_hold_ticks(self) -> None:
+        pattern = CompositePattern(
+            phases=[
+                (RampPattern(start_users=0, end_users=5, ramp_duration=5.0), 5.0),
+                (ConstantPattern(users=5), 5.0),
+            ]
+        )
+        scheduler = Scheduler(pattern, duration_seconds=10.0)
+        commands = list(scheduler.iter_commands())
+        points = scheduler.scale_points()
+        assert points[0] == commands[0]
+        assert points[-1] == commands[-1]
+        assert all(cmd.direction != ScaleDirection.HOLD for cmd in points[1:-1])
+        assert [c for c in commands if c.direction != ScaleDirection.HOLD] == [
+            c for c in points if c.direction != ScaleDirection.HOLD
+        ]
+
+    def test_scale_points_match_filtered_iter_commands(self) -> None:
+        pattern = StepPattern(start_users=2, step_size=3, step_duration=2.0, steps=3)
+        scheduler = Scheduler(pattern, duration_seconds=7.5, tick_interval=0.5)
+        commands = list(scheduler.iter_commands())
+        expected = [
+            cmd
+            for i, cmd in enumerate(commands)
+            if cmd.direction != ScaleDirection.HOLD or i in (0, len(commands) - 1)
+        ]
+        assert scheduler.scale_points() == expected
@@ -0,0 +1,45 @@
+"""Tests for the columnar SnapshotColumns view."""
+
+from __future__ import annotations
+
+from loadforge.metrics.models import MetricSnapshot
+from loadforge.metrics.series import SnapshotColumns
+from loadforge.reports.charts import throughput_chart
+
+
+def _snapshot(elapsed: float, *, requests: int = 10) -> MetricSnapshot:
+    return MetricSnapshot(
+        timestamp=elapsed,
+        elapsed_seconds=elapsed,
+        active_users=int(elapsed) + 1,
+        total_requests=requests,
+        requests_per_second=float(requests),
+        latency_avg=20.0,
+        latency_p50=10.0,
+        latency_p95=30.0,
+        latency_p99=40.0,
+        total_errors=1,
+    )
+
+
+class TestSnapshotColumns:
+    """Tests for SnapshotColumns.from_snapshots."""
+
+    def test_columns_match_snapshots(self):
+        snapshots = [_snapshot(float(i), requests=i * 10) for i in range(4)]
+        columns = SnapshotColumns.from_snapshots(snapshots)
+        assert len(columns) == 4
+        assert columns.elapsed_seconds.tolist() == [0.0, 1.0, 2.0, 3.0]
+        assert columns.active_users.tolist() == [1, 2, 3, 4]
+        assert columns.total_requests.tolist() == [0, 10, 20, 30]
+        assert columns.latency_p99.tolist() == [40.0] * 4
+        assert columns.total_errors.tolist() == [1] * 4
+
+    def test_empty(self):
+        columns = SnapshotColumns.from_snapshots([])
+        assert len(columns) == 0
+
+    def test_charts_accept_columns(self):
+        snapshots = [_snapshot(float(i)) for i in range(3)]
+        fig = throughput_chart(SnapshotColumns.from_snapshots(snapshots))
+        assert list(fig.data[0].x) == [0.0, 1.0, 2.0]
@@ -0,0 +1,206 @@
+"""Tests for the shared virtual user utilities."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+
+import aiohttp
+import pytest
+
+from loadforge._internal.config import load_config
+from loadforge.engine._user_utils import (
+    cancel_newest_users,
+    create_shared_connector,
+    next_tick,
+    sleep_until,
+    track_user_task,
+    user_seed,
+    warm_up_connector,
+)
+
+
+class TestUserSeed:
+    """Tests for user_seed."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_config(self):
+        load_config.cache_clear()
+        yield
+        load_config.cache_clear()
+
+    def test_unseeded_by_default(self, monkeypatch: pytest.MonkeyPatch):
+        """Without LOADFORGE_SEED, users are seeded from OS entropy."""
+        monkeypatch.delenv("LOADFORGE_SEED", raising=False)
+        assert user_seed(0, 0) is None
+
+    def test_seed_is_reproducible_per_user(self, monkeypatch: pytest.MonkeyPatch):
+        """Each user gets a distinct, reproducible stream."""
+        monkeypatch.setenv("LOADFORGE_SEED", "7")
+        first = random.Random(user_seed(1, 2)).random()
+        assert random.Random(user_seed(1, 2)).random() == first
+        assert random.Random(user_seed(1, 3)).random() != first
+        assert random.Random(user_seed(2, 2)).random() != first
+
+
+class TestCreateSharedConnector:
+    """Tests for create_shared_connector."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_config(self):
+        load_config.cache_clear()
+        yield
+        load_config.cache_clear()
+
+    async def test_unlimited_by_default(self, monkeypatch: pytest.MonkeyPatch):
+        """Without LOADFORGE_POOL_SIZE, users never queue for a connection."""
+        monkeypatch.delenv("LOADFORGE_POOL_SIZE", raising=False)
+        connector = create_shared_connector()
+        try:
+            assert connector.limit == 0
+            assert connector.limit_per_host == 0
+        finally:
+            await connector.close()
+
+    async def test_capped_when_configured(self, monkeypatch: pytest.MonkeyPatch):
+        """An explicit LOADFORGE_POOL_SIZE caps the pool."""
+        monkeypatch.setenv("LOADFORGE_POOL_SIZE", "20,80")
+        connector = create_shared_connector()
+        try:
+            assert connector.limit == 80
+            assert connector.limit_per_host == 20
+        finally:
+            await connector.close()
+
+
+class TestWarmUpConnector:
+    """Tests for warm_up_connector."""
+
+    async def test_opens_pooled_connections(self, echo_server: str):
+        """Warm-up leaves keep-alive connections open in the pool."""
+        connector = aiohttp.TCPConnector(limit=10, limit_per_host=10)
+        try:
+            await warm_up_connector(connector, f"{echo_server}/echo/warm", 3)
+            assert not connector.closed
+            assert sum(len(conns) for conns in connector._conns.values()) == 3
+        finally:
+            await connector.close()
+
+    async def test_capped_at_per_host_limit(self, echo_server: str):
+        """Warm-up never opens more connections than the per-host limit."""
+        connector = aiohttp.TCPConnector(limit=10, limit_per_host=2)
+        try:
+            await warm_up_connector(connector, f"{echo_server}/echo/warm", 5)
+            assert sum(len(conns) for conns in connector._conns.values()) == 2
+        finally:
+            await connector.close()
+
+    async def test_failures_are_ignored(self):
+        """An unreachable target does not raise."""
+        connector = aiohttp.TCPConnector()
+        try:
+            await warm_up_connector(connector, "http://127.0.0.1:1", 2)
+        finally:
+            await connector.close()
+
+
+class TestNextTick:
+    """Tests for next_tick."""
+
+    @pytest.mark.parametrize("interval", [0.1, 0.2, 0.25, 1.0])
+    def test_one_tick_per_interval_on_millisecond_clock(self, interval: float):
+        """A clock rounded to milliseconds (uvloop) never repeats a tick."""
+        start = 1000.0
+        tick = 0
+        now = start
+        iterations = 0
+        while now - start < 3.0:
+            iterations += 1
+            tick = next_tick(tick, start, interval, now)
+            assert start + tick * interval > now
+            # Wake at the deadline as a millisecond-cached clock reports it.
+            now = round(start + tick * interval, 3)
+        assert iterations == round(3.0 / interval)
+
+    def test_skips_missed_ticks(self):
+        """Ticks that passed while the loop was busy are not run."""
+        assert next_tick(2, 0.0, 1.0, 5.5) == 6
+        assert next_tick(2, 0.0, 1.0, 6.0) == 7
+
+    def test_advances_at_least_one_tick(self):
+        assert next_tick(4, 0.0, 1.0, 0.0) == 5
+
+
+class TestTrackUserTask:
+    """Tests for track_user_task."""
+
+    async def test_finished_tasks_remove_themselves(self):
+        """A tracked task leaves the mapping once it completes."""
+        user_tasks: dict[int, asyncio.Task[None]] = {}
+        gate = asyncio.Event()
+
+        async def user() -> None:
+            await gate.wait()
+
+        for uid in range(3):
+            track_user_task(user_tasks, uid, asyncio.create_task(user()))
+        assert list(user_tasks) == [0, 1, 2]
+
+        user_tasks[1].cancel()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert list(user_tasks) == [0, 2]
+
+        gate.set()
+        await asyncio.gather(*user_tasks.values())
+        await asyncio.sleep(0)
+        assert user_tasks == {}
+
+
+class TestSleepUntil:
+    """Tests for sleep_until."""
+
+    async def test_returns_false_at_deadline(self):
+        """The wait ends at the deadline when no stop is requested."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 0.05
+        assert await sleep_until(deadline, asyncio.Event()) is False
+        assert loop.time() >= deadline
+
+    async def test_past_deadline_only_yields(self):
+        """A deadline that has already passed returns without a timer."""
+        loop = asyncio.get_running_loop()
+        stop_event = asyncio.Event()
+        assert await sleep_until(loop.time() - 1.0, stop_event) is False
+        stop_event.set()
+        assert await sleep_until(loop.time(), stop_event) is True
+
+    async def test_stop_ends_wait_early(self):
+        """Setting the stop event ends the wait before the deadline."""
+        loop = asyncio.get_running_loop()
+        stop_event = asyncio.Event()
+        loop.call_later(0.01, stop_event.set)
+        start = loop.time()
+        assert await sleep_until(start + 10.0, stop_event) is True
+        assert loop.time() - start < 1.0
+
+
+class TestCancelNewestUsers:
+    """Tests for cancel_newest_users."""
+
+    async def test_cancels_most_recent_users_together(self):
+        """The newest users are cancelled and awaited in one wait."""
+        user_tasks: dict[int, asyncio.Task[None]] = {}
+        for uid in range(5):
+            track_user_task(user_tasks, uid, asyncio.create_task(asyncio.sleep(10)))
+        removed = [user_tasks[3], user_tasks[4]]
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await cancel_newest_users(user_tasks, 2)
+
+        assert loop.time() - start < 1.0
+        assert list(user_tasks) == [0, 1, 2]
+        assert all(t.cancelled() for t in removed)
+        await cancel_newest_users(user_tasks, 10)
+        assert user_tasks == {}